@@ -1,5 +1,6 @@
 """Google OAuth credentials provider implementation."""
 
+import asyncio
 import os
 from datetime import datetime, timedelta
 from typing import Optional
@@ -61,6 +62,7 @@ class SimpleGoogleCredentials:
 
         self._access_token: Optional[str] = None
         self._token_expiry: Optional[datetime] = None
+        self._refresh_task: Optional[asyncio.Task] = None
 
     @property
     def client_id(self) -> str:
@@ -132,6 +134,9 @@ class SimpleGoogleCredentials:
     async def get_access_token(self) -> str:
         """Get a valid access token, refreshing if needed.
 
+        Concurrent callers that find the token expired share a single
+        refresh request instead of each starting their own.
+
         Returns:
             A valid access token string.
 
@@ -141,7 +146,10 @@ class SimpleGoogleCredentials:
             ImportError: If httpx is not installed.
         """
         if self._needs_refresh():
-            await self._refresh()
+            task = self._refresh_task
+            if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+                task = self._refresh_task = asyncio.ensure_future(self._refresh())
+            await asyncio.shield(task)
 
         assert self._access_token is not None
         return self._access_token
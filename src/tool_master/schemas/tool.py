@@ -16,7 +16,11 @@ class ParameterType(str, Enum):
 
 
 class ToolParameter(BaseModel):
-    """Definition of a single tool parameter."""
+    """Definition of a single tool parameter.
+
+    Parameters are immutable; use ``model_copy(update={...})`` to derive a
+    changed one. Assigning to a field raises ``ValidationError``.
+    """
 
     name: str = Field(..., description="Parameter name")
     type: ParameterType = Field(..., description="Parameter type")
@@ -26,7 +30,8 @@ class ToolParameter(BaseModel):
     enum: Optional[list[Any]] = Field(default=None, description="Allowed values (for enums)")
     items_type: Optional[ParameterType] = Field(default=None, description="Type of array items (if type is array)")
 
-    model_config = {"extra": "allow"}
+    # Frozen so one instance can be shared safely between tool definitions
+    model_config = {"extra": "allow", "frozen": True}
 
 
 class ToolResult(BaseModel):
@@ -67,6 +72,9 @@ class Tool(BaseModel):
     # The actual implementation function (not serialized)
     _handler: Optional[Callable[..., Any]] = None
 
+    # (parameters, JSON Schema built from them), cached by to_json_schema
+    _json_schema: Optional[tuple] = None
+
     model_config = {"extra": "allow"}
 
     def set_handler(self, handler: Callable[..., Any]) -> "Tool":
@@ -100,7 +108,25 @@ class Tool(BaseModel):
             return ToolResult.fail(str(e))
 
     def to_json_schema(self) -> dict[str, Any]:
-        """Convert tool parameters to JSON Schema format."""
+        """Convert tool parameters to JSON Schema format.
+
+        The schema is cached on the tool and rebuilt when the parameter list
+        changes (reassigned, appended to or replaced via model_copy). Each
+        call returns a fresh copy of every dict and list in it, so callers
+        may modify it.
+        """
+        # Read through __pydantic_private__: plain attribute access to a private
+        # attribute goes through BaseModel.__getattr__ and costs more than the copy
+        private = self.__pydantic_private__
+        params = tuple(self.parameters)
+        cached = private.get("_json_schema")
+        # Tuple comparison checks identity first, so unchanged parameters are cheap
+        if cached is None or cached[0] != params:
+            cached = private["_json_schema"] = (params, self._build_json_schema())
+        return _copy_json_schema(cached[1])
+
+    def _build_json_schema(self) -> dict[str, Any]:
+        """Build the JSON Schema for this tool's parameters."""
         properties: dict[str, Any] = {}
         required: list[str] = []
 
@@ -126,3 +152,18 @@ class Tool(BaseModel):
             "properties": properties,
             "required": required,
         }
+
+
+def _copy_json_schema(schema: dict[str, Any]) -> dict[str, Any]:
+    """Copy a schema built by Tool._build_json_schema.
+
+    Copies only the containers that method creates, which is several times
+    cheaper than copy.deepcopy (and than rebuilding the schema).
+    """
+    properties = {name: prop.copy() for name, prop in schema["properties"].items()}
+    for prop in properties.values():
+        if "enum" in prop:
+            prop["enum"] = prop["enum"].copy()
+        if "items" in prop:
+            prop["items"] = prop["items"].copy()
+    return {"type": schema["type"], "properties": properties, "required": schema["required"].copy()}
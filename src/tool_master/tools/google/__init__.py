@@ -29,6 +29,7 @@ from tool_master.tools.google.calendar_tools import (
 from tool_master.tools.google.sheets_tools import (
     create_sheets_tools,
     SHEETS_SCHEMAS,
+    SHEETS_SCHEMAS_BY_NAME,
 )
 
 __all__ = [
@@ -38,4 +39,5 @@ __all__ = [
     # Sheets
     "create_sheets_tools",
     "SHEETS_SCHEMAS",
+    "SHEETS_SCHEMAS_BY_NAME",
 ]
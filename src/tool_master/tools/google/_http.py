@@ -0,0 +1,96 @@
+"""Shared HTTP plumbing for the Google API tools.
+
+The pooled AsyncClient, JSON encoding and error-message extraction used by
+both the Sheets and Calendar implementations.
+"""
+
+import asyncio
+import importlib.util
+import json
+import weakref
+from typing import Any
+
+try:
+    import httpx
+except ImportError:
+    httpx = None  # type: ignore
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+
+def _check_httpx():
+    """Raise ImportError if httpx is not available."""
+    if httpx is None:
+        raise ImportError("httpx is required. Install with: pip install tool-master[google]")
+
+
+# =============================================================================
+# Shared HTTP Client
+# =============================================================================
+
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# One pooled client per event loop: httpx clients are bound to the loop they
+# first run on, so a single global would break across asyncio.run() calls.
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = weakref.WeakKeyDictionary()
+
+
+def get_client() -> "httpx.AsyncClient":
+    """Return the shared AsyncClient for the running event loop.
+
+    Reusing one client keeps connections to the Google APIs alive between
+    calls instead of paying a new TCP/TLS handshake per request. HTTP/2 is
+    negotiated when the optional h2 package is installed, letting concurrent
+    requests share one connection. httpx already requests gzip responses.
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        _check_httpx()
+        client = httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        )
+        _clients[loop] = client
+    return client
+
+
+async def close_client() -> None:
+    """Close the shared AsyncClient for the running event loop, if any."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+# =============================================================================
+# JSON
+# =============================================================================
+
+def json_loads(data: bytes) -> Any:
+    """Decode a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Encode a JSON request body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def api_error_message(response: "httpx.Response", default: str = "Unknown error") -> str:
+    """Extract Google's error message from a failed response.
+
+    The body is parsed once, straight from bytes; empty or non-JSON bodies
+    (e.g. an HTML 502 page) yield ``default``.
+    """
+    try:
+        return json_loads(response.content)["error"]["message"]
+    except (ValueError, LookupError, TypeError):
+        return default
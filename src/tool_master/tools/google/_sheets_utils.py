@@ -4,15 +4,30 @@ Helper functions for color parsing, range parsing, spreadsheet ID extraction,
 and common API operations used across all sheets modules.
 """
 
+import asyncio
 import logging
+import random
 import re
-from typing import Optional, Tuple, List, Any
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from functools import lru_cache, wraps
+from typing import AsyncIterator, Iterator, NamedTuple, Optional, Tuple, List, Any
 from urllib.parse import quote, urlencode
 
 try:
-    import httpx
+    import ijson
 except ImportError:
-    httpx = None  # type: ignore
+    ijson = None  # type: ignore
+
+from tool_master.tools.google._http import (  # noqa: F401  (re-exported for the sheets modules)
+    api_error_message,
+    close_client,
+    get_client,
+    json_dumps,
+    json_loads,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -21,16 +36,340 @@ SHEETS_API_BASE = "https://sheets.googleapis.com/v4/spreadsheets"
 DRIVE_API_BASE = "https://www.googleapis.com/drive/v3"
 
 
-def _check_httpx():
-    """Raise ImportError if httpx is not available."""
-    if httpx is None:
-        raise ImportError("httpx is required. Install with: pip install tool-master[google]")
+# =============================================================================
+# Rate Limiting and Retries
+# =============================================================================
+
+class TokenBucket:
+    """Async token bucket allowing ``rate`` requests per ``period`` seconds.
+
+    Bursts of up to ``rate`` requests go straight through; after that callers
+    wait for tokens to refill. Safe within an event loop without a lock
+    because tokens are checked and taken without an intervening await.
+    """
+
+    def __init__(self, rate: float, period: float = 60.0):
+        self.capacity = rate
+        self.fill_rate = rate / period
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        while True:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.fill_rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self.fill_rate)
+
+
+# Sheets' default quotas are 60 read and 60 write requests per minute per user,
+# counted separately. Requests are paced with one read and one write bucket per
+# access token, so one user's burst never holds back another user, and reads are
+# not held back by writes. Lower these to stay under a shared per-project quota.
+READ_REQUESTS_PER_MINUTE = 60
+WRITE_REQUESTS_PER_MINUTE = 60
+RATE_LIMITER_CACHE_SIZE = 1024
+# (Authorization header, is_read) -> TokenBucket, kept in least-recently-used order
+_rate_limiters: "OrderedDict[tuple, TokenBucket]" = OrderedDict()
+
+# A 429 means the request was rejected unapplied, so it is always safe to resend.
+# A server error does not mean nothing was applied, so those are only retried
+# for requests that can safely be applied twice.
+WRITE_RETRY_STATUSES = frozenset((429,))
+RETRY_STATUSES = frozenset((429, 503))
+READ_RETRY_STATUSES = RETRY_STATUSES | frozenset((500, 502, 504))
+MAX_ATTEMPTS = 5
+MAX_RETRY_AFTER = 60.0
+
+
+def _retry_after(response: "httpx.Response") -> Optional[float]:
+    """Seconds from a numeric Retry-After header, capped at MAX_RETRY_AFTER."""
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return min(max(float(value), 0.0), MAX_RETRY_AFTER)
+    except ValueError:
+        return None
+
+
+async def _backoff(attempt: int, response: "httpx.Response") -> None:
+    """Sleep before the next attempt.
+
+    Honours the server's Retry-After when present (plus a little jitter so
+    waiting callers don't retry in lockstep); otherwise uses exponential
+    backoff with full jitter.
+    """
+    retry_after = _retry_after(response)
+    if retry_after is not None:
+        delay = retry_after + random.uniform(0, 0.1)
+    else:
+        delay = random.uniform(0, 2 ** attempt)
+    logger.debug(f"Google API returned {response.status_code}, retrying in {delay:.2f}s")
+    await asyncio.sleep(delay)
+
+
+def _retry_statuses(method: str, idempotent: Optional[bool]) -> frozenset:
+    method = method.upper()
+    if method == "GET":
+        return READ_RETRY_STATUSES
+    if idempotent is None:
+        idempotent = method == "PUT"
+    return RETRY_STATUSES if idempotent else WRITE_RETRY_STATUSES
+
+
+def _rate_limiter(method: str, headers: Any) -> TokenBucket:
+    """The read or write bucket for the credentials a request is sent with."""
+    is_read = method.upper() == "GET"
+    key = ((headers or {}).get("Authorization"), is_read)
+    bucket = _rate_limiters.get(key)
+    if bucket is None:
+        bucket = _rate_limiters[key] = TokenBucket(
+            READ_REQUESTS_PER_MINUTE if is_read else WRITE_REQUESTS_PER_MINUTE
+        )
+        while len(_rate_limiters) > RATE_LIMITER_CACHE_SIZE:
+            _rate_limiters.popitem(last=False)
+    else:
+        _rate_limiters.move_to_end(key)
+    return bucket
+
+
+async def api_request(
+    method: str, url: str, *, idempotent: Optional[bool] = None, **kwargs
+) -> "httpx.Response":
+    """Send a request on the shared client with rate limiting and retries.
+
+    Requests are paced per access token, reads (GET) and writes (everything
+    else) separately, at READ_REQUESTS_PER_MINUTE and WRITE_REQUESTS_PER_MINUTE,
+    and retried up to MAX_ATTEMPTS,
+    waiting for Retry-After if given and otherwise backing off exponentially
+    with jitter. Every request is retried on 429. GETs are also retried on
+    500/502/503/504, and idempotent writes on 503; other writes are not,
+    since a write that failed with a server error may still have been applied.
+    The last response is returned whatever its status.
+
+    Args:
+        idempotent: Whether sending a write twice is harmless. Defaults to
+            True for PUT and False for POST, PATCH and DELETE.
+    """
+    client = get_client()
+    retry_statuses = _retry_statuses(method, idempotent)
+    limiter = _rate_limiter(method, kwargs.get("headers"))
+    is_write = method.upper() != "GET"
+    if is_write:
+        invalidate_reads(url)
+    try:
+        for attempt in range(MAX_ATTEMPTS):
+            await limiter.acquire()
+            response = await client.request(method, url, **kwargs)
+            if response.status_code not in retry_statuses or attempt == MAX_ATTEMPTS - 1:
+                return response
+            await _backoff(attempt, response)
+        return response
+    finally:
+        # Again once the write has landed, for reads that started while it was in flight
+        if is_write:
+            invalidate_reads(url)
+
+
+@asynccontextmanager
+async def api_stream(
+    method: str, url: str, *, idempotent: Optional[bool] = None, **kwargs
+) -> AsyncIterator["httpx.Response"]:
+    """Streaming counterpart of api_request, for use with ``async with``."""
+    client = get_client()
+    retry_statuses = _retry_statuses(method, idempotent)
+    limiter = _rate_limiter(method, kwargs.get("headers"))
+    is_write = method.upper() != "GET"
+    if is_write:
+        invalidate_reads(url)
+    try:
+        for attempt in range(MAX_ATTEMPTS):
+            await limiter.acquire()
+            async with client.stream(method, url, **kwargs) as response:
+                if response.status_code not in retry_statuses or attempt == MAX_ATTEMPTS - 1:
+                    yield response
+                    return
+            await _backoff(attempt, response)
+    finally:
+        if is_write:
+            invalidate_reads(url)
+
+
+# =============================================================================
+# Read Cache
+# =============================================================================
+
+# Results of read_cached impls, keyed by (spreadsheet_id, function, access_token,
+# args, kwargs) -> (expires_at, JSON-encoded result), kept in least-recently-used
+# order. Set READ_CACHE_TTL to 0 to disable.
+READ_CACHE_TTL = 5.0
+READ_CACHE_SIZE = 512
+_read_cache: "OrderedDict[tuple, Tuple[float, bytes]]" = OrderedDict()
+
+# spreadsheet_id -> number of writes started or finished for it; a read only
+# stores its result if no write touched the spreadsheet while it ran
+_read_generations: dict = {}
+
+# Spreadsheet (or Drive file) ID in an API URL
+_API_URL_ID_RE = re.compile(r'/(?:spreadsheets|files)/([a-zA-Z0-9_-]+)')
+
+
+def read_cached(func):
+    """Cache a read impl's successful results for READ_CACHE_TTL seconds.
+
+    The wrapped function must take (access_token, spreadsheet_id, ...).
+    Results are stored encoded, so every caller gets its own copy. Entries
+    for a spreadsheet are dropped whenever api_request or api_stream sends
+    a non-GET request for it (before sending and again once it finishes),
+    and a read that overlapped such a write is not stored, so a read after
+    a write sees the write.
+    """
+    @wraps(func)
+    async def wrapper(access_token: str, spreadsheet_id: str, *args: Any, **kwargs: Any) -> Any:
+        if READ_CACHE_TTL <= 0:
+            return await func(access_token, spreadsheet_id, *args, **kwargs)
+        clean_id = extract_spreadsheet_id(spreadsheet_id)
+        key = (clean_id, func.__qualname__, access_token, args, tuple(sorted(kwargs.items())))
+        try:
+            cached = _read_cache.get(key)
+        except TypeError:  # unhashable argument, e.g. a list
+            return await func(access_token, spreadsheet_id, *args, **kwargs)
+        if cached is not None:
+            if cached[0] > time.monotonic():
+                _read_cache.move_to_end(key)
+                return json_loads(cached[1])
+            del _read_cache[key]
+
+        generation = _read_generations.get(clean_id, 0)
+        result = await func(access_token, spreadsheet_id, *args, **kwargs)
+        if isinstance(result, dict) and "error" in result:
+            return result
+        if _read_generations.get(clean_id, 0) != generation:
+            return result
+        try:
+            encoded = json_dumps(result)
+        except TypeError:
+            return result
+        _read_cache[key] = (time.monotonic() + READ_CACHE_TTL, encoded)
+        while len(_read_cache) > READ_CACHE_SIZE:
+            _read_cache.popitem(last=False)
+        return result
+
+    return wrapper
+
+
+def invalidate_reads(url_or_id: str) -> None:
+    """Drop cached reads for the spreadsheet an API URL (or bare ID) refers to."""
+    match = _API_URL_ID_RE.search(url_or_id)
+    if match is None and "/" in url_or_id:
+        return  # e.g. creating a spreadsheet
+    spreadsheet_id = match.group(1) if match else url_or_id
+    _read_generations[spreadsheet_id] = _read_generations.get(spreadsheet_id, 0) + 1
+    for key in [key for key in _read_cache if key[0] == spreadsheet_id]:
+        del _read_cache[key]
+
+
+# =============================================================================
+# JSON
+# =============================================================================
+
+def dig(data: Any, *keys: Any, default: Any = None) -> Any:
+    """Follow a path of dict keys / list indexes into parsed JSON.
+
+    Example:
+        dig(result, "replies", 0, "addChart", "chart", "chartId")
+
+    Returns:
+        The value at the path, or ``default`` if any step is missing
+    """
+    try:
+        for key in keys:
+            data = data[key]
+    except (LookupError, TypeError):
+        return default
+    return data
+
+
+def _walk_prefix(node: Any, parts: List[str]):
+    """Yield the values under an ijson-style prefix from a parsed document."""
+    if not parts:
+        yield node
+        return
+    head, rest = parts[0], parts[1:]
+    if head == "item":
+        if isinstance(node, list):
+            for child in node:
+                yield from _walk_prefix(child, rest)
+    elif isinstance(node, dict) and head in node:
+        yield from _walk_prefix(node[head], rest)
+
+
+def streaming_json_available() -> bool:
+    """Whether ijson is installed for incremental response parsing."""
+    return ijson is not None
+
+
+async def iter_json_events(response: "httpx.Response") -> AsyncIterator[Tuple[str, str, Any]]:
+    """Yield ijson ``(prefix, event, value)`` parse events from a streamed response.
+
+    Requires ijson; check streaming_json_available() first.
+    """
+    events = ijson.sendable_list()
+    coro = ijson.parse_coro(events)
+    async for chunk in response.aiter_bytes():
+        coro.send(chunk)
+        for event in events:
+            yield event
+        del events[:]
+    coro.close()
+    for event in events:
+        yield event
+
+
+async def iter_json_items(response: "httpx.Response", prefix: str) -> AsyncIterator[Any]:
+    """Yield the JSON items under ``prefix`` from a streamed response body.
+
+    With ijson installed the body is parsed incrementally, so only one item
+    is held in memory at a time. Without it the body is read and parsed in
+    one go and the same items are yielded.
+
+    Args:
+        response: Response opened with ``client.stream(...)``
+        prefix: ijson prefix, e.g. "values.item" for the rows of a range
+    """
+    if ijson is None:
+        data = json_loads(await response.aread() or b"{}")
+        for item in _walk_prefix(data, prefix.split(".")):
+            yield item
+        return
+
+    items = ijson.sendable_list()
+    coro = ijson.items_coro(items, prefix, use_float=True)
+    async for chunk in response.aiter_bytes():
+        coro.send(chunk)
+        for item in items:
+            yield item
+        del items[:]
+    coro.close()
+    for item in items:
+        yield item
 
 
 # =============================================================================
 # Spreadsheet ID Extraction
 # =============================================================================
 
+_URL_ID_RE = re.compile(r'docs\.google\.com/spreadsheets/d/([a-zA-Z0-9_-]+)')
+_PATH_ID_RE = re.compile(r'^([a-zA-Z0-9_-]+)/(?:edit|view|copy)')
+_BARE_ID_RE = re.compile(r'^([a-zA-Z0-9_-]{25,})')
+
+
+@lru_cache(maxsize=256)
 def extract_spreadsheet_id(input_string: str) -> str:
     """Extract spreadsheet ID from various input formats.
 
@@ -51,20 +390,17 @@ def extract_spreadsheet_id(input_string: str) -> str:
     input_string = input_string.strip()
 
     # Pattern 1: Full Google Sheets URL
-    url_pattern = r'docs\.google\.com/spreadsheets/d/([a-zA-Z0-9_-]+)'
-    match = re.search(url_pattern, input_string)
+    match = _URL_ID_RE.search(input_string)
     if match:
         return match.group(1)
 
     # Pattern 2: ID followed by /edit or other path
-    path_pattern = r'^([a-zA-Z0-9_-]+)/(?:edit|view|copy)'
-    match = re.match(path_pattern, input_string)
+    match = _PATH_ID_RE.match(input_string)
     if match:
         return match.group(1)
 
     # Pattern 3: Just extract the first valid-looking ID segment
-    id_pattern = r'^([a-zA-Z0-9_-]{25,})'
-    match = re.match(id_pattern, input_string)
+    match = _BARE_ID_RE.match(input_string)
     if match:
         return match.group(1)
 
@@ -75,36 +411,56 @@ def extract_spreadsheet_id(input_string: str) -> str:
 # Color Parsing
 # =============================================================================
 
+def _rgb(red: float, green: float, blue: float, alpha: Optional[float] = None) -> dict:
+    """Build a Sheets Color dict, leaving out zero channels.
+
+    The API reads a missing channel as 0.0. Pure black keeps ``red`` so the
+    color object is never empty.
+    """
+    color = {k: v for k, v in (("red", red), ("green", green), ("blue", blue)) if v}
+    if not color:
+        color["red"] = 0.0
+    if alpha is not None:
+        color["alpha"] = alpha
+    return color
+
+
 NAMED_COLORS = {
-    "red": {"red": 1.0, "green": 0.0, "blue": 0.0},
-    "green": {"red": 0.0, "green": 0.8, "blue": 0.0},
-    "blue": {"red": 0.0, "green": 0.0, "blue": 1.0},
-    "yellow": {"red": 1.0, "green": 1.0, "blue": 0.0},
-    "orange": {"red": 1.0, "green": 0.647, "blue": 0.0},
-    "purple": {"red": 0.5, "green": 0.0, "blue": 0.5},
-    "pink": {"red": 1.0, "green": 0.753, "blue": 0.796},
-    "black": {"red": 0.0, "green": 0.0, "blue": 0.0},
-    "white": {"red": 1.0, "green": 1.0, "blue": 1.0},
-    "gray": {"red": 0.5, "green": 0.5, "blue": 0.5},
-    "lightgray": {"red": 0.827, "green": 0.827, "blue": 0.827},
-    "darkgray": {"red": 0.412, "green": 0.412, "blue": 0.412},
-    "cyan": {"red": 0.0, "green": 1.0, "blue": 1.0},
-    "magenta": {"red": 1.0, "green": 0.0, "blue": 1.0},
-    "lightblue": {"red": 0.678, "green": 0.847, "blue": 0.902},
-    "lightgreen": {"red": 0.565, "green": 0.933, "blue": 0.565},
-    "lightyellow": {"red": 1.0, "green": 1.0, "blue": 0.878},
-    "lightpurple": {"red": 0.878, "green": 0.678, "blue": 1.0},
+    name: _rgb(*channels)
+    for name, channels in {
+        "red": (1.0, 0.0, 0.0),
+        "green": (0.0, 0.8, 0.0),
+        "blue": (0.0, 0.0, 1.0),
+        "yellow": (1.0, 1.0, 0.0),
+        "orange": (1.0, 0.647, 0.0),
+        "purple": (0.5, 0.0, 0.5),
+        "pink": (1.0, 0.753, 0.796),
+        "black": (0.0, 0.0, 0.0),
+        "white": (1.0, 1.0, 1.0),
+        "gray": (0.5, 0.5, 0.5),
+        "lightgray": (0.827, 0.827, 0.827),
+        "darkgray": (0.412, 0.412, 0.412),
+        "cyan": (0.0, 1.0, 1.0),
+        "magenta": (1.0, 0.0, 1.0),
+        "lightblue": (0.678, 0.847, 0.902),
+        "lightgreen": (0.565, 0.933, 0.565),
+        "lightyellow": (1.0, 1.0, 0.878),
+        "lightpurple": (0.878, 0.678, 1.0),
+    }.items()
 }
 
 
+@lru_cache(maxsize=256)
 def parse_color(color_input: str) -> dict:
     """Parse color from hex code or name to Google Sheets RGB format (0-1 floats).
 
+    Results are cached and shared between callers; treat them as read-only.
+
     Args:
         color_input: Color as hex code (#FF0000) or named color (red)
 
     Returns:
-        Dict with 'red', 'green', 'blue' keys (0-1 floats)
+        Dict of 'red', 'green', 'blue' (0-1 floats); zero channels are omitted
     """
     color = color_input.strip().lower()
 
@@ -121,15 +477,29 @@ def parse_color(color_input: str) -> dict:
             r = int(hex_str[0:2], 16) / 255.0
             g = int(hex_str[2:4], 16) / 255.0
             b = int(hex_str[4:6], 16) / 255.0
-            result = {"red": r, "green": g, "blue": b}
-            if len(hex_str) == 8:
-                result["alpha"] = int(hex_str[6:8], 16) / 255.0
-            return result
+            alpha = int(hex_str[6:8], 16) / 255.0 if len(hex_str) == 8 else None
+            return _rgb(r, g, b, alpha)
 
     # Default to red if unrecognized
     return NAMED_COLORS["red"]
 
 
+def parse_colors(*color_inputs: str) -> List[dict]:
+    """Parse several colors at once, in order (see parse_color).
+
+    Plain color names are looked up directly without going through the
+    parser.
+
+    Args:
+        *color_inputs: Colors as hex codes or names
+
+    Returns:
+        List of RGB dicts, one per input
+    """
+    named = NAMED_COLORS
+    return [named.get(c) or parse_color(c) for c in color_inputs]
+
+
 # =============================================================================
 # Range Parsing
 # =============================================================================
@@ -153,6 +523,18 @@ def index_to_col(index: int) -> str:
     return result
 
 
+# Letters for columns A..ZZ, built once for per-cell loops
+_COLUMN_LETTERS = tuple(index_to_col(i) for i in range(702))
+
+
+def column_letter(index: int) -> str:
+    """Column letter for a 0-indexed column, using the precomputed table when possible."""
+    if index < 702:
+        return _COLUMN_LETTERS[index]
+    return index_to_col(index)
+
+
+@lru_cache(maxsize=4096)
 def parse_column_range(columns: str) -> Tuple[int, int]:
     """Convert column notation to 0-indexed range.
 
@@ -174,6 +556,7 @@ def parse_column_range(columns: str) -> Tuple[int, int]:
         return idx, idx + 1
 
 
+@lru_cache(maxsize=4096)
 def parse_row_range(rows: str) -> Tuple[int, int]:
     """Convert row notation to 0-indexed range.
 
@@ -195,14 +578,31 @@ def parse_row_range(rows: str) -> Tuple[int, int]:
         return idx, idx + 1
 
 
-def parse_a1_range(range_notation: str) -> dict:
+class A1Range(NamedTuple):
+    """Components of a parsed A1 range (0-indexed, end-exclusive).
+
+    Fields are None when the range does not specify them (e.g. no sheet
+    prefix, or a whole-column range like 'A:C').
+    """
+
+    sheet_name: Optional[str] = None
+    start_row: Optional[int] = None
+    end_row: Optional[int] = None
+    start_col: Optional[int] = None
+    end_col: Optional[int] = None
+
+
+@lru_cache(maxsize=4096)
+def parse_a1_range(range_notation: str) -> A1Range:
     """Parse A1 notation range into components.
 
+    Results are cached; A1Range is immutable, so sharing them is safe.
+
     Args:
         range_notation: Range like 'Sheet1!A1:D10' or 'A1:D10'
 
     Returns:
-        Dict with sheet_name, start_row, start_col, end_row, end_col (0-indexed)
+        A1Range with sheet_name, start_row, end_row, start_col, end_col (0-indexed)
     """
     sheet_name = None
     cell_range = range_notation
@@ -223,26 +623,68 @@ def parse_a1_range(range_notation: str) -> dict:
     start_match = re.match(r'^([A-Za-z]+)(\d+)$', start)
     end_match = re.match(r'^([A-Za-z]+)(\d+)$', end)
 
-    result = {"sheet_name": sheet_name}
+    start_row = start_col = end_row = end_col = None
 
     if start_match:
-        result["start_col"] = col_to_index(start_match.group(1))
-        result["start_row"] = int(start_match.group(2)) - 1
+        start_col = col_to_index(start_match.group(1))
+        start_row = int(start_match.group(2)) - 1
 
     if end_match:
-        result["end_col"] = col_to_index(end_match.group(1)) + 1  # Exclusive
-        result["end_row"] = int(end_match.group(2))  # Exclusive
+        end_col = col_to_index(end_match.group(1)) + 1  # Exclusive
+        end_row = int(end_match.group(2))  # Exclusive
 
-    return result
+    return A1Range(sheet_name, start_row, end_row, start_col, end_col)
 
 
 # =============================================================================
 # API Helpers
 # =============================================================================
 
+# Sheet ID lookups, keyed by (spreadsheet_id, sheet_name, access_token) ->
+# (expires_at, sheet_id), kept in least-recently-used order. The token is part
+# of the key so one user never sees what another user's credentials fetched.
+SHEET_ID_TTL = 60.0
+SHEET_NOT_FOUND_TTL = 5.0
+SHEET_ID_CACHE_SIZE = 256
+# (spreadsheet_id, sheet_name, access_token) -> (expiry, sheet ID, or None for a known-missing sheet)
+_sheet_id_cache: "OrderedDict[tuple, Tuple[float, Optional[int]]]" = OrderedDict()
+_NOT_CACHED = object()
+
+# Metadata lookups in progress, keyed by (loop, access_token, spreadsheet_id)
+_sheet_id_inflight: dict = {}
+
+# batchUpdate requests that can change which sheet a name (or "first sheet") maps to
+_SHEET_LAYOUT_REQUESTS = frozenset(("addSheet", "deleteSheet", "duplicateSheet"))
+
+
+def _changes_sheet_layout(requests: list) -> bool:
+    """Whether any request adds, removes, renames or reorders sheets."""
+    for request in requests:
+        if not _SHEET_LAYOUT_REQUESTS.isdisjoint(request):
+            return True
+        fields = request.get("updateSheetProperties", {}).get("fields", "")
+        if fields == "*" or "title" in fields or "index" in fields:
+            return True
+    return False
+
+
+def invalidate_sheet_ids(spreadsheet_id: str) -> None:
+    """Drop cached sheet IDs for a spreadsheet."""
+    for key in [key for key in _sheet_id_cache if key[0] == spreadsheet_id]:
+        del _sheet_id_cache[key]
+
+
 async def get_sheet_id(access_token: str, spreadsheet_id: str, sheet_name: Optional[str] = None) -> Optional[int]:
     """Get the sheet ID for a sheet name.
 
+    A miss fetches the IDs of every sheet in the spreadsheet and caches them
+    all for SHEET_ID_TTL seconds (up to SHEET_ID_CACHE_SIZE entries, least
+    recently used evicted first), so later operations on any of its sheets
+    skip the metadata request. A name that isn't in the spreadsheet is
+    remembered as missing for SHEET_NOT_FOUND_TTL seconds. Concurrent lookups
+    on the same spreadsheet with the same token share a single request; the
+    cache is kept per token, so users never share what their credentials see.
+
     Args:
         access_token: Valid Google OAuth access token
         spreadsheet_id: Google Sheets ID
@@ -251,38 +693,125 @@ async def get_sheet_id(access_token: str, spreadsheet_id: str, sheet_name: Optio
     Returns:
         Sheet ID (integer) or None if not found
     """
-    _check_httpx()
+    sheet_id = _cached_entry((spreadsheet_id, sheet_name, access_token))
+    if sheet_id is not _NOT_CACHED:
+        return sheet_id
 
-    headers = {"Authorization": f"Bearer {access_token}"}
-    url = f"{SHEETS_API_BASE}/{spreadsheet_id}?fields=sheets.properties"
+    sheets = await prefetch_sheet_ids(access_token, spreadsheet_id)
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.get(url, headers=headers)
+    if not sheets:
+        return None
+    if sheet_name is None:
+        return sheets[0][1]
+    for title, sheet_id in sheets:
+        if title == sheet_name:
+            return sheet_id
+    # Remember the miss briefly so retries with a stale name stay local
+    _cache_sheet_id((spreadsheet_id, sheet_name, access_token), None, SHEET_NOT_FOUND_TTL)
+    return None
 
-        if response.status_code != 200:
-            return None
 
-        data = response.json()
-        sheets = data.get("sheets", [])
+def cached_sheet_id(access_token: str, spreadsheet_id: str, sheet_name: Optional[str] = None) -> Optional[int]:
+    """Return a sheet ID from the cache without any request, or None."""
+    sheet_id = _cached_entry((spreadsheet_id, sheet_name, access_token))
+    return None if sheet_id is _NOT_CACHED else sheet_id
 
-        if not sheets:
-            return None
 
-        if sheet_name is None:
-            # Return first sheet
-            return sheets[0]["properties"]["sheetId"]
+def remember_sheet_id(access_token: str, spreadsheet_id: str, sheet_name: str, sheet_id: int) -> None:
+    """Cache a sheet ID learned from a response, e.g. a new or renamed sheet."""
+    _cache_sheet_id((spreadsheet_id, sheet_name, access_token), sheet_id)
 
-        # Find by name
-        for sheet in sheets:
-            if sheet["properties"]["title"] == sheet_name:
-                return sheet["properties"]["sheetId"]
 
-        return None
+def _cached_entry(key: tuple) -> Any:
+    """Cached sheet ID (None for a known miss), or _NOT_CACHED."""
+    cached = _sheet_id_cache.get(key)
+    if cached is None:
+        return _NOT_CACHED
+    if cached[0] <= time.monotonic():
+        del _sheet_id_cache[key]
+        return _NOT_CACHED
+    _sheet_id_cache.move_to_end(key)
+    return cached[1]
+
+
+async def prefetch_sheet_ids(access_token: str, spreadsheet_id: str) -> List[Tuple[str, int]]:
+    """Fetch and cache the IDs of every sheet in a spreadsheet.
+
+    Call this before a burst of operations on one spreadsheet so that their
+    get_sheet_id lookups are all cache hits. Concurrent calls for the same
+    spreadsheet share a single request.
+
+    Args:
+        access_token: Valid Google OAuth access token
+        spreadsheet_id: Google Sheets ID
+
+    Returns:
+        List of (title, sheet ID) in sheet order; empty if the fetch failed
+    """
+    inflight_key = (asyncio.get_running_loop(), access_token, spreadsheet_id)
+    task = _sheet_id_inflight.get(inflight_key)
+    if task is None:
+        task = asyncio.ensure_future(_load_sheet_ids(access_token, spreadsheet_id, inflight_key))
+        _sheet_id_inflight[inflight_key] = task
+    # Shielded so one cancelled caller doesn't cancel the lookup for the others
+    return await asyncio.shield(task)
+
+
+def _cache_sheet_id(key: tuple, sheet_id: Optional[int], ttl: Optional[float] = None) -> None:
+    _sheet_id_cache[key] = (time.monotonic() + (SHEET_ID_TTL if ttl is None else ttl), sheet_id)
+    _sheet_id_cache.move_to_end(key)
+    while len(_sheet_id_cache) > SHEET_ID_CACHE_SIZE:
+        _sheet_id_cache.popitem(last=False)
+
+
+async def _load_sheet_ids(
+    access_token: str,
+    spreadsheet_id: str,
+    inflight_key: tuple,
+) -> List[Tuple[str, int]]:
+    """Fetch every sheet's ID and cache them all, clearing the in-flight entry when done."""
+    try:
+        sheets = await _fetch_sheet_ids(access_token, spreadsheet_id)
+        if sheets:
+            _cache_sheet_id((spreadsheet_id, None, access_token), sheets[0][1])
+            for title, sheet_id in sheets:
+                _cache_sheet_id((spreadsheet_id, title, access_token), sheet_id)
+        return sheets
+    finally:
+        _sheet_id_inflight.pop(inflight_key, None)
+
+
+async def _fetch_sheet_ids(access_token: str, spreadsheet_id: str) -> List[Tuple[str, int]]:
+    """Look up (title, sheet ID) for every sheet, in order; empty on failure."""
+    headers = {"Authorization": f"Bearer {access_token}"}
+    url = f"{SHEETS_API_BASE}/{spreadsheet_id}?fields=sheets.properties(sheetId,title)"
+
+    response = await api_request("GET", url, headers=headers)
+
+    if response.status_code != 200:
+        return []
+
+    data = json_loads(response.content)
+    return [
+        (sheet["properties"].get("title"), sheet["properties"].get("sheetId", 0))
+        for sheet in data.get("sheets", [])
+    ]
+
+
+# SheetsBatch currently collecting requests in this context, if any
+_active_batch: ContextVar[Optional["SheetsBatch"]] = ContextVar("sheets_batch", default=None)
+
+# SheetsBatchCoalescer merging concurrent batch_update calls in this context, if any
+_active_coalescer: ContextVar[Optional["SheetsBatchCoalescer"]] = ContextVar("sheets_coalescer", default=None)
 
 
 async def batch_update(access_token: str, spreadsheet_id: str, requests: list) -> dict:
     """Execute a batchUpdate request on a spreadsheet.
 
+    Inside an active SheetsBatch for the same spreadsheet, the requests are
+    queued and sent with the rest of the batch instead. Inside an active
+    SheetsBatchCoalescer, they are merged with concurrent calls.
+
     Args:
         access_token: Valid Google OAuth access token
         spreadsheet_id: Google Sheets ID
@@ -291,8 +820,36 @@ async def batch_update(access_token: str, spreadsheet_id: str, requests: list) -
     Returns:
         Dict with response data, or error
     """
-    _check_httpx()
+    batch = _active_batch.get()
+    if batch is not None and batch.spreadsheet_id == spreadsheet_id:
+        return batch.add(requests)
+
+    coalescer = _active_coalescer.get()
+    if coalescer is not None:
+        return await coalescer.submit(access_token, spreadsheet_id, requests)
+
+    return await _send_batch_update(access_token, spreadsheet_id, requests)
+
+
+# batchUpdate requests that leave the same result when applied twice. Anything
+# else (add*, duplicate*, insert*, append*, deletes by index, cut/paste,
+# find/replace, ...) could be applied again by a retry.
+_IDEMPOTENT_UPDATE_REQUESTS = frozenset((
+    "repeatCell", "mergeCells", "unmergeCells", "autoResizeDimensions", "clearBasicFilter",
+))
 
+
+def _is_idempotent_update(requests: list) -> bool:
+    """Whether a batchUpdate can safely be resent after a server error."""
+    for request in requests:
+        for kind in request:
+            if not (kind.startswith(("update", "set")) or kind in _IDEMPOTENT_UPDATE_REQUESTS):
+                return False
+    return True
+
+
+async def _send_batch_update(access_token: str, spreadsheet_id: str, requests: list) -> dict:
+    """POST a batchUpdate request, bypassing any active batch or coalescer."""
     url = f"{SHEETS_API_BASE}/{spreadsheet_id}:batchUpdate"
     headers = {
         "Authorization": f"Bearer {access_token}",
@@ -300,20 +857,171 @@ async def batch_update(access_token: str, spreadsheet_id: str, requests: list) -
     }
     body = {"requests": requests}
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    if _changes_sheet_layout(requests):
+        invalidate_sheet_ids(spreadsheet_id)
+
+    try:
+        response = await api_request(
+            "POST", url, headers=headers, content=json_dumps(body),
+            idempotent=_is_idempotent_update(requests),
+        )
+
+        if response.status_code != 200:
+            error_msg = api_error_message(response, f"HTTP {response.status_code}")
+            return {"error": f"batchUpdate failed: {error_msg}"}
+
+        return json_loads(response.content)
+
+    except Exception as e:
+        logger.error(f"Error in batchUpdate: {e}")
+        return {"error": str(e)}
+
+
+class _PendingUpdates:
+    """batchUpdate requests waiting to be merged, with each caller's reply slice."""
+
+    def __init__(self):
+        self.requests: list = []
+        self.slices: list = []  # (future, start, count)
+        self.full = asyncio.Event()
+        self.flush_task: Optional[asyncio.Task] = None
+
+
+class SheetsBatchCoalescer:
+    """Merge concurrent batch_update calls into shared batchUpdate requests.
+
+    Inside ``async with SheetsBatchCoalescer():``, batch_update calls for the
+    same token and spreadsheet that arrive within ``window`` seconds of the
+    first are concatenated into one batchUpdate (flushed early once
+    ``max_requests`` requests are pending). Each caller still awaits its own
+    result, which carries only its slice of the replies, so return values
+    are unchanged. Savings come from concurrent callers, e.g. asyncio.gather.
+
+    Google applies a batchUpdate atomically: if one merged request is
+    invalid, every caller in that flush gets the error.
+    """
+
+    def __init__(self, window: float = 0.005, max_requests: int = 50):
+        self.window = window
+        self.max_requests = max_requests
+        self._pending: dict = {}
+        self._context_token = None
+
+    async def submit(self, access_token: str, spreadsheet_id: str, requests: list) -> dict:
+        """Queue requests for the next flush and wait for their replies."""
+        loop = asyncio.get_running_loop()
+        key = (loop, access_token, spreadsheet_id)
+
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = self._pending[key] = _PendingUpdates()
+            pending.flush_task = asyncio.create_task(self._flush(key, pending))
+            pending.flush_task.add_done_callback(lambda task: self._flush_done(task, key, pending))
+
+        future = loop.create_future()
+        pending.slices.append((future, len(pending.requests), len(requests)))
+        pending.requests.extend(requests)
+
+        if len(pending.requests) >= self.max_requests:
+            # Detach so later calls start a new batch, and flush this one now
+            del self._pending[key]
+            pending.full.set()
+
+        return await future
+
+    async def _flush(self, key: tuple, pending: _PendingUpdates) -> None:
+        try:
+            await asyncio.wait_for(pending.full.wait(), self.window)
+        except asyncio.TimeoutError:
+            pass
+        if self._pending.get(key) is pending:
+            del self._pending[key]
+
+        _, access_token, spreadsheet_id = key
+        result = await _send_batch_update(access_token, spreadsheet_id, pending.requests)
+        replies = result.get("replies", [])
+        for future, start, count in pending.slices:
+            if future.done():
+                continue
+            if "error" in result:
+                future.set_result(result)
+            else:
+                future.set_result({**result, "replies": replies[start:start + count]})
+
+    def _flush_done(self, task: asyncio.Task, key: tuple, pending: _PendingUpdates) -> None:
+        """Resolve callers a flush left waiting, e.g. because it was cancelled or raised."""
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Error in batchUpdate: {task.exception()}")
+        if self._pending.get(key) is pending:
+            del self._pending[key]
+        for future, _, _ in pending.slices:
+            if not future.done():
+                future.set_result({"error": "batchUpdate was interrupted; the update may not have been applied"})
+
+    @contextmanager
+    def activate(self) -> Iterator["SheetsBatchCoalescer"]:
+        """Route batch_update calls made inside the block through this coalescer.
+
+        Unlike ``async with``, this keeps no state on the coalescer, so one
+        long-lived instance can be activated by many tasks at the same time.
+        """
+        token = _active_coalescer.set(self)
         try:
-            response = await client.post(url, headers=headers, json=body)
+            yield self
+        finally:
+            _active_coalescer.reset(token)
+
+    async def __aenter__(self) -> "SheetsBatchCoalescer":
+        self._context_token = _active_coalescer.set(self)
+        return self
 
-            if response.status_code != 200:
-                error_data = response.json() if response.text else {}
-                error_msg = error_data.get("error", {}).get("message", f"HTTP {response.status_code}")
-                return {"error": f"batchUpdate failed: {error_msg}"}
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        _active_coalescer.reset(self._context_token)
 
-            return response.json()
 
-        except Exception as e:
-            logger.error(f"Error in batchUpdate: {e}")
-            return {"error": str(e)}
+class SheetsBatch:
+    """Collect batchUpdate requests and send them as a single call.
+
+    Within ``async with SheetsBatch(token, spreadsheet_id) as batch:``, every
+    batch_update for that spreadsheet is queued rather than sent, and the
+    whole queue is posted as one batchUpdate when the block exits. Queued
+    calls return ``{"queued": True, "replies": [...]}`` straight away, so
+    reply data such as new chart IDs is only available from ``batch.replies``
+    after the block. Nothing is sent if the block raises. If the flush
+    fails, leaving the block raises RuntimeError (the error dict stays in
+    ``batch.result``), since the queued calls have already returned.
+
+    Only batch operations that do not depend on each other's results, e.g.
+    don't add a sheet and then format it by name in the same batch.
+    """
+
+    def __init__(self, access_token: str, spreadsheet_id: str):
+        self.access_token = access_token
+        self.spreadsheet_id = extract_spreadsheet_id(spreadsheet_id)
+        self.requests: list = []
+        self.result: Optional[dict] = None
+        self._context_token = None
+
+    @property
+    def replies(self) -> list:
+        """Replies from the flushed batchUpdate, in request order."""
+        return (self.result or {}).get("replies", [])
+
+    def add(self, requests: list) -> dict:
+        """Queue update requests to be sent when the batch exits."""
+        self.requests.extend(requests)
+        return {"queued": True, "replies": [{} for _ in requests]}
+
+    async def __aenter__(self) -> "SheetsBatch":
+        self._context_token = _active_batch.set(self)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        _active_batch.reset(self._context_token)
+        if exc_type is None and self.requests:
+            self.result = await batch_update(self.access_token, self.spreadsheet_id, self.requests)
+            if "error" in self.result:
+                raise RuntimeError(f"SheetsBatch flush failed: {self.result['error']}")
 
 
 async def get_spreadsheet_metadata(access_token: str, spreadsheet_id: str) -> dict:
@@ -326,49 +1034,47 @@ async def get_spreadsheet_metadata(access_token: str, spreadsheet_id: str) -> di
     Returns:
         Dict with spreadsheet metadata, or error
     """
-    _check_httpx()
-
     headers = {"Authorization": f"Bearer {access_token}"}
-    url = f"{SHEETS_API_BASE}/{spreadsheet_id}?fields=properties,sheets.properties"
+    url = f"{SHEETS_API_BASE}/{spreadsheet_id}?fields=properties(title,locale,timeZone),sheets.properties"
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.get(url, headers=headers)
-
-            if response.status_code == 404:
-                return {"error": "Spreadsheet not found"}
-
-            if response.status_code != 200:
-                error_data = response.json()
-                error_msg = error_data.get("error", {}).get("message", "Unknown error")
-                return {"error": error_msg}
-
-            data = response.json()
-            props = data.get("properties", {})
-            sheets = data.get("sheets", [])
-
-            return {
-                "spreadsheet_id": spreadsheet_id,
-                "title": props.get("title"),
-                "locale": props.get("locale"),
-                "timezone": props.get("timeZone"),
-                "sheets": [
-                    {
-                        "title": s["properties"]["title"],
-                        "sheet_id": s["properties"]["sheetId"],
-                        "index": s["properties"].get("index", 0),
-                        "row_count": s["properties"].get("gridProperties", {}).get("rowCount"),
-                        "col_count": s["properties"].get("gridProperties", {}).get("columnCount"),
-                        "hidden": s["properties"].get("hidden", False),
-                    }
-                    for s in sheets
-                ],
-                "url": f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}",
-            }
-
-        except Exception as e:
-            logger.error(f"Error getting spreadsheet metadata: {e}")
-            return {"error": str(e)}
+    try:
+        response = await api_request("GET", url, headers=headers)
+
+        if response.status_code == 404:
+            return {"error": "Spreadsheet not found"}
+
+        if response.status_code != 200:
+            error_msg = api_error_message(response)
+            return {"error": error_msg}
+
+        data = json_loads(response.content)
+        props = data.get("properties", {})
+        sheets = data.get("sheets", [])
+        for s in sheets:
+            remember_sheet_id(access_token, spreadsheet_id, s["properties"]["title"], s["properties"]["sheetId"])
+
+        return {
+            "spreadsheet_id": spreadsheet_id,
+            "title": props.get("title"),
+            "locale": props.get("locale"),
+            "timezone": props.get("timeZone"),
+            "sheets": [
+                {
+                    "title": s["properties"]["title"],
+                    "sheet_id": s["properties"]["sheetId"],
+                    "index": s["properties"].get("index", 0),
+                    "row_count": s["properties"].get("gridProperties", {}).get("rowCount"),
+                    "col_count": s["properties"].get("gridProperties", {}).get("columnCount"),
+                    "hidden": s["properties"].get("hidden", False),
+                }
+                for s in sheets
+            ],
+            "url": f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}",
+        }
+
+    except Exception as e:
+        logger.error(f"Error getting spreadsheet metadata: {e}")
+        return {"error": str(e)}
 
 
 def build_grid_range(
@@ -400,3 +1106,27 @@ def build_grid_range(
     if end_col is not None:
         grid_range["endColumnIndex"] = end_col
     return grid_range
+
+
+async def resolve_range(
+    access_token: str,
+    spreadsheet_id: str,
+    range_notation: str,
+) -> Tuple[str, Optional[int], Optional[dict]]:
+    """Resolve an A1 range to the pieces most update requests need.
+
+    Args:
+        access_token: Valid Google OAuth access token
+        spreadsheet_id: Google Sheets ID (or URL)
+        range_notation: A1 notation range (e.g., 'Sheet1!A1:D10')
+
+    Returns:
+        Tuple of (clean spreadsheet ID, sheet ID, GridRange dict). Sheet ID
+        and GridRange are None if the sheet does not exist.
+    """
+    clean_id = extract_spreadsheet_id(spreadsheet_id)
+    sheet_name, start_row, end_row, start_col, end_col = parse_a1_range(range_notation)
+    sheet_id = await get_sheet_id(access_token, clean_id, sheet_name)
+    if sheet_id is None:
+        return clean_id, None, None
+    return clean_id, sheet_id, build_grid_range(sheet_id, start_row, end_row, start_col, end_col)
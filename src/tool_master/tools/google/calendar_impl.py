@@ -14,10 +14,14 @@ try:
 except ImportError:
     httpx = None  # type: ignore
 
+from tool_master.tools.google._http import api_error_message, get_client, json_dumps, json_loads
+
 logger = logging.getLogger(__name__)
 
 CALENDAR_API_BASE = "https://www.googleapis.com/calendar/v3"
 
+_VALID_SHARE_ROLES = frozenset(("reader", "writer"))
+
 
 def _format_event(event: dict) -> dict:
     """Format a Google Calendar event for display."""
@@ -77,39 +81,38 @@ async def create_calendar(
         "timeZone": timezone,
     }
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.post(
-            f"{CALENDAR_API_BASE}/calendars",
-            headers=headers,
-            json=body
-        )
-
-        if response.status_code not in (200, 201):
-            error_data = response.json() if response.text else {}
-            error_msg = error_data.get("error", {}).get("message", f"HTTP {response.status_code}")
-            return {"error": error_msg}
-
-        data = response.json()
-        calendar_id = data.get("id")
-
-        result = {
-            "calendar_id": calendar_id,
-            "title": data.get("summary"),
-            "description": data.get("description", ""),
-            "timezone": data.get("timeZone"),
-            "url": f"https://calendar.google.com/calendar/embed?src={quote(calendar_id)}",
-            "is_public": False,
-        }
-
-        if make_public:
-            share_result = await share_calendar(access_token, calendar_id, make_public=True)
-            if "error" not in share_result:
-                result["is_public"] = True
-                result["share_link"] = share_result.get("share_link")
-            else:
-                result["share_warning"] = f"Calendar created but not made public: {share_result.get('error')}"
-
-        return result
+    client = get_client()
+    response = await client.post(
+        f"{CALENDAR_API_BASE}/calendars",
+        headers=headers,
+        content=json_dumps(body)
+    )
+
+    if response.status_code not in (200, 201):
+        error_msg = api_error_message(response, f"HTTP {response.status_code}")
+        return {"error": error_msg}
+
+    data = json_loads(response.content)
+    calendar_id = data.get("id")
+
+    result = {
+        "calendar_id": calendar_id,
+        "title": data.get("summary"),
+        "description": data.get("description", ""),
+        "timezone": data.get("timeZone"),
+        "url": f"https://calendar.google.com/calendar/embed?src={quote(calendar_id)}",
+        "is_public": False,
+    }
+
+    if make_public:
+        share_result = await share_calendar(access_token, calendar_id, make_public=True)
+        if "error" not in share_result:
+            result["is_public"] = True
+            result["share_link"] = share_result.get("share_link")
+        else:
+            result["share_warning"] = f"Calendar created but not made public: {share_result.get('error')}"
+
+    return result
 
 
 async def list_calendars(access_token: str) -> dict:
@@ -127,29 +130,28 @@ async def list_calendars(access_token: str) -> dict:
     headers = {"Authorization": f"Bearer {access_token}"}
     url = f"{CALENDAR_API_BASE}/users/me/calendarList"
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.get(url, headers=headers)
+    client = get_client()
+    response = await client.get(url, headers=headers)
 
-        if response.status_code != 200:
-            error_data = response.json() if response.text else {}
-            error_msg = error_data.get("error", {}).get("message", f"HTTP {response.status_code}")
-            return {"error": error_msg}
+    if response.status_code != 200:
+        error_msg = api_error_message(response, f"HTTP {response.status_code}")
+        return {"error": error_msg}
 
-        data = response.json()
-        items = data.get("items", [])
+    data = json_loads(response.content)
+    items = data.get("items", [])
 
-        calendars = []
-        for item in items:
-            calendars.append({
-                "calendar_id": item.get("id"),
-                "title": item.get("summary"),
-                "description": item.get("description", ""),
-                "timezone": item.get("timeZone"),
-                "access_role": item.get("accessRole"),
-                "primary": item.get("primary", False),
-            })
+    calendars = []
+    for item in items:
+        calendars.append({
+            "calendar_id": item.get("id"),
+            "title": item.get("summary"),
+            "description": item.get("description", ""),
+            "timezone": item.get("timeZone"),
+            "access_role": item.get("accessRole"),
+            "primary": item.get("primary", False),
+        })
 
-        return {"calendars": calendars, "count": len(calendars)}
+    return {"calendars": calendars, "count": len(calendars)}
 
 
 async def list_events(
@@ -194,25 +196,24 @@ async def list_events(
 
     url = f"{CALENDAR_API_BASE}/calendars/{quote(calendar_id, safe='')}/events?{urlencode(params)}"
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.get(url, headers=headers)
+    client = get_client()
+    response = await client.get(url, headers=headers)
 
-        if response.status_code == 404:
-            return {"error": "Calendar not found"}
+    if response.status_code == 404:
+        return {"error": "Calendar not found"}
 
-        if response.status_code != 200:
-            error_data = response.json() if response.text else {}
-            error_msg = error_data.get("error", {}).get("message", f"HTTP {response.status_code}")
-            return {"error": error_msg}
+    if response.status_code != 200:
+        error_msg = api_error_message(response, f"HTTP {response.status_code}")
+        return {"error": error_msg}
 
-        data = response.json()
-        events = data.get("items", [])
+    data = json_loads(response.content)
+    events = data.get("items", [])
 
-        return {
-            "events": [_format_event(e) for e in events],
-            "count": len(events),
-            "calendar_id": calendar_id,
-        }
+    return {
+        "events": [_format_event(e) for e in events],
+        "count": len(events),
+        "calendar_id": calendar_id,
+    }
 
 
 async def get_event(
@@ -236,18 +237,17 @@ async def get_event(
     headers = {"Authorization": f"Bearer {access_token}"}
     url = f"{CALENDAR_API_BASE}/calendars/{quote(calendar_id, safe='')}/events/{event_id}"
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.get(url, headers=headers)
+    client = get_client()
+    response = await client.get(url, headers=headers)
 
-        if response.status_code == 404:
-            return {"error": "Event not found"}
+    if response.status_code == 404:
+        return {"error": "Event not found"}
 
-        if response.status_code != 200:
-            error_data = response.json() if response.text else {}
-            error_msg = error_data.get("error", {}).get("message", f"HTTP {response.status_code}")
-            return {"error": error_msg}
+    if response.status_code != 200:
+        error_msg = api_error_message(response, f"HTTP {response.status_code}")
+        return {"error": error_msg}
 
-        return {"event": _format_event(response.json())}
+    return {"event": _format_event(json_loads(response.content))}
 
 
 async def create_event(
@@ -314,19 +314,18 @@ async def create_event(
     if attendees and send_notifications:
         url += "?sendUpdates=all"
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.post(url, headers=headers, json=body)
+    client = get_client()
+    response = await client.post(url, headers=headers, content=json_dumps(body))
 
-        if response.status_code not in (200, 201):
-            error_data = response.json() if response.text else {}
-            error_msg = error_data.get("error", {}).get("message", f"HTTP {response.status_code}")
-            return {"error": error_msg}
+    if response.status_code not in (200, 201):
+        error_msg = api_error_message(response, f"HTTP {response.status_code}")
+        return {"error": error_msg}
 
-        result = {"event": _format_event(response.json())}
-        if attendees:
-            result["invitations_sent"] = send_notifications
-            result["attendees"] = attendees
-        return result
+    result = {"event": _format_event(json_loads(response.content))}
+    if attendees:
+        result["invitations_sent"] = send_notifications
+        result["attendees"] = attendees
+    return result
 
 
 async def update_event(
@@ -356,45 +355,43 @@ async def update_event(
 
     url = f"{CALENDAR_API_BASE}/calendars/{quote(calendar_id, safe='')}/events/{event_id}"
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        # Get existing event
-        get_response = await client.get(url, headers={"Authorization": f"Bearer {access_token}"})
-        if get_response.status_code != 200:
-            if get_response.status_code == 404:
-                return {"error": "Event not found"}
-            error_data = get_response.json() if get_response.text else {}
-            return {"error": error_data.get("error", {}).get("message", "Failed to get event")}
-
-        event = get_response.json()
-
-        # Apply updates
-        if "title" in updates:
-            event["summary"] = updates["title"]
-        if "description" in updates:
-            event["description"] = updates["description"]
-        if "location" in updates:
-            event["location"] = updates["location"]
-        if "start_time" in updates:
-            timezone = updates.get("timezone", "UTC")
-            if updates.get("all_day"):
-                event["start"] = {"date": updates["start_time"]}
-            else:
-                event["start"] = {"dateTime": updates["start_time"], "timeZone": timezone}
-        if "end_time" in updates:
-            timezone = updates.get("timezone", "UTC")
-            if updates.get("all_day"):
-                event["end"] = {"date": updates["end_time"]}
-            else:
-                event["end"] = {"dateTime": updates["end_time"], "timeZone": timezone}
-
-        response = await client.put(url, headers=headers, json=event)
-
-        if response.status_code != 200:
-            error_data = response.json() if response.text else {}
-            error_msg = error_data.get("error", {}).get("message", f"HTTP {response.status_code}")
-            return {"error": error_msg}
-
-        return {"event": _format_event(response.json())}
+    client = get_client()
+    # Get existing event
+    get_response = await client.get(url, headers={"Authorization": f"Bearer {access_token}"})
+    if get_response.status_code != 200:
+        if get_response.status_code == 404:
+            return {"error": "Event not found"}
+        return {"error": api_error_message(get_response, "Failed to get event")}
+
+    event = json_loads(get_response.content)
+
+    # Apply updates
+    if "title" in updates:
+        event["summary"] = updates["title"]
+    if "description" in updates:
+        event["description"] = updates["description"]
+    if "location" in updates:
+        event["location"] = updates["location"]
+    if "start_time" in updates:
+        timezone = updates.get("timezone", "UTC")
+        if updates.get("all_day"):
+            event["start"] = {"date": updates["start_time"]}
+        else:
+            event["start"] = {"dateTime": updates["start_time"], "timeZone": timezone}
+    if "end_time" in updates:
+        timezone = updates.get("timezone", "UTC")
+        if updates.get("all_day"):
+            event["end"] = {"date": updates["end_time"]}
+        else:
+            event["end"] = {"dateTime": updates["end_time"], "timeZone": timezone}
+
+    response = await client.put(url, headers=headers, content=json_dumps(event))
+
+    if response.status_code != 200:
+        error_msg = api_error_message(response, f"HTTP {response.status_code}")
+        return {"error": error_msg}
+
+    return {"event": _format_event(json_loads(response.content))}
 
 
 async def delete_event(
@@ -418,18 +415,17 @@ async def delete_event(
     headers = {"Authorization": f"Bearer {access_token}"}
     url = f"{CALENDAR_API_BASE}/calendars/{quote(calendar_id, safe='')}/events/{event_id}"
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.delete(url, headers=headers)
+    client = get_client()
+    response = await client.delete(url, headers=headers)
 
-        if response.status_code == 404:
-            return {"error": "Event not found"}
+    if response.status_code == 404:
+        return {"error": "Event not found"}
 
-        if response.status_code not in (200, 204):
-            error_data = response.json() if response.text else {}
-            error_msg = error_data.get("error", {}).get("message", f"HTTP {response.status_code}")
-            return {"error": error_msg}
+    if response.status_code not in (200, 204):
+        error_msg = api_error_message(response, f"HTTP {response.status_code}")
+        return {"error": error_msg}
 
-        return {"success": True, "message": "Event deleted"}
+    return {"success": True, "message": "Event deleted"}
 
 
 async def quick_add_event(
@@ -453,15 +449,14 @@ async def quick_add_event(
     headers = {"Authorization": f"Bearer {access_token}"}
     url = f"{CALENDAR_API_BASE}/calendars/{quote(calendar_id, safe='')}/events/quickAdd?text={quote(text)}"
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.post(url, headers=headers)
+    client = get_client()
+    response = await client.post(url, headers=headers)
 
-        if response.status_code not in (200, 201):
-            error_data = response.json() if response.text else {}
-            error_msg = error_data.get("error", {}).get("message", f"HTTP {response.status_code}")
-            return {"error": error_msg}
+    if response.status_code not in (200, 201):
+        error_msg = api_error_message(response, f"HTTP {response.status_code}")
+        return {"error": error_msg}
 
-        return {"event": _format_event(response.json())}
+    return {"event": _format_event(json_loads(response.content))}
 
 
 async def share_calendar(
@@ -491,6 +486,9 @@ async def share_calendar(
         "Content-Type": "application/json",
     }
 
+    if role not in _VALID_SHARE_ROLES:
+        return {"error": f"Invalid role: {role}. Use 'reader' or 'writer'"}
+
     if make_public:
         body = {"role": "reader", "scope": {"type": "default"}}
     elif email:
@@ -500,23 +498,22 @@ async def share_calendar(
 
     url = f"{CALENDAR_API_BASE}/calendars/{quote(calendar_id, safe='')}/acl"
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.post(url, headers=headers, json=body)
+    client = get_client()
+    response = await client.post(url, headers=headers, content=json_dumps(body))
 
-        if response.status_code not in (200, 201):
-            error_data = response.json() if response.text else {}
-            error_msg = error_data.get("error", {}).get("message", f"HTTP {response.status_code}")
-            return {"error": error_msg}
+    if response.status_code not in (200, 201):
+        error_msg = api_error_message(response, f"HTTP {response.status_code}")
+        return {"error": error_msg}
 
-        data = response.json()
+    data = json_loads(response.content)
 
-        share_link = None
-        if make_public:
-            share_link = f"https://calendar.google.com/calendar/embed?src={quote(calendar_id)}"
+    share_link = None
+    if make_public:
+        share_link = f"https://calendar.google.com/calendar/embed?src={quote(calendar_id)}"
 
-        return {
-            "success": True,
-            "role": data.get("role"),
-            "scope": data.get("scope"),
-            "share_link": share_link,
-        }
+    return {
+        "success": True,
+        "role": data.get("role"),
+        "scope": data.get("scope"),
+        "share_link": share_link,
+    }
@@ -1,5 +1,6 @@
 """Advanced operations: groups, slicers, tables, find/replace, copy/paste, metadata."""
 
+import asyncio
 import logging
 from typing import Optional, List
 
@@ -7,16 +8,27 @@ from tool_master.tools.google._sheets_utils import (
     extract_spreadsheet_id,
     get_sheet_id,
     batch_update,
+    dig,
     parse_a1_range,
     parse_column_range,
     build_grid_range,
     parse_color,
     SHEETS_API_BASE,
-    _check_httpx,
+    api_request,
+    json_loads,
+    read_cached,
 )
+from tool_master.tools.google.sheets_core import write_to_sheet
 
 logger = logging.getLogger(__name__)
 
+_PASTE_TYPE_MAP = {
+    "all": "PASTE_NORMAL",
+    "values": "PASTE_VALUES",
+    "format": "PASTE_FORMAT",
+}
+_VALID_PASTE_TYPES = frozenset(_PASTE_TYPE_MAP)
+
 
 # =============================================================================
 # Row/Column Groups
@@ -182,6 +194,61 @@ async def delete_column_group(
 # Find/Replace & Copy/Paste
 # =============================================================================
 
+def _find_replace_request(
+    find: str,
+    replacement: str,
+    grid_range: Optional[dict],
+    match_case: bool,
+    match_entire_cell: bool,
+) -> dict:
+    """Build one findReplace request; searches all sheets when grid_range is None."""
+    request = {
+        "find": find,
+        "replacement": replacement,
+        "matchCase": match_case,
+        "matchEntireCell": match_entire_cell,
+        "allSheets": grid_range is None,
+    }
+    if grid_range is not None:
+        request["range"] = grid_range
+    return {"findReplace": request}
+
+
+def _find_replace_counts(reply: dict) -> dict:
+    """Summarize a findReplace reply."""
+    fr_result = reply.get("findReplace", {})
+    return {
+        "occurrences_changed": fr_result.get("occurrencesChanged", 0),
+        "rows_changed": fr_result.get("rowsChanged", 0),
+        "sheets_changed": fr_result.get("sheetsChanged", 0),
+    }
+
+
+async def _find_replace_range(
+    access_token: str,
+    clean_id: str,
+    range_notation: Optional[str],
+) -> Optional[dict]:
+    """GridRange for a find/replace limited to range_notation.
+
+    Returns:
+        None to search all sheets, or {"error": ...} if the sheet is missing
+    """
+    if not range_notation:
+        return None
+    parsed = parse_a1_range(range_notation)
+    sheet_id = await get_sheet_id(access_token, clean_id, parsed.sheet_name)
+    if sheet_id is None:
+        return {"error": "Sheet not found"}
+    return build_grid_range(
+        sheet_id,
+        parsed.start_row,
+        parsed.end_row,
+        parsed.start_col,
+        parsed.end_col,
+    )
+
+
 async def find_replace(
     access_token: str,
     spreadsheet_id: str,
@@ -207,40 +274,87 @@ async def find_replace(
     """
     clean_id = extract_spreadsheet_id(spreadsheet_id)
 
-    request = {
-        "find": find,
-        "replacement": replacement,
-        "matchCase": match_case,
-        "matchEntireCell": match_entire_cell,
-        "allSheets": range_notation is None,
-    }
+    grid_range = await _find_replace_range(access_token, clean_id, range_notation)
+    if grid_range is not None and "error" in grid_range:
+        return grid_range
 
-    if range_notation:
-        parsed = parse_a1_range(range_notation)
-        sheet_id = await get_sheet_id(access_token, clean_id, parsed.get("sheet_name"))
-        if sheet_id is None:
-            return {"error": "Sheet not found"}
+    requests = [_find_replace_request(find, replacement, grid_range, match_case, match_entire_cell)]
 
-        request["range"] = build_grid_range(
-            sheet_id,
-            parsed.get("start_row"),
-            parsed.get("end_row"),
-            parsed.get("start_col"),
-            parsed.get("end_col"),
-        )
+    result = await batch_update(access_token, clean_id, requests)
+    if "error" in result:
+        return result
+
+    if result.get("queued"):
+        # Inside a SheetsBatch the counts are only known after the flush
+        return {"queued": True, "message": f"Queued find/replace of '{find}'"}
+
+    return {"success": True, **_find_replace_counts(dig(result, "replies", 0, default={}))}
+
+
+async def find_replace_many(
+    access_token: str,
+    spreadsheet_id: str,
+    replacements: List[dict],
+    range_notation: Optional[str] = None,
+    match_case: bool = False,
+    match_entire_cell: bool = False,
+) -> dict:
+    """Apply several find/replace pairs with one batchUpdate.
+
+    Pairs are applied in order, so a later pair sees the result of the
+    earlier ones.
 
-    requests = [{"findReplace": request}]
+    Args:
+        access_token: Valid Google OAuth access token
+        spreadsheet_id: Google Sheets ID
+        replacements: List of {"find": ..., "replacement": ...}; an entry
+            may override match_case / match_entire_cell
+        range_notation: Limit search to range (optional)
+        match_case: Case-sensitive search (default for all pairs)
+        match_entire_cell: Only match entire cell content (default for all pairs)
+
+    Returns:
+        Dict with per-pair and total replacement counts, or error
+    """
+    if not isinstance(replacements, list) or not replacements:
+        return {"error": "replacements must be a non-empty list"}
+    for pair in replacements:
+        if not isinstance(pair, dict) or not isinstance(pair.get("find"), str) or "replacement" not in pair:
+            return {"error": f"Each replacement needs 'find' and 'replacement': {pair}"}
+
+    clean_id = extract_spreadsheet_id(spreadsheet_id)
+
+    grid_range = await _find_replace_range(access_token, clean_id, range_notation)
+    if grid_range is not None and "error" in grid_range:
+        return grid_range
+
+    requests = [
+        _find_replace_request(
+            pair["find"],
+            str(pair["replacement"]),
+            grid_range,
+            pair.get("match_case", match_case),
+            pair.get("match_entire_cell", match_entire_cell),
+        )
+        for pair in replacements
+    ]
 
     result = await batch_update(access_token, clean_id, requests)
     if "error" in result:
         return result
 
-    fr_result = result.get("replies", [{}])[0].get("findReplace", {})
+    if result.get("queued"):
+        return {"queued": True, "message": f"Queued {len(requests)} find/replace operations"}
+
+    replies = result.get("replies", [])
+    results = [
+        {"find": pair["find"], **_find_replace_counts(replies[i] if i < len(replies) else {})}
+        for i, pair in enumerate(replacements)
+    ]
     return {
         "success": True,
-        "occurrences_changed": fr_result.get("occurrencesChanged", 0),
-        "rows_changed": fr_result.get("rowsChanged", 0),
-        "sheets_changed": fr_result.get("sheetsChanged", 0),
+        "results": results,
+        "occurrences_changed": sum(r["occurrences_changed"] for r in results),
     }
 
 
@@ -263,39 +377,27 @@ async def copy_paste(
     Returns:
         Dict with success status, or error
     """
+    if paste_type not in _VALID_PASTE_TYPES:
+        return {"error": f"Invalid paste_type: {paste_type}. Use one of: all, values, format"}
+
     clean_id = extract_spreadsheet_id(spreadsheet_id)
     src = parse_a1_range(source_range)
     dst = parse_a1_range(destination_range)
 
-    src_sheet_id = await get_sheet_id(access_token, clean_id, src.get("sheet_name"))
-    dst_sheet_id = await get_sheet_id(access_token, clean_id, dst.get("sheet_name"))
+    # Source and destination lookups are independent; resolve them concurrently
+    src_sheet_id, dst_sheet_id = await asyncio.gather(
+        get_sheet_id(access_token, clean_id, src.sheet_name),
+        get_sheet_id(access_token, clean_id, dst.sheet_name),
+    )
 
     if src_sheet_id is None or dst_sheet_id is None:
         return {"error": "Sheet not found"}
 
-    paste_type_map = {
-        "all": "PASTE_NORMAL",
-        "values": "PASTE_VALUES",
-        "format": "PASTE_FORMAT",
-    }
-
     requests = [{
         "copyPaste": {
-            "source": build_grid_range(
-                src_sheet_id,
-                src.get("start_row"),
-                src.get("end_row"),
-                src.get("start_col"),
-                src.get("end_col"),
-            ),
-            "destination": build_grid_range(
-                dst_sheet_id,
-                dst.get("start_row"),
-                dst.get("end_row"),
-                dst.get("start_col"),
-                dst.get("end_col"),
-            ),
-            "pasteType": paste_type_map.get(paste_type, "PASTE_NORMAL"),
+            "source": build_grid_range(src_sheet_id, *src[1:]),
+            "destination": build_grid_range(dst_sheet_id, *dst[1:]),
+            "pasteType": _PASTE_TYPE_MAP[paste_type],
         }
     }]
 
@@ -325,27 +427,23 @@ async def cut_paste(
     """
     clean_id = extract_spreadsheet_id(spreadsheet_id)
     src = parse_a1_range(source_range)
-    dst = parse_a1_range(destination)
+    dst_sheet_name, dst_row, _, dst_col, _ = parse_a1_range(destination)
 
-    src_sheet_id = await get_sheet_id(access_token, clean_id, src.get("sheet_name"))
-    dst_sheet_id = await get_sheet_id(access_token, clean_id, dst.get("sheet_name"))
+    src_sheet_id, dst_sheet_id = await asyncio.gather(
+        get_sheet_id(access_token, clean_id, src.sheet_name),
+        get_sheet_id(access_token, clean_id, dst_sheet_name),
+    )
 
     if src_sheet_id is None or dst_sheet_id is None:
         return {"error": "Sheet not found"}
 
     requests = [{
         "cutPaste": {
-            "source": build_grid_range(
-                src_sheet_id,
-                src.get("start_row"),
-                src.get("end_row"),
-                src.get("start_col"),
-                src.get("end_col"),
-            ),
+            "source": build_grid_range(src_sheet_id, *src[1:]),
             "destination": {
                 "sheetId": dst_sheet_id,
-                "rowIndex": dst.get("start_row", 0),
-                "columnIndex": dst.get("start_col", 0),
+                "rowIndex": dst_row or 0,
+                "columnIndex": dst_col or 0,
             },
             "pasteType": "PASTE_NORMAL",
         }
@@ -441,8 +539,6 @@ async def add_hyperlink(
     display_text: Optional[str] = None,
 ) -> dict:
     """Add a hyperlink to a cell."""
-    from urllib.parse import quote
-
     clean_id = extract_spreadsheet_id(spreadsheet_id)
 
     # Use HYPERLINK formula
@@ -450,10 +546,9 @@ async def add_hyperlink(
     formula = f'=HYPERLINK("{url}","{text}")'
 
     parsed = parse_a1_range(cell)
-    sheet_name = parsed.get("sheet_name")
+    sheet_name = parsed.sheet_name
     range_notation = f"'{sheet_name}'!{cell}" if sheet_name and "!" not in cell else cell
 
-    from tool_master.tools.google.sheets_core import write_to_sheet
     return await write_to_sheet(access_token, spreadsheet_id, range_notation, [[formula]])
 
 
@@ -461,42 +556,39 @@ async def add_hyperlink(
 # Slicers
 # =============================================================================
 
+@read_cached
 async def list_slicers(
     access_token: str,
     spreadsheet_id: str,
     sheet_name: Optional[str] = None,
 ) -> dict:
     """List all slicers in a spreadsheet."""
-    import httpx
-    _check_httpx()
-
     clean_id = extract_spreadsheet_id(spreadsheet_id)
     headers = {"Authorization": f"Bearer {access_token}"}
-    url = f"{SHEETS_API_BASE}/{clean_id}?fields=sheets(properties,slicers)"
+    url = f"{SHEETS_API_BASE}/{clean_id}?fields=sheets(properties.title,slicers(slicerId,spec(title,columnIndex)))"
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.get(url, headers=headers)
-        if response.status_code != 200:
-            return {"error": "Failed to get slicers"}
+    response = await api_request("GET", url, headers=headers)
+    if response.status_code != 200:
+        return {"error": "Failed to get slicers"}
 
-        data = response.json()
-        slicers = []
+    data = json_loads(response.content)
+    slicers = []
 
-        for sheet in data.get("sheets", []):
-            sname = sheet.get("properties", {}).get("title")
-            if sheet_name and sname != sheet_name:
-                continue
+    for sheet in data.get("sheets", []):
+        sname = sheet.get("properties", {}).get("title")
+        if sheet_name and sname != sheet_name:
+            continue
 
-            for slicer in sheet.get("slicers", []):
-                spec = slicer.get("spec", {})
-                slicers.append({
-                    "slicer_id": slicer.get("slicerId"),
-                    "title": spec.get("title", "(No title)"),
-                    "sheet": sname,
-                    "column_index": spec.get("columnIndex"),
-                })
+        for slicer in sheet.get("slicers", []):
+            spec = slicer.get("spec", {})
+            slicers.append({
+                "slicer_id": slicer.get("slicerId"),
+                "title": spec.get("title", "(No title)"),
+                "sheet": sname,
+                "column_index": spec.get("columnIndex"),
+            })
 
-        return {"slicers": slicers, "count": len(slicers)}
+    return {"slicers": slicers, "count": len(slicers)}
 
 
 async def create_slicer(
@@ -520,10 +612,10 @@ async def create_slicer(
     slicer_spec = {
         "dataRange": build_grid_range(
             sheet_id,
-            parsed.get("start_row"),
-            parsed.get("end_row"),
-            parsed.get("start_col"),
-            parsed.get("end_col"),
+            parsed.start_row,
+            parsed.end_row,
+            parsed.start_col,
+            parsed.end_col,
         ),
         "columnIndex": column_index,
     }
@@ -551,7 +643,11 @@ async def create_slicer(
     if "error" in result:
         return result
 
-    slicer_id = result.get("replies", [{}])[0].get("addSlicer", {}).get("slicer", {}).get("slicerId")
+    if result.get("queued"):
+        # Inside a SheetsBatch the new slicer's ID is only known after the flush
+        return {"queued": True, "message": "Queued slicer"}
+
+    slicer_id = dig(result, "replies", 0, "addSlicer", "slicer", "slicerId")
     return {"success": True, "slicer_id": slicer_id, "message": "Created slicer"}
 
 
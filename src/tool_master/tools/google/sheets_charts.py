@@ -4,16 +4,41 @@ import logging
 from typing import Optional, List
 
 from tool_master.tools.google._sheets_utils import (
+    SHEETS_API_BASE,
+    api_request,
+    api_stream,
     extract_spreadsheet_id,
     get_sheet_id,
-    get_spreadsheet_metadata,
     batch_update,
+    dig,
     parse_a1_range,
     build_grid_range,
+    column_letter,
+    iter_json_events,
+    json_loads,
+    read_cached,
+    streaming_json_available,
 )
 
 logger = logging.getLogger(__name__)
 
+_CHART_TYPE_MAP = {
+    "bar": "BAR",
+    "line": "LINE",
+    "column": "COLUMN",
+    "pie": "PIE",
+    "area": "AREA",
+    "scatter": "SCATTER",
+}
+
+_LEGEND_MAP = {
+    "bottom": "BOTTOM_LEGEND",
+    "top": "TOP_LEGEND",
+    "left": "LEFT_LEGEND",
+    "right": "RIGHT_LEGEND",
+    "none": "NO_LEGEND",
+}
+
 
 # =============================================================================
 # Charts
@@ -45,41 +70,25 @@ async def create_chart(
     clean_id = extract_spreadsheet_id(spreadsheet_id)
     parsed = parse_a1_range(data_range)
     anchor_parsed = parse_a1_range(anchor_cell)
-    sheet_id = await get_sheet_id(access_token, clean_id, parsed.get("sheet_name"))
+    sheet_id = await get_sheet_id(access_token, clean_id, parsed.sheet_name)
 
     if sheet_id is None:
         return {"error": "Sheet not found"}
 
-    type_map = {
-        "bar": "BAR",
-        "line": "LINE",
-        "column": "COLUMN",
-        "pie": "PIE",
-        "area": "AREA",
-        "scatter": "SCATTER",
-    }
-    api_type = type_map.get(chart_type.lower(), "COLUMN")
-
-    legend_map = {
-        "bottom": "BOTTOM_LEGEND",
-        "top": "TOP_LEGEND",
-        "left": "LEFT_LEGEND",
-        "right": "RIGHT_LEGEND",
-        "none": "NO_LEGEND",
-    }
+    api_type = _CHART_TYPE_MAP.get(chart_type.lower(), "COLUMN")
 
     grid_range = build_grid_range(
         sheet_id,
-        parsed.get("start_row"),
-        parsed.get("end_row"),
-        parsed.get("start_col"),
-        parsed.get("end_col"),
+        parsed.start_row,
+        parsed.end_row,
+        parsed.start_col,
+        parsed.end_col,
     )
 
     chart_spec = {
         "basicChart": {
             "chartType": api_type,
-            "legendPosition": legend_map.get(legend_position, "BOTTOM_LEGEND"),
+            "legendPosition": _LEGEND_MAP.get(legend_position, "BOTTOM_LEGEND"),
             "domains": [{"domain": {"sourceRange": {"sources": [grid_range]}}}],
             "series": [{"series": {"sourceRange": {"sources": [grid_range]}}}],
         }
@@ -88,8 +97,8 @@ async def create_chart(
     if title:
         chart_spec["title"] = title
 
-    anchor_row = anchor_parsed.get("start_row", 0)
-    anchor_col = anchor_parsed.get("start_col", 5)
+    anchor_row = anchor_parsed.start_row or 0
+    anchor_col = anchor_parsed.start_col if anchor_parsed.start_col is not None else 5
 
     requests = [{
         "addChart": {
@@ -112,10 +121,15 @@ async def create_chart(
     if "error" in result:
         return result
 
-    chart_id = result.get("replies", [{}])[0].get("addChart", {}).get("chart", {}).get("chartId")
+    if result.get("queued"):
+        # Inside a SheetsBatch the new chart's ID is only known after the flush
+        return {"queued": True, "message": f"Queued {chart_type} chart"}
+
+    chart_id = dig(result, "replies", 0, "addChart", "chart", "chartId")
     return {"success": True, "chart_id": chart_id, "message": f"Created {chart_type} chart"}
 
 
+@read_cached
 async def list_charts(access_token: str, spreadsheet_id: str) -> dict:
     """List all charts in a spreadsheet.
 
@@ -126,36 +140,27 @@ async def list_charts(access_token: str, spreadsheet_id: str) -> dict:
     Returns:
         Dict with charts list, or error
     """
-    meta = await get_spreadsheet_metadata(access_token, spreadsheet_id)
-    if "error" in meta:
-        return meta
-
-    # Need to get full chart info
-    from tool_master.tools.google._sheets_utils import SHEETS_API_BASE, _check_httpx
-    import httpx
-
-    _check_httpx()
-
     clean_id = extract_spreadsheet_id(spreadsheet_id)
     headers = {"Authorization": f"Bearer {access_token}"}
-    url = f"{SHEETS_API_BASE}/{clean_id}?fields=sheets.charts"
-
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.get(url, headers=headers)
-        if response.status_code != 200:
-            return {"error": "Failed to get charts"}
-
-        data = response.json()
-        charts = []
-        for sheet in data.get("sheets", []):
-            for chart in sheet.get("charts", []):
-                charts.append({
-                    "chart_id": chart.get("chartId"),
-                    "title": chart.get("spec", {}).get("title", "(No title)"),
-                    "type": chart.get("spec", {}).get("basicChart", {}).get("chartType", "Unknown"),
-                })
+    url = f"{SHEETS_API_BASE}/{clean_id}?fields=sheets.charts(chartId,spec(title,basicChart.chartType))"
+
+    response = await api_request("GET", url, headers=headers)
+    if response.status_code == 404:
+        return {"error": "Spreadsheet not found"}
+    if response.status_code != 200:
+        return {"error": "Failed to get charts"}
+
+    data = json_loads(response.content)
+    charts = []
+    for sheet in data.get("sheets", []):
+        for chart in sheet.get("charts", []):
+            charts.append({
+                "chart_id": chart.get("chartId"),
+                "title": chart.get("spec", {}).get("title", "(No title)"),
+                "type": chart.get("spec", {}).get("basicChart", {}).get("chartType", "Unknown"),
+            })
 
-        return {"charts": charts, "count": len(charts)}
+    return {"charts": charts, "count": len(charts)}
 
 
 async def delete_chart(access_token: str, spreadsheet_id: str, chart_id: int) -> dict:
@@ -211,17 +216,17 @@ async def create_pivot_table(
     clean_id = extract_spreadsheet_id(spreadsheet_id)
     parsed = parse_a1_range(source_range)
     anchor_parsed = parse_a1_range(anchor_cell)
-    sheet_id = await get_sheet_id(access_token, clean_id, parsed.get("sheet_name"))
+    sheet_id = await get_sheet_id(access_token, clean_id, parsed.sheet_name)
 
     if sheet_id is None:
         return {"error": "Sheet not found"}
 
     grid_range = build_grid_range(
         sheet_id,
-        parsed.get("start_row"),
-        parsed.get("end_row"),
-        parsed.get("start_col"),
-        parsed.get("end_col"),
+        parsed.start_row,
+        parsed.end_row,
+        parsed.start_col,
+        parsed.end_col,
     )
 
     # Build row groups
@@ -252,8 +257,8 @@ async def create_pivot_table(
                 "showTotals": show_totals,
             })
 
-    anchor_row = anchor_parsed.get("start_row", 0)
-    anchor_col = anchor_parsed.get("start_col", 5)
+    anchor_row = anchor_parsed.start_row or 0
+    anchor_col = anchor_parsed.start_col if anchor_parsed.start_col is not None else 5
 
     requests = [{
         "updateCells": {
@@ -283,6 +288,100 @@ async def create_pivot_table(
     return {"success": True, "message": f"Created pivot table at {anchor_cell}"}
 
 
+def _pivot_summary(sheet_name: str, row_idx: int, col_idx: int, counts: dict) -> dict:
+    return {
+        "sheet": sheet_name,
+        "anchor_cell": f"{column_letter(col_idx)}{row_idx + 1}",
+        "row": row_idx + 1,
+        "column": col_idx + 1,
+        **counts,
+    }
+
+
+def _pivot_tables_from_data(data: dict) -> list:
+    """Collect pivot table summaries from a fully parsed spreadsheet response."""
+    pivots = []
+    for sheet in data.get("sheets", []):
+        sheet_name = sheet.get("properties", {}).get("title")
+        for grid_data in sheet.get("data", []):
+            start_row = grid_data.get("startRow", 0)
+            start_col = grid_data.get("startColumn", 0)
+            for row_idx, row in enumerate(grid_data.get("rowData", []), start_row):
+                for col_idx, cell in enumerate(row.get("values", []), start_col):
+                    if "pivotTable" in cell:
+                        pt = cell["pivotTable"]
+                        pivots.append(_pivot_summary(sheet_name, row_idx, col_idx, {
+                            "row_groups": len(pt.get("rows", [])),
+                            "column_groups": len(pt.get("columns", [])),
+                            "values": len(pt.get("values", [])),
+                        }))
+    return pivots
+
+
+_GRID_PREFIX = "sheets.item.data.item"
+_ROW_PREFIX = f"{_GRID_PREFIX}.rowData.item"
+_CELL_PREFIX = f"{_ROW_PREFIX}.values.item"
+_PIVOT_GROUP_PREFIXES = {
+    f"{_CELL_PREFIX}.pivotTable.rows.item": "row_groups",
+    f"{_CELL_PREFIX}.pivotTable.columns.item": "column_groups",
+    f"{_CELL_PREFIX}.pivotTable.values.item": "values",
+}
+
+
+async def _stream_pivot_tables(response) -> list:
+    """Collect pivot table summaries from parse events, without building cell dicts.
+
+    Only row/column counters and the group counts of each pivot are kept.
+    Titles and grid offsets are applied when their sheet/grid closes, so the
+    result does not depend on the order fields appear in the response.
+    """
+    pivots = []
+    sheet_name = None
+    sheet_pivots = []
+    grid_pivots = []
+    start_row = start_col = 0
+    row_idx = col_idx = -1
+
+    async for prefix, event, value in iter_json_events(response):
+        if prefix == _CELL_PREFIX:
+            if event == "start_map":
+                col_idx += 1
+            elif event == "map_key" and value == "pivotTable":
+                counts = {"row_groups": 0, "column_groups": 0, "values": 0}
+                grid_pivots.append((row_idx, col_idx, counts))
+        elif prefix == _ROW_PREFIX:
+            if event == "start_map":
+                row_idx += 1
+                col_idx = -1
+        elif prefix in _PIVOT_GROUP_PREFIXES:
+            if event == "start_map":
+                counts[_PIVOT_GROUP_PREFIXES[prefix]] += 1
+        elif prefix == _GRID_PREFIX:
+            if event == "start_map":
+                grid_pivots = []
+                start_row = start_col = 0
+                row_idx = -1
+            elif event == "end_map":
+                sheet_pivots.extend(
+                    (r + start_row, c + start_col, counts) for r, c, counts in grid_pivots
+                )
+        elif prefix == f"{_GRID_PREFIX}.startRow":
+            start_row = value
+        elif prefix == f"{_GRID_PREFIX}.startColumn":
+            start_col = value
+        elif prefix == "sheets.item.properties.title":
+            sheet_name = value
+        elif prefix == "sheets.item":
+            if event == "start_map":
+                sheet_name = None
+                sheet_pivots = []
+            elif event == "end_map":
+                pivots.extend(_pivot_summary(sheet_name, r, c, counts) for r, c, counts in sheet_pivots)
+
+    return pivots
+
+
+@read_cached
 async def list_pivot_tables(access_token: str, spreadsheet_id: str) -> dict:
     """List all pivot tables in a spreadsheet.
 
@@ -293,39 +392,26 @@ async def list_pivot_tables(access_token: str, spreadsheet_id: str) -> dict:
     Returns:
         Dict with pivot tables list, or error
     """
-    from tool_master.tools.google._sheets_utils import SHEETS_API_BASE, _check_httpx
-    import httpx
-
-    _check_httpx()
-
     clean_id = extract_spreadsheet_id(spreadsheet_id)
     headers = {"Authorization": f"Bearer {access_token}"}
-    url = f"{SHEETS_API_BASE}/{clean_id}?fields=sheets(properties,data.rowData.values.pivotTable)"
+    # Only the sheet title, grid offsets and one scalar per pivot group are
+    # needed; everything else in the cells is masked out server-side.
+    fields = (
+        "sheets(properties.title,data(startRow,startColumn,rowData.values.pivotTable("
+        "rows.sourceColumnOffset,columns.sourceColumnOffset,values.summarizeFunction)))"
+    )
+    url = f"{SHEETS_API_BASE}/{clean_id}?fields={fields}"
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.get(url, headers=headers)
+    async with api_stream("GET", url, headers=headers) as response:
         if response.status_code != 200:
             return {"error": "Failed to get pivot tables"}
 
-        data = response.json()
-        pivots = []
-
-        for sheet in data.get("sheets", []):
-            sheet_name = sheet.get("properties", {}).get("title")
-            for grid_data in sheet.get("data", []):
-                for row_idx, row in enumerate(grid_data.get("rowData", [])):
-                    for col_idx, cell in enumerate(row.get("values", [])):
-                        if "pivotTable" in cell:
-                            pt = cell["pivotTable"]
-                            pivots.append({
-                                "sheet": sheet_name,
-                                "anchor_cell": f"{chr(65 + col_idx)}{row_idx + 1}",
-                                "row_groups": len(pt.get("rows", [])),
-                                "column_groups": len(pt.get("columns", [])),
-                                "values": len(pt.get("values", [])),
-                            })
+        if streaming_json_available():
+            pivots = await _stream_pivot_tables(response)
+        else:
+            pivots = _pivot_tables_from_data(json_loads(await response.aread()))
 
-        return {"pivot_tables": pivots, "count": len(pivots)}
+    return {"pivot_tables": pivots, "count": len(pivots)}
 
 
 async def delete_pivot_table(
@@ -345,17 +431,17 @@ async def delete_pivot_table(
     """
     clean_id = extract_spreadsheet_id(spreadsheet_id)
     parsed = parse_a1_range(anchor_cell)
-    sheet_id = await get_sheet_id(access_token, clean_id, parsed.get("sheet_name"))
+    sheet_id = await get_sheet_id(access_token, clean_id, parsed.sheet_name)
 
     if sheet_id is None:
         return {"error": "Sheet not found"}
 
     grid_range = build_grid_range(
         sheet_id,
-        parsed.get("start_row"),
-        parsed.get("start_row") + 1 if parsed.get("start_row") is not None else None,
-        parsed.get("start_col"),
-        parsed.get("start_col") + 1 if parsed.get("start_col") is not None else None,
+        parsed.start_row,
+        parsed.start_row + 1 if parsed.start_row is not None else None,
+        parsed.start_col,
+        parsed.start_col + 1 if parsed.start_col is not None else None,
     )
 
     requests = [{
@@ -1,23 +1,43 @@
 """Core Google Sheets operations: create, read, write, search, list."""
 
+import asyncio
 import logging
-from typing import Optional, List
+from typing import AsyncIterator, Optional, List
 from urllib.parse import quote, urlencode
 
-try:
-    import httpx
-except ImportError:
-    httpx = None  # type: ignore
-
 from tool_master.tools.google._sheets_utils import (
     SHEETS_API_BASE,
     DRIVE_API_BASE,
     extract_spreadsheet_id,
-    _check_httpx,
+    column_letter,
+    api_error_message,
+    api_request,
+    api_stream,
+    iter_json_items,
+    json_dumps,
+    json_loads,
+    read_cached,
 )
 
 logger = logging.getLogger(__name__)
 
+_VALUE_RENDER_OPTIONS = frozenset(("FORMATTED_VALUE", "UNFORMATTED_VALUE", "FORMULA"))
+_MAJOR_DIMENSIONS = frozenset(("ROWS", "COLUMNS"))
+
+# Constant request bodies, encoded once at import.
+_SHARE_WITH_ANYONE_BODY = json_dumps({"role": "writer", "type": "anyone"})
+_EMPTY_BODY = json_dumps({})
+
+# Rows appended to a sheet while another append to it is in flight are
+# collected for this window and then share one request
+APPEND_WINDOW = 0.025
+APPEND_MAX_BATCH = 500
+
+# (loop, access_token, spreadsheet_id, sheet_name) -> _AppendBuffer collecting rows
+_append_buffers: dict = {}
+# Same keys -> number of appends currently being sent
+_appends_in_flight: dict = {}
+
 
 async def create_spreadsheet(
     access_token: str,
@@ -34,8 +54,6 @@ async def create_spreadsheet(
     Returns:
         Dict with spreadsheet_id, url, sheets, or error
     """
-    _check_httpx()
-
     headers = {
         "Authorization": f"Bearer {access_token}",
         "Content-Type": "application/json",
@@ -50,38 +68,37 @@ async def create_spreadsheet(
 
     body = {"properties": {"title": title}, "sheets": sheets}
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.post(SHEETS_API_BASE, headers=headers, json=body)
+    try:
+        response = await api_request("POST", SHEETS_API_BASE, headers=headers, content=json_dumps(body))
 
-            if response.status_code != 200:
-                error_data = response.json() if response.text else {}
-                error_msg = error_data.get("error", {}).get("message", "Unknown error")
-                return {"error": error_msg}
+        if response.status_code != 200:
+            error_msg = api_error_message(response)
+            return {"error": error_msg}
 
-            data = response.json()
-            spreadsheet_id = data.get("spreadsheetId")
-
-            # Make publicly accessible with link
-            try:
-                await client.post(
-                    f"https://www.googleapis.com/drive/v3/files/{spreadsheet_id}/permissions",
-                    headers=headers,
-                    json={"role": "writer", "type": "anyone"},
-                )
-            except Exception as e:
-                logger.warning(f"Failed to share spreadsheet: {e}")
-
-            return {
-                "spreadsheet_id": spreadsheet_id,
-                "title": title,
-                "url": f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}",
-                "sheets": [s["properties"]["title"] for s in data.get("sheets", [])],
-            }
+        data = json_loads(response.content)
+        spreadsheet_id = data.get("spreadsheetId")
 
+        # Make publicly accessible with link
+        try:
+            await api_request(
+                "POST",
+                f"{DRIVE_API_BASE}/files/{spreadsheet_id}/permissions",
+                headers=headers,
+                content=_SHARE_WITH_ANYONE_BODY,
+            )
         except Exception as e:
-            logger.error(f"Error creating spreadsheet: {e}")
-            return {"error": str(e)}
+            logger.warning(f"Failed to share spreadsheet: {e}")
+
+        return {
+            "spreadsheet_id": spreadsheet_id,
+            "title": title,
+            "url": f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}",
+            "sheets": [s["properties"]["title"] for s in data.get("sheets", [])],
+        }
+
+    except Exception as e:
+        logger.error(f"Error creating spreadsheet: {e}")
+        return {"error": str(e)}
 
 
 async def list_spreadsheets(
@@ -99,8 +116,6 @@ async def list_spreadsheets(
     Returns:
         Dict with spreadsheets list, or error
     """
-    _check_httpx()
-
     headers = {"Authorization": f"Bearer {access_token}"}
 
     q_parts = ["mimeType='application/vnd.google-apps.spreadsheet'"]
@@ -116,41 +131,41 @@ async def list_spreadsheets(
 
     url = f"{DRIVE_API_BASE}/files?{urlencode(params)}"
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.get(url, headers=headers)
+    try:
+        response = await api_request("GET", url, headers=headers)
 
-            if response.status_code != 200:
-                error_data = response.json() if response.text else {}
-                error_msg = error_data.get("error", {}).get("message", "Unknown error")
-                return {"error": error_msg}
+        if response.status_code != 200:
+            error_msg = api_error_message(response)
+            return {"error": error_msg}
 
-            data = response.json()
-            files = data.get("files", [])
-
-            return {
-                "spreadsheets": [
-                    {
-                        "spreadsheet_id": f["id"],
-                        "title": f["name"],
-                        "created_at": f.get("createdTime"),
-                        "modified_at": f.get("modifiedTime"),
-                        "url": f.get("webViewLink", f"https://docs.google.com/spreadsheets/d/{f['id']}"),
-                    }
-                    for f in files
-                ],
-                "count": len(files),
-            }
+        data = json_loads(response.content)
+        files = data.get("files", [])
 
-        except Exception as e:
-            logger.error(f"Error listing spreadsheets: {e}")
-            return {"error": str(e)}
+        return {
+            "spreadsheets": [
+                {
+                    "spreadsheet_id": f["id"],
+                    "title": f["name"],
+                    "created_at": f.get("createdTime"),
+                    "modified_at": f.get("modifiedTime"),
+                    "url": f.get("webViewLink", f"https://docs.google.com/spreadsheets/d/{f['id']}"),
+                }
+                for f in files
+            ],
+            "count": len(files),
+        }
 
+    except Exception as e:
+        logger.error(f"Error listing spreadsheets: {e}")
+        return {"error": str(e)}
 
+
+@read_cached
 async def read_sheet(
     access_token: str,
     spreadsheet_id: str,
     range_notation: str,
+    value_render_option: str = "FORMATTED_VALUE",
 ) -> dict:
     """Read values from a spreadsheet range.
 
@@ -158,42 +173,145 @@ async def read_sheet(
         access_token: Valid Google OAuth access token
         spreadsheet_id: Google Sheets ID (or URL)
         range_notation: A1 notation (e.g., "Sheet1!A1:D10")
+        value_render_option: FORMATTED_VALUE (display strings, default),
+            UNFORMATTED_VALUE (raw numbers/booleans, dates as serial numbers)
+            or FORMULA
 
     Returns:
         Dict with values (2D array), or error
     """
-    _check_httpx()
+    if value_render_option not in _VALUE_RENDER_OPTIONS:
+        return {"error": f"Invalid value_render_option: {value_render_option}. Use one of: {', '.join(sorted(_VALUE_RENDER_OPTIONS))}"}
 
     clean_id = extract_spreadsheet_id(spreadsheet_id)
     headers = {"Authorization": f"Bearer {access_token}"}
     encoded_range = quote(range_notation, safe='')
     url = f"{SHEETS_API_BASE}/{clean_id}/values/{encoded_range}"
+    if value_render_option != "FORMATTED_VALUE":
+        url += f"?valueRenderOption={value_render_option}"
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.get(url, headers=headers)
+    try:
+        response = await api_request("GET", url, headers=headers)
 
-            if response.status_code == 404:
-                return {"error": "Spreadsheet or range not found"}
+        if response.status_code == 404:
+            return {"error": "Spreadsheet or range not found"}
 
-            if response.status_code != 200:
-                error_data = response.json() if response.text else {}
-                error_msg = error_data.get("error", {}).get("message", "Unknown error")
-                return {"error": error_msg}
+        if response.status_code != 200:
+            error_msg = api_error_message(response)
+            return {"error": error_msg}
+
+        data = json_loads(response.content)
+        values = data.get("values", [])
+
+        return {
+            "range": data.get("range"),
+            "values": values,
+            "row_count": len(values),
+            "col_count": max(len(row) for row in values) if values else 0,
+        }
+
+    except Exception as e:
+        logger.error(f"Error reading range: {e}")
+        return {"error": str(e)}
 
-            data = response.json()
-            values = data.get("values", [])
 
-            return {
-                "range": data.get("range"),
+async def batch_read(
+    access_token: str,
+    spreadsheet_id: str,
+    ranges: List[str],
+    major_dimension: str = "ROWS",
+    value_render_option: str = "FORMATTED_VALUE",
+) -> dict:
+    """Read several ranges with a single values:batchGet request.
+
+    Args:
+        access_token: Valid Google OAuth access token
+        spreadsheet_id: Google Sheets ID (or URL)
+        ranges: List of ranges in A1 notation
+        major_dimension: ROWS (default) or COLUMNS
+        value_render_option: FORMATTED_VALUE, UNFORMATTED_VALUE or FORMULA
+
+    Returns:
+        Dict with one {range, values, row_count, col_count} entry per range,
+        in request order, or error
+    """
+    if not ranges or not all(isinstance(r, str) for r in ranges):
+        return {"error": "ranges must be a non-empty list of A1 ranges"}
+    if major_dimension not in _MAJOR_DIMENSIONS:
+        return {"error": f"Invalid major_dimension: {major_dimension}. Use ROWS or COLUMNS"}
+    if value_render_option not in _VALUE_RENDER_OPTIONS:
+        return {"error": f"Invalid value_render_option: {value_render_option}. Use one of: {', '.join(sorted(_VALUE_RENDER_OPTIONS))}"}
+
+    clean_id = extract_spreadsheet_id(spreadsheet_id)
+    headers = {"Authorization": f"Bearer {access_token}"}
+    params = [("ranges", r) for r in ranges]
+    if major_dimension != "ROWS":
+        params.append(("majorDimension", major_dimension))
+    if value_render_option != "FORMATTED_VALUE":
+        params.append(("valueRenderOption", value_render_option))
+    url = f"{SHEETS_API_BASE}/{clean_id}/values:batchGet?{urlencode(params)}"
+
+    try:
+        response = await api_request("GET", url, headers=headers)
+
+        if response.status_code == 404:
+            return {"error": "Spreadsheet or range not found"}
+
+        if response.status_code != 200:
+            error_msg = api_error_message(response)
+            return {"error": error_msg}
+
+        results = []
+        for value_range in json_loads(response.content).get("valueRanges", []):
+            values = value_range.get("values", [])
+            results.append({
+                "range": value_range.get("range"),
                 "values": values,
                 "row_count": len(values),
                 "col_count": max(len(row) for row in values) if values else 0,
-            }
+            })
+
+        return {"ranges": results, "range_count": len(results)}
+
+    except Exception as e:
+        logger.error(f"Error reading ranges: {e}")
+        return {"error": str(e)}
 
-        except Exception as e:
-            logger.error(f"Error reading range: {e}")
-            return {"error": str(e)}
+
+async def iter_sheet_rows(
+    access_token: str,
+    spreadsheet_id: str,
+    range_notation: str,
+) -> AsyncIterator[list]:
+    """Yield the rows of a spreadsheet range as they are parsed.
+
+    Streaming variant of read_sheet for very large ranges: the response body
+    is never materialized as a whole when ijson is installed.
+
+    Args:
+        access_token: Valid Google OAuth access token
+        spreadsheet_id: Google Sheets ID (or URL)
+        range_notation: A1 notation (e.g., "Sheet1!A1:D10")
+
+    Yields:
+        Each row of the range as a list of cell values
+
+    Raises:
+        RuntimeError: If the API returns an error response
+    """
+    clean_id = extract_spreadsheet_id(spreadsheet_id)
+    headers = {"Authorization": f"Bearer {access_token}"}
+    encoded_range = quote(range_notation, safe='')
+    url = f"{SHEETS_API_BASE}/{clean_id}/values/{encoded_range}"
+
+    async with api_stream("GET", url, headers=headers) as response:
+        if response.status_code != 200:
+            await response.aread()
+            error_msg = api_error_message(response, f"HTTP {response.status_code}")
+            raise RuntimeError(f"Error reading range: {error_msg}")
+
+        async for row in iter_json_items(response, "values.item"):
+            yield row
 
 
 async def write_to_sheet(
@@ -213,8 +331,6 @@ async def write_to_sheet(
     Returns:
         Dict with updated range info, or error
     """
-    _check_httpx()
-
     clean_id = extract_spreadsheet_id(spreadsheet_id)
     headers = {
         "Authorization": f"Bearer {access_token}",
@@ -225,26 +341,113 @@ async def write_to_sheet(
     url = f"{SHEETS_API_BASE}/{clean_id}/values/{encoded_range}?valueInputOption=USER_ENTERED"
     body = {"values": values}
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.put(url, headers=headers, json=body)
+    try:
+        response = await api_request("PUT", url, headers=headers, content=json_dumps(body))
+
+        if response.status_code != 200:
+            error_msg = api_error_message(response)
+            return {"error": error_msg}
+
+        data = json_loads(response.content)
+        return {
+            "updated_range": data.get("updatedRange"),
+            "updated_rows": data.get("updatedRows"),
+            "updated_columns": data.get("updatedColumns"),
+            "updated_cells": data.get("updatedCells"),
+        }
+
+    except Exception as e:
+        logger.error(f"Error writing range: {e}")
+        return {"error": str(e)}
+
+
+class _AppendBuffer:
+    """Rows waiting to be appended to one sheet, each with a future for its result."""
+
+    def __init__(self, access_token: str, clean_id: str, sheet_name: Optional[str]):
+        self.access_token = access_token
+        self.clean_id = clean_id
+        self.sheet_name = sheet_name
+        self.rows: list = []
+        self.futures: list = []
+        self.full = asyncio.Event()
+        self.flush_task: Optional[asyncio.Task] = None
+
+
+async def _flush_appends(key: tuple, buffer: _AppendBuffer) -> None:
+    """Wait for the window (or a full buffer), then append all rows in one call."""
+    try:
+        await asyncio.wait_for(buffer.full.wait(), APPEND_WINDOW)
+    except asyncio.TimeoutError:
+        pass
+    if _append_buffers.get(key) is buffer:
+        del _append_buffers[key]
+
+    result = await _sending_append(
+        key, _append_rows(buffer.access_token, buffer.clean_id, buffer.rows, buffer.sheet_name)
+    )
+    for row_index, future in enumerate(buffer.futures):
+        if not future.done():
+            future.set_result(result if "error" in result else {**result, "row_index": row_index})
+
+
+def _flush_appends_done(task: asyncio.Task, key: tuple, buffer: _AppendBuffer) -> None:
+    """Resolve rows a flush left waiting, e.g. because it was cancelled or raised."""
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(f"Error appending rows: {task.exception()}")
+    if _append_buffers.get(key) is buffer:
+        del _append_buffers[key]
+    for future in buffer.futures:
+        if not future.done():
+            future.set_result({"error": "Append was interrupted; the row may not have been added"})
+
+
+async def _sending_append(key: tuple, append) -> dict:
+    """Await an _append_rows call, counting it as in flight for its sheet."""
+    _appends_in_flight[key] = _appends_in_flight.get(key, 0) + 1
+    try:
+        return await append
+    finally:
+        _appends_in_flight[key] -= 1
+        if not _appends_in_flight[key]:
+            del _appends_in_flight[key]
+
+
+async def _append_rows(
+    access_token: str,
+    clean_id: str,
+    rows: List[List],
+    sheet_name: Optional[str],
+) -> dict:
+    """Append rows to a sheet with a single values:append request."""
+    headers = {
+        "Authorization": f"Bearer {access_token}",
+        "Content-Type": "application/json",
+    }
 
-            if response.status_code != 200:
-                error_data = response.json() if response.text else {}
-                error_msg = error_data.get("error", {}).get("message", "Unknown error")
-                return {"error": error_msg}
+    range_notation = f"'{sheet_name}'!A:Z" if sheet_name else "A:Z"
+    encoded_range = quote(range_notation, safe='')
+    url = f"{SHEETS_API_BASE}/{clean_id}/values/{encoded_range}:append?valueInputOption=USER_ENTERED&insertDataOption=INSERT_ROWS"
+    body = {"values": rows}
 
-            data = response.json()
-            return {
-                "updated_range": data.get("updatedRange"),
-                "updated_rows": data.get("updatedRows"),
-                "updated_columns": data.get("updatedColumns"),
-                "updated_cells": data.get("updatedCells"),
-            }
+    try:
+        response = await api_request("POST", url, headers=headers, content=json_dumps(body))
 
-        except Exception as e:
-            logger.error(f"Error writing range: {e}")
-            return {"error": str(e)}
+        if response.status_code != 200:
+            error_msg = api_error_message(response)
+            return {"error": error_msg}
+
+        data = json_loads(response.content)
+        updates = data.get("updates", {})
+        return {
+            "updated_range": updates.get("updatedRange"),
+            "updated_rows": updates.get("updatedRows"),
+            "updated_cells": updates.get("updatedCells"),
+        }
+
+    except Exception as e:
+        logger.error(f"Error appending row: {e}")
+        return {"error": str(e)}
 
 
 async def add_row_to_sheet(
@@ -255,6 +458,13 @@ async def add_row_to_sheet(
 ) -> dict:
     """Append a single row to a spreadsheet.
 
+    A row is sent straight away unless another append to the same sheet is
+    in flight. In that case it waits up to APPEND_WINDOW seconds and is sent
+    with the other rows that arrive meanwhile as one values:append request
+    (up to APPEND_MAX_BATCH rows). Each of those callers gets the API's
+    result for the shared request plus row_index, the position of its row
+    within updated_range.
+
     Args:
         access_token: Valid Google OAuth access token
         spreadsheet_id: Google Sheets ID (or URL)
@@ -264,39 +474,29 @@ async def add_row_to_sheet(
     Returns:
         Dict with appended range info, or error
     """
-    _check_httpx()
-
     clean_id = extract_spreadsheet_id(spreadsheet_id)
-    headers = {
-        "Authorization": f"Bearer {access_token}",
-        "Content-Type": "application/json",
-    }
+    loop = asyncio.get_running_loop()
+    key = (loop, access_token, clean_id, sheet_name)
 
-    range_notation = f"'{sheet_name}'!A:Z" if sheet_name else "A:Z"
-    encoded_range = quote(range_notation, safe='')
-    url = f"{SHEETS_API_BASE}/{clean_id}/values/{encoded_range}:append?valueInputOption=USER_ENTERED&insertDataOption=INSERT_ROWS"
-    body = {"values": [values]}
+    buffer = _append_buffers.get(key)
+    if buffer is None and key not in _appends_in_flight:
+        return await _sending_append(key, _append_rows(access_token, clean_id, [values], sheet_name))
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.post(url, headers=headers, json=body)
+    if buffer is None:
+        buffer = _append_buffers[key] = _AppendBuffer(access_token, clean_id, sheet_name)
+        buffer.flush_task = asyncio.create_task(_flush_appends(key, buffer))
+        buffer.flush_task.add_done_callback(lambda task: _flush_appends_done(task, key, buffer))
 
-            if response.status_code != 200:
-                error_data = response.json() if response.text else {}
-                error_msg = error_data.get("error", {}).get("message", "Unknown error")
-                return {"error": error_msg}
+    future = loop.create_future()
+    buffer.rows.append(values)
+    buffer.futures.append(future)
 
-            data = response.json()
-            updates = data.get("updates", {})
-            return {
-                "updated_range": updates.get("updatedRange"),
-                "updated_rows": updates.get("updatedRows"),
-                "updated_cells": updates.get("updatedCells"),
-            }
+    if len(buffer.rows) >= APPEND_MAX_BATCH:
+        # Detach so later rows start a new batch, and flush this one now
+        del _append_buffers[key]
+        buffer.full.set()
 
-        except Exception as e:
-            logger.error(f"Error appending row: {e}")
-            return {"error": str(e)}
+    return await future
 
 
 async def search_sheets(
@@ -304,69 +504,90 @@ async def search_sheets(
     spreadsheet_id: str,
     search_text: str,
     sheet_name: Optional[str] = None,
+    chunk_rows: int = 5000,
 ) -> dict:
     """Search for text in a spreadsheet.
 
+    Sheets are read in windows of ``chunk_rows`` rows so that only one window
+    per sheet is held in memory at a time, regardless of sheet size.
+
     Args:
         access_token: Valid Google OAuth access token
         spreadsheet_id: Google Sheets ID (or URL)
         search_text: Text to search for
         sheet_name: Limit search to specific sheet
+        chunk_rows: Number of rows fetched per request window
 
     Returns:
         Dict with matching cells, or error
     """
-    _check_httpx()
+    if chunk_rows < 1:
+        return {"error": "chunk_rows must be at least 1"}
 
     clean_id = extract_spreadsheet_id(spreadsheet_id)
     headers = {"Authorization": f"Bearer {access_token}"}
 
-    # Get all sheets or specific sheet
-    if sheet_name:
-        range_notation = f"'{sheet_name}'"
-    else:
-        # First get sheet names
-        meta_url = f"{SHEETS_API_BASE}/{clean_id}?fields=sheets.properties.title"
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            meta_response = await client.get(meta_url, headers=headers)
-            if meta_response.status_code != 200:
-                return {"error": "Could not get spreadsheet metadata"}
-            meta = meta_response.json()
-            sheets = [s["properties"]["title"] for s in meta.get("sheets", [])]
-            if not sheets:
-                return {"matches": [], "count": 0}
+    # Get sheet names and their row counts to bound the windows
+    meta_url = f"{SHEETS_API_BASE}/{clean_id}?fields=sheets.properties(title,gridProperties.rowCount)"
+    meta_response = await api_request("GET", meta_url, headers=headers)
+    if meta_response.status_code != 200:
+        return {"error": "Could not get spreadsheet metadata"}
+    meta = json_loads(meta_response.content)
+    row_counts = {
+        s["properties"]["title"]: s["properties"].get("gridProperties", {}).get("rowCount", 0)
+        for s in meta.get("sheets", [])
+    }
 
+    if sheet_name:
+        if sheet_name not in row_counts:
+            return {"error": f"Sheet '{sheet_name}' not found"}
+        row_counts = {sheet_name: row_counts[sheet_name]}
+    if not row_counts:
+        return {"matches": [], "count": 0}
+
+    # Matching stays client-side: findReplace only reports occurrence counts,
+    # and a case-insensitive "replace with itself" would rewrite cell casing.
     matches = []
     search_lower = search_text.lower()
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        sheets_to_search = [sheet_name] if sheet_name else sheets
-
-        for sname in sheets_to_search:
-            encoded_range = quote(f"'{sname}'", safe='')
-            url = f"{SHEETS_API_BASE}/{clean_id}/values/{encoded_range}"
+    for start in range(0, max(row_counts.values()), chunk_rows):
+        # One values:batchGet per window covers every sheet that still has rows
+        window = [
+            (sname, f"'{sname}'!{start + 1}:{min(start + chunk_rows, row_count)}")
+            for sname, row_count in row_counts.items()
+            if row_count > start
+        ]
+        params = urlencode([("ranges", window_range) for _, window_range in window])
+        url = f"{SHEETS_API_BASE}/{clean_id}/values:batchGet?{params}"
 
-            try:
-                response = await client.get(url, headers=headers)
-                if response.status_code != 200:
-                    continue
-
-                data = response.json()
-                values = data.get("values", [])
+        try:
+            response = await api_request("GET", url, headers=headers)
+            if response.status_code != 200:
+                error_msg = api_error_message(response)
+                return {"error": error_msg}
+            value_ranges = json_loads(response.content).get("valueRanges", [])
+        except Exception as e:
+            logger.error(f"Error searching sheets: {e}")
+            return {"error": str(e)}
 
-                for row_idx, row in enumerate(values):
-                    for col_idx, cell in enumerate(row):
-                        if search_lower in str(cell).lower():
-                            matches.append({
-                                "sheet": sname,
-                                "row": row_idx + 1,
-                                "column": col_idx + 1,
-                                "cell": f"{chr(65 + col_idx)}{row_idx + 1}" if col_idx < 26 else f"Col{col_idx + 1}",
-                                "value": str(cell),
-                            })
+        # valueRanges are returned in the same order as the requested ranges
+        for (sname, _), value_range in zip(window, value_ranges):
+            values = value_range.get("values", [])
 
-            except Exception as e:
-                logger.warning(f"Error searching sheet {sname}: {e}")
+            for row_num, row in enumerate(values, start + 1):
+                # Check the whole row once; most rows have no match. The unit
+                # separator keeps matches from spanning cell boundaries.
+                if search_lower not in "\x1f".join(map(str, row)).lower():
+                    continue
+                for col_idx, cell in enumerate(row):
+                    if search_lower in str(cell).lower():
+                        matches.append({
+                            "sheet": sname,
+                            "row": row_num,
+                            "column": col_idx + 1,
+                            "cell": f"{column_letter(col_idx)}{row_num}",
+                            "value": str(cell),
+                        })
 
     return {"matches": matches, "count": len(matches), "search_text": search_text}
 
@@ -386,8 +607,6 @@ async def clear_range(
     Returns:
         Dict with cleared range info, or error
     """
-    _check_httpx()
-
     clean_id = extract_spreadsheet_id(spreadsheet_id)
     headers = {
         "Authorization": f"Bearer {access_token}",
@@ -397,21 +616,19 @@ async def clear_range(
     encoded_range = quote(range_notation, safe='')
     url = f"{SHEETS_API_BASE}/{clean_id}/values/{encoded_range}:clear"
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.post(url, headers=headers, json={})
+    try:
+        response = await api_request("POST", url, headers=headers, content=_EMPTY_BODY, idempotent=True)
 
-            if response.status_code != 200:
-                error_data = response.json() if response.text else {}
-                error_msg = error_data.get("error", {}).get("message", "Unknown error")
-                return {"error": error_msg}
+        if response.status_code != 200:
+            error_msg = api_error_message(response)
+            return {"error": error_msg}
 
-            data = response.json()
-            return {
-                "cleared_range": data.get("clearedRange"),
-                "spreadsheet_id": data.get("spreadsheetId"),
-            }
+        data = json_loads(response.content)
+        return {
+            "cleared_range": data.get("clearedRange"),
+            "spreadsheet_id": data.get("spreadsheetId"),
+        }
 
-        except Exception as e:
-            logger.error(f"Error clearing range: {e}")
-            return {"error": str(e)}
+    except Exception as e:
+        logger.error(f"Error clearing range: {e}")
+        return {"error": str(e)}
@@ -1,14 +1,18 @@
 """Filter and validation operations for Google Sheets."""
 
 import logging
-from typing import Optional, List
+from typing import Callable, Dict, List, Optional
 
 from tool_master.tools.google._sheets_utils import (
+    SHEETS_API_BASE,
+    api_request,
+    json_loads,
+    read_cached,
     extract_spreadsheet_id,
     get_sheet_id,
     batch_update,
-    parse_a1_range,
-    build_grid_range,
+    dig,
+    resolve_range,
     parse_color,
 )
 
@@ -34,21 +38,10 @@ async def set_basic_filter(
     Returns:
         Dict with success status, or error
     """
-    clean_id = extract_spreadsheet_id(spreadsheet_id)
-    parsed = parse_a1_range(range_notation)
-    sheet_id = await get_sheet_id(access_token, clean_id, parsed.get("sheet_name"))
-
+    clean_id, sheet_id, grid_range = await resolve_range(access_token, spreadsheet_id, range_notation)
     if sheet_id is None:
         return {"error": "Sheet not found"}
 
-    grid_range = build_grid_range(
-        sheet_id,
-        parsed.get("start_row"),
-        parsed.get("end_row"),
-        parsed.get("start_col"),
-        parsed.get("end_col"),
-    )
-
     requests = [{"setBasicFilter": {"filter": {"range": grid_range}}}]
 
     result = await batch_update(access_token, clean_id, requests)
@@ -109,21 +102,10 @@ async def create_filter_view(
     Returns:
         Dict with filter view ID, or error
     """
-    clean_id = extract_spreadsheet_id(spreadsheet_id)
-    parsed = parse_a1_range(range_notation)
-    sheet_id = await get_sheet_id(access_token, clean_id, parsed.get("sheet_name"))
-
+    clean_id, sheet_id, grid_range = await resolve_range(access_token, spreadsheet_id, range_notation)
     if sheet_id is None:
         return {"error": "Sheet not found"}
 
-    grid_range = build_grid_range(
-        sheet_id,
-        parsed.get("start_row"),
-        parsed.get("end_row"),
-        parsed.get("start_col"),
-        parsed.get("end_col"),
-    )
-
     requests = [{
         "addFilterView": {
             "filter": {
@@ -137,7 +119,10 @@ async def create_filter_view(
     if "error" in result:
         return result
 
-    fv_id = result.get("replies", [{}])[0].get("addFilterView", {}).get("filter", {}).get("filterViewId")
+    if result.get("queued"):
+        return {"queued": True, "message": f"Queued filter view '{title}'"}
+
+    fv_id = dig(result, "replies", 0, "addFilterView", "filter", "filterViewId")
     return {"success": True, "filter_view_id": fv_id, "message": f"Created filter view '{title}'"}
 
 
@@ -166,6 +151,7 @@ async def delete_filter_view(
     return {"success": True, "message": f"Deleted filter view {filter_view_id}"}
 
 
+@read_cached
 async def list_filter_views(
     access_token: str,
     spreadsheet_id: str,
@@ -181,42 +167,62 @@ async def list_filter_views(
     Returns:
         Dict with filter views list, or error
     """
-    from tool_master.tools.google._sheets_utils import SHEETS_API_BASE, _check_httpx
-    import httpx
-
-    _check_httpx()
-
     clean_id = extract_spreadsheet_id(spreadsheet_id)
     headers = {"Authorization": f"Bearer {access_token}"}
-    url = f"{SHEETS_API_BASE}/{clean_id}?fields=sheets(properties,filterViews)"
+    url = (
+        f"{SHEETS_API_BASE}/{clean_id}"
+        "?fields=sheets(properties.title,filterViews(filterViewId,title))"
+    )
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.get(url, headers=headers)
-        if response.status_code != 200:
-            return {"error": "Failed to get filter views"}
+    response = await api_request("GET", url, headers=headers)
+    if response.status_code != 200:
+        return {"error": "Failed to get filter views"}
 
-        data = response.json()
-        views = []
+    data = json_loads(response.content)
+    views = []
 
-        for sheet in data.get("sheets", []):
-            sname = sheet.get("properties", {}).get("title")
-            if sheet_name and sname != sheet_name:
-                continue
+    for sheet in data.get("sheets", []):
+        sname = sheet.get("properties", {}).get("title")
+        if sheet_name and sname != sheet_name:
+            continue
 
-            for fv in sheet.get("filterViews", []):
-                views.append({
-                    "filter_view_id": fv.get("filterViewId"),
-                    "title": fv.get("title"),
-                    "sheet": sname,
-                })
+        for fv in sheet.get("filterViews", []):
+            views.append({
+                "filter_view_id": fv.get("filterViewId"),
+                "title": fv.get("title"),
+                "sheet": sname,
+            })
 
-        return {"filter_views": views, "count": len(views)}
+    return {"filter_views": views, "count": len(views)}
 
 
 # =============================================================================
 # Conditional Formatting
 # =============================================================================
 
+def _compare_condition(condition_type: str) -> Callable[[Optional[str]], dict]:
+    def build(value: Optional[str]) -> dict:
+        if value:
+            return {"type": condition_type, "values": [{"userEnteredValue": value}]}
+        return {"type": condition_type}
+    return build
+
+
+def _blank_condition(condition_type: str) -> Callable[[Optional[str]], dict]:
+    return lambda value: {"type": condition_type}
+
+
+# rule_type -> builder(condition_value) returning the booleanRule condition
+_CONDITION_FACTORIES: Dict[str, Callable[[Optional[str]], dict]] = {
+    "greater_than": _compare_condition("NUMBER_GREATER"),
+    "less_than": _compare_condition("NUMBER_LESS"),
+    "equals": _compare_condition("NUMBER_EQ"),
+    "contains": _compare_condition("TEXT_CONTAINS"),
+    "not_empty": _blank_condition("NOT_BLANK"),
+    "is_empty": _blank_condition("BLANK"),
+}
+
+
 async def conditional_format(
     access_token: str,
     spreadsheet_id: str,
@@ -240,27 +246,15 @@ async def conditional_format(
     Returns:
         Dict with success status, or error
     """
-    clean_id = extract_spreadsheet_id(spreadsheet_id)
-    parsed = parse_a1_range(range_notation)
-    sheet_id = await get_sheet_id(access_token, clean_id, parsed.get("sheet_name"))
+    build_condition = _CONDITION_FACTORIES.get(rule_type)
+    if build_condition is None:
+        return {"error": f"Unknown rule_type: {rule_type}"}
+    bool_condition = build_condition(condition_value)
 
+    clean_id, sheet_id, grid_range = await resolve_range(access_token, spreadsheet_id, range_notation)
     if sheet_id is None:
         return {"error": "Sheet not found"}
 
-    # Build condition
-    condition_type_map = {
-        "greater_than": "NUMBER_GREATER",
-        "less_than": "NUMBER_LESS",
-        "equals": "NUMBER_EQ",
-        "contains": "TEXT_CONTAINS",
-        "not_empty": "NOT_BLANK",
-        "is_empty": "BLANK",
-    }
-
-    bool_condition = {"type": condition_type_map.get(rule_type, "NUMBER_GREATER")}
-    if condition_value and rule_type not in ("not_empty", "is_empty"):
-        bool_condition["values"] = [{"userEnteredValue": condition_value}]
-
     # Build format
     rgb = parse_color(color)
     cell_format = {}
@@ -269,14 +263,6 @@ async def conditional_format(
     else:
         cell_format["textFormat"] = {"foregroundColor": rgb}
 
-    grid_range = build_grid_range(
-        sheet_id,
-        parsed.get("start_row"),
-        parsed.get("end_row"),
-        parsed.get("start_col"),
-        parsed.get("end_col"),
-    )
-
     requests = [{
         "addConditionalFormatRule": {
             "rule": {
@@ -301,6 +287,47 @@ async def conditional_format(
 # Data Validation
 # =============================================================================
 
+def _dropdown_condition(values, min_value, max_value) -> dict:
+    if not values:
+        return {"error": "values required for dropdown validation"}
+    return {
+        "type": "ONE_OF_LIST",
+        "values": [{"userEnteredValue": v} for v in values],
+    }
+
+
+def _number_range_condition(values, min_value, max_value) -> dict:
+    if min_value is not None and max_value is not None:
+        return {
+            "type": "NUMBER_BETWEEN",
+            "values": [
+                {"userEnteredValue": str(min_value)},
+                {"userEnteredValue": str(max_value)},
+            ],
+        }
+    if min_value is not None:
+        return {
+            "type": "NUMBER_GREATER_THAN_EQ",
+            "values": [{"userEnteredValue": str(min_value)}],
+        }
+    if max_value is not None:
+        return {
+            "type": "NUMBER_LESS_THAN_EQ",
+            "values": [{"userEnteredValue": str(max_value)}],
+        }
+    return {"error": "min_value and/or max_value required for number_range"}
+
+
+# validation_type -> builder(values, min_value, max_value) returning the
+# condition dict, or an error dict when the arguments don't fit the type.
+_VALIDATION_CONDITIONS: Dict[str, Callable[..., dict]] = {
+    "dropdown": _dropdown_condition,
+    "number_range": _number_range_condition,
+    "date": lambda values, min_value, max_value: {"type": "DATE_IS_VALID"},
+    "checkbox": lambda values, min_value, max_value: {"type": "BOOLEAN"},
+}
+
+
 async def data_validation(
     access_token: str,
     spreadsheet_id: str,
@@ -325,57 +352,17 @@ async def data_validation(
     Returns:
         Dict with success status, or error
     """
-    clean_id = extract_spreadsheet_id(spreadsheet_id)
-    parsed = parse_a1_range(range_notation)
-    sheet_id = await get_sheet_id(access_token, clean_id, parsed.get("sheet_name"))
+    build_condition = _VALIDATION_CONDITIONS.get(validation_type)
+    if build_condition is None:
+        return {"error": f"Unknown validation_type: {validation_type}"}
+    condition = build_condition(values, min_value, max_value)
+    if "error" in condition:
+        return condition
 
+    clean_id, sheet_id, grid_range = await resolve_range(access_token, spreadsheet_id, range_notation)
     if sheet_id is None:
         return {"error": "Sheet not found"}
 
-    # Build validation rule
-    if validation_type == "dropdown":
-        if not values:
-            return {"error": "values required for dropdown validation"}
-        condition = {
-            "type": "ONE_OF_LIST",
-            "values": [{"userEnteredValue": v} for v in values],
-        }
-    elif validation_type == "number_range":
-        if min_value is not None and max_value is not None:
-            condition = {
-                "type": "NUMBER_BETWEEN",
-                "values": [
-                    {"userEnteredValue": str(min_value)},
-                    {"userEnteredValue": str(max_value)},
-                ],
-            }
-        elif min_value is not None:
-            condition = {
-                "type": "NUMBER_GREATER_THAN_EQ",
-                "values": [{"userEnteredValue": str(min_value)}],
-            }
-        elif max_value is not None:
-            condition = {
-                "type": "NUMBER_LESS_THAN_EQ",
-                "values": [{"userEnteredValue": str(max_value)}],
-            }
-        else:
-            return {"error": "min_value and/or max_value required for number_range"}
-    elif validation_type == "date":
-        condition = {"type": "DATE_IS_VALID"}
-    elif validation_type == "checkbox":
-        condition = {"type": "BOOLEAN"}
-    else:
-        return {"error": f"Unknown validation_type: {validation_type}"}
-
-    grid_range = build_grid_range(
-        sheet_id,
-        parsed.get("start_row"),
-        parsed.get("end_row"),
-        parsed.get("start_col"),
-        parsed.get("end_col"),
-    )
-
     requests = [{
         "setDataValidation": {
             "range": grid_range,
@@ -1,7 +1,10 @@
 """Sheet formatting operations: text, colors, borders, alignment, merging."""
 
+import asyncio
+import inspect
 import logging
-from typing import Optional
+from functools import lru_cache
+from typing import List, Optional
 
 from tool_master.tools.google._sheets_utils import (
     extract_spreadsheet_id,
@@ -9,11 +12,72 @@ from tool_master.tools.google._sheets_utils import (
     batch_update,
     parse_a1_range,
     parse_color,
+    parse_colors,
+    parse_column_range,
     build_grid_range,
+    resolve_range,
+    SheetsBatchCoalescer,
+    cached_sheet_id,
+    prefetch_sheet_ids,
 )
 
 logger = logging.getLogger(__name__)
 
+_FORMAT_PATTERNS = {
+    "number": "#,##0.00",
+    "currency": "$#,##0.00",
+    "percent": "0.00%",
+    "date": "yyyy-mm-dd",
+    "datetime": "yyyy-mm-dd hh:mm:ss",
+    "text": "@",
+}
+
+_WRAP_MAP = {"overflow": "OVERFLOW_CELL", "clip": "CLIP", "wrap": "WRAP"}
+
+_BORDER_STYLE_MAP = {
+    "solid": "SOLID",
+    "dashed": "DASHED",
+    "dotted": "DOTTED",
+    "double": "DOUBLE",
+    "thick": "SOLID_THICK",
+    "medium": "SOLID_MEDIUM",
+    "none": "NONE",
+}
+
+_HORIZONTAL_ALIGNMENTS = frozenset(("left", "center", "right"))
+_VERTICAL_ALIGNMENTS = frozenset(("top", "middle", "bottom"))
+
+# sides argument -> updateBorders fields it sets
+_BORDER_SIDE_FIELDS = {
+    "all": ("top", "bottom", "left", "right", "innerHorizontal", "innerVertical"),
+    "outer": ("top", "bottom", "left", "right"),
+    "inner": ("innerHorizontal", "innerVertical"),
+    "top": ("top",),
+    "bottom": ("bottom",),
+    "left": ("left",),
+    "right": ("right",),
+}
+
+
+@lru_cache(maxsize=64)
+def _border_sides(api_style: str, color: str, sides: str) -> dict:
+    """Side fields for an updateBorders request, all sharing one border spec.
+
+    Cached per (style, color, sides); copy before adding the range.
+    """
+    if api_style == "NONE":
+        border_spec = {"style": "NONE"}
+    else:
+        border_spec = {"style": api_style, "color": parse_color(color)}
+    return dict.fromkeys(_BORDER_SIDE_FIELDS[sides], border_spec)
+
+
+_MERGE_TYPE_MAP = {
+    "all": "MERGE_ALL",
+    "horizontal": "MERGE_ROWS",
+    "vertical": "MERGE_COLUMNS",
+}
+
 
 async def format_columns(
     access_token: str,
@@ -36,8 +100,6 @@ async def format_columns(
     Returns:
         Dict with success status, or error
     """
-    from tool_master.tools.google._sheets_utils import parse_column_range
-
     clean_id = extract_spreadsheet_id(spreadsheet_id)
     sheet_id = await get_sheet_id(access_token, clean_id, sheet_name)
     if sheet_id is None:
@@ -45,16 +107,7 @@ async def format_columns(
 
     start_col, end_col = parse_column_range(columns)
 
-    # Determine format pattern
-    FORMAT_PATTERNS = {
-        "number": "#,##0.00",
-        "currency": "$#,##0.00",
-        "percent": "0.00%",
-        "date": "yyyy-mm-dd",
-        "datetime": "yyyy-mm-dd hh:mm:ss",
-        "text": "@",
-    }
-    actual_pattern = pattern or FORMAT_PATTERNS.get(format_type, "@")
+    actual_pattern = pattern or _FORMAT_PATTERNS.get(format_type, "@")
 
     requests = [{
         "repeatCell": {
@@ -103,13 +156,6 @@ async def set_text_format(
     Returns:
         Dict with success status, or error
     """
-    clean_id = extract_spreadsheet_id(spreadsheet_id)
-    parsed = parse_a1_range(range_notation)
-    sheet_id = await get_sheet_id(access_token, clean_id, parsed.get("sheet_name"))
-
-    if sheet_id is None:
-        return {"error": "Sheet not found"}
-
     text_format = {}
     fields = []
 
@@ -135,13 +181,9 @@ async def set_text_format(
     if not fields:
         return {"error": "No formatting options specified"}
 
-    grid_range = build_grid_range(
-        sheet_id,
-        parsed.get("start_row"),
-        parsed.get("end_row"),
-        parsed.get("start_col"),
-        parsed.get("end_col"),
-    )
+    clean_id, sheet_id, grid_range = await resolve_range(access_token, spreadsheet_id, range_notation)
+    if sheet_id is None:
+        return {"error": "Sheet not found"}
 
     requests = [{
         "repeatCell": {
@@ -175,22 +217,11 @@ async def set_text_color(
     Returns:
         Dict with success status, or error
     """
-    clean_id = extract_spreadsheet_id(spreadsheet_id)
-    parsed = parse_a1_range(range_notation)
-    sheet_id = await get_sheet_id(access_token, clean_id, parsed.get("sheet_name"))
-
+    clean_id, sheet_id, grid_range = await resolve_range(access_token, spreadsheet_id, range_notation)
     if sheet_id is None:
         return {"error": "Sheet not found"}
 
     rgb = parse_color(color)
-    grid_range = build_grid_range(
-        sheet_id,
-        parsed.get("start_row"),
-        parsed.get("end_row"),
-        parsed.get("start_col"),
-        parsed.get("end_col"),
-    )
-
     requests = [{
         "repeatCell": {
             "range": grid_range,
@@ -223,22 +254,11 @@ async def set_background_color(
     Returns:
         Dict with success status, or error
     """
-    clean_id = extract_spreadsheet_id(spreadsheet_id)
-    parsed = parse_a1_range(range_notation)
-    sheet_id = await get_sheet_id(access_token, clean_id, parsed.get("sheet_name"))
-
+    clean_id, sheet_id, grid_range = await resolve_range(access_token, spreadsheet_id, range_notation)
     if sheet_id is None:
         return {"error": "Sheet not found"}
 
     rgb = parse_color(color)
-    grid_range = build_grid_range(
-        sheet_id,
-        parsed.get("start_row"),
-        parsed.get("end_row"),
-        parsed.get("start_col"),
-        parsed.get("end_col"),
-    )
-
     requests = [{
         "repeatCell": {
             "range": grid_range,
@@ -275,37 +295,29 @@ async def set_alignment(
     Returns:
         Dict with success status, or error
     """
-    clean_id = extract_spreadsheet_id(spreadsheet_id)
-    parsed = parse_a1_range(range_notation)
-    sheet_id = await get_sheet_id(access_token, clean_id, parsed.get("sheet_name"))
-
-    if sheet_id is None:
-        return {"error": "Sheet not found"}
-
     format_obj = {}
     fields = []
 
     if horizontal:
+        if horizontal.lower() not in _HORIZONTAL_ALIGNMENTS:
+            return {"error": f"Invalid horizontal alignment: {horizontal}"}
         format_obj["horizontalAlignment"] = horizontal.upper()
         fields.append("userEnteredFormat.horizontalAlignment")
     if vertical:
+        if vertical.lower() not in _VERTICAL_ALIGNMENTS:
+            return {"error": f"Invalid vertical alignment: {vertical}"}
         format_obj["verticalAlignment"] = vertical.upper()
         fields.append("userEnteredFormat.verticalAlignment")
     if wrap:
-        wrap_map = {"overflow": "OVERFLOW_CELL", "clip": "CLIP", "wrap": "WRAP"}
-        format_obj["wrapStrategy"] = wrap_map.get(wrap.lower(), "OVERFLOW_CELL")
+        format_obj["wrapStrategy"] = _WRAP_MAP.get(wrap.lower(), "OVERFLOW_CELL")
         fields.append("userEnteredFormat.wrapStrategy")
 
     if not fields:
         return {"error": "No alignment options specified"}
 
-    grid_range = build_grid_range(
-        sheet_id,
-        parsed.get("start_row"),
-        parsed.get("end_row"),
-        parsed.get("start_col"),
-        parsed.get("end_col"),
-    )
+    clean_id, sheet_id, grid_range = await resolve_range(access_token, spreadsheet_id, range_notation)
+    if sheet_id is None:
+        return {"error": "Sheet not found"}
 
     requests = [{
         "repeatCell": {
@@ -343,54 +355,16 @@ async def set_borders(
     Returns:
         Dict with success status, or error
     """
-    clean_id = extract_spreadsheet_id(spreadsheet_id)
-    parsed = parse_a1_range(range_notation)
-    sheet_id = await get_sheet_id(access_token, clean_id, parsed.get("sheet_name"))
+    side_fields = _BORDER_SIDE_FIELDS.get(sides)
+    if side_fields is None:
+        return {"error": f"Invalid sides: {sides}"}
 
+    clean_id, sheet_id, grid_range = await resolve_range(access_token, spreadsheet_id, range_notation)
     if sheet_id is None:
         return {"error": "Sheet not found"}
 
-    style_map = {
-        "solid": "SOLID",
-        "dashed": "DASHED",
-        "dotted": "DOTTED",
-        "double": "DOUBLE",
-        "thick": "SOLID_THICK",
-        "medium": "SOLID_MEDIUM",
-        "none": "NONE",
-    }
-    api_style = style_map.get(border_style.lower(), "SOLID")
-    rgb = parse_color(color)
-
-    border_spec = {"style": api_style, "color": rgb} if api_style != "NONE" else {"style": "NONE"}
-
-    grid_range = build_grid_range(
-        sheet_id,
-        parsed.get("start_row"),
-        parsed.get("end_row"),
-        parsed.get("start_col"),
-        parsed.get("end_col"),
-    )
-
-    update_borders = {"range": grid_range}
-
-    if sides == "all":
-        update_borders.update({
-            "top": border_spec, "bottom": border_spec,
-            "left": border_spec, "right": border_spec,
-            "innerHorizontal": border_spec, "innerVertical": border_spec,
-        })
-    elif sides == "outer":
-        update_borders.update({
-            "top": border_spec, "bottom": border_spec,
-            "left": border_spec, "right": border_spec,
-        })
-    elif sides == "inner":
-        update_borders.update({
-            "innerHorizontal": border_spec, "innerVertical": border_spec,
-        })
-    else:
-        update_borders[sides] = border_spec
+    api_style = _BORDER_STYLE_MAP.get(border_style.lower(), "SOLID")
+    update_borders = {"range": grid_range, **_border_sides(api_style, color, sides)}
 
     requests = [{"updateBorders": update_borders}]
 
@@ -418,31 +392,14 @@ async def merge_cells(
     Returns:
         Dict with success status, or error
     """
-    clean_id = extract_spreadsheet_id(spreadsheet_id)
-    parsed = parse_a1_range(range_notation)
-    sheet_id = await get_sheet_id(access_token, clean_id, parsed.get("sheet_name"))
-
+    clean_id, sheet_id, grid_range = await resolve_range(access_token, spreadsheet_id, range_notation)
     if sheet_id is None:
         return {"error": "Sheet not found"}
 
-    type_map = {
-        "all": "MERGE_ALL",
-        "horizontal": "MERGE_ROWS",
-        "vertical": "MERGE_COLUMNS",
-    }
-
-    grid_range = build_grid_range(
-        sheet_id,
-        parsed.get("start_row"),
-        parsed.get("end_row"),
-        parsed.get("start_col"),
-        parsed.get("end_col"),
-    )
-
     requests = [{
         "mergeCells": {
             "range": grid_range,
-            "mergeType": type_map.get(merge_type.lower(), "MERGE_ALL"),
+            "mergeType": _MERGE_TYPE_MAP.get(merge_type.lower(), "MERGE_ALL"),
         }
     }]
 
@@ -468,21 +425,10 @@ async def unmerge_cells(
     Returns:
         Dict with success status, or error
     """
-    clean_id = extract_spreadsheet_id(spreadsheet_id)
-    parsed = parse_a1_range(range_notation)
-    sheet_id = await get_sheet_id(access_token, clean_id, parsed.get("sheet_name"))
-
+    clean_id, sheet_id, grid_range = await resolve_range(access_token, spreadsheet_id, range_notation)
     if sheet_id is None:
         return {"error": "Sheet not found"}
 
-    grid_range = build_grid_range(
-        sheet_id,
-        parsed.get("start_row"),
-        parsed.get("end_row"),
-        parsed.get("start_col"),
-        parsed.get("end_col"),
-    )
-
     requests = [{"unmergeCells": {"range": grid_range}}]
 
     result = await batch_update(access_token, clean_id, requests)
@@ -513,19 +459,12 @@ async def alternating_colors(
     Returns:
         Dict with success status, or error
     """
-    clean_id = extract_spreadsheet_id(spreadsheet_id)
-    parsed = parse_a1_range(range_notation)
-    sheet_id = await get_sheet_id(access_token, clean_id, parsed.get("sheet_name"))
-
+    clean_id, sheet_id, grid_range = await resolve_range(access_token, spreadsheet_id, range_notation)
     if sheet_id is None:
         return {"error": "Sheet not found"}
 
-    grid_range = build_grid_range(
-        sheet_id,
-        parsed.get("start_row"),
-        parsed.get("end_row"),
-        parsed.get("start_col"),
-        parsed.get("end_col"),
+    header_rgb, first_rgb, second_rgb = parse_colors(
+        header_color, first_band_color, second_band_color
     )
 
     requests = [{
@@ -533,9 +472,9 @@ async def alternating_colors(
             "bandedRange": {
                 "range": grid_range,
                 "rowProperties": {
-                    "headerColor": parse_color(header_color),
-                    "firstBandColor": parse_color(first_band_color),
-                    "secondBandColor": parse_color(second_band_color),
+                    "headerColor": header_rgb,
+                    "firstBandColor": first_rgb,
+                    "secondBandColor": second_rgb,
                 },
             }
         }
@@ -567,17 +506,17 @@ async def add_note(
     """
     clean_id = extract_spreadsheet_id(spreadsheet_id)
     parsed = parse_a1_range(cell)
-    sheet_id = await get_sheet_id(access_token, clean_id, parsed.get("sheet_name"))
+    sheet_id = await get_sheet_id(access_token, clean_id, parsed.sheet_name)
 
     if sheet_id is None:
         return {"error": "Sheet not found"}
 
     grid_range = build_grid_range(
         sheet_id,
-        parsed.get("start_row"),
-        parsed.get("start_row") + 1 if parsed.get("start_row") is not None else None,
-        parsed.get("start_col"),
-        parsed.get("start_col") + 1 if parsed.get("start_col") is not None else None,
+        parsed.start_row,
+        parsed.start_row + 1 if parsed.start_row is not None else None,
+        parsed.start_col,
+        parsed.start_col + 1 if parsed.start_col is not None else None,
     )
 
     requests = [{
@@ -594,3 +533,142 @@ async def add_note(
 
     action = "Added note to" if note else "Cleared note from"
     return {"success": True, "message": f"{action} {cell}"}
+
+
+_FORMAT_OPS = {
+    "format_columns": format_columns,
+    "set_text_format": set_text_format,
+    "set_text_color": set_text_color,
+    "set_background_color": set_background_color,
+    "set_alignment": set_alignment,
+    "set_borders": set_borders,
+    "merge_cells": merge_cells,
+    "unmerge_cells": unmerge_cells,
+    "alternating_colors": alternating_colors,
+    "add_note": add_note,
+}
+
+
+def _bind_format_op(access_token: str, spreadsheet_id: str, op: dict):
+    """Look up and check one format_many operation.
+
+    Returns:
+        (function, kwargs) ready to await, or an error dict
+    """
+    if not isinstance(op, dict):
+        return {"error": f"Formatting op must be an object, got {type(op).__name__}"}
+    name = op.get("op")
+    func = _FORMAT_OPS.get(name) if isinstance(name, str) else None
+    if func is None:
+        return {"error": f"Unknown formatting op: {name}"}
+    kwargs = op.get("kwargs", {})
+    if not isinstance(kwargs, dict):
+        return {"error": f"Invalid arguments for {name}: kwargs must be an object"}
+    try:
+        inspect.signature(func).bind(access_token, spreadsheet_id, **kwargs)
+    except TypeError as e:
+        return {"error": f"Invalid arguments for {name}: {e}"}
+    return func, kwargs
+
+
+def _op_sheet_name(kwargs: dict) -> Optional[str]:
+    """Sheet name a format_many operation will look up, from its kwargs."""
+    target = kwargs.get("range_notation") or kwargs.get("cell")
+    if isinstance(target, str):
+        try:
+            return parse_a1_range(target).sheet_name
+        except ValueError:
+            return None  # the op itself reports the bad range
+    name = kwargs.get("sheet_name")
+    return name if isinstance(name, str) else None
+
+
+async def format_many(
+    access_token: str,
+    spreadsheet_id: str,
+    ops: List[dict],
+) -> List[dict]:
+    """Apply several formatting operations to one spreadsheet at once.
+
+    The spreadsheet's sheet IDs are fetched first if any are missing from
+    the cache, so the operations themselves hit the cache and submit their
+    updates within one coalescing window. They then run concurrently under a
+    SheetsBatchCoalescer, which merges their updates into as few batchUpdate
+    requests as possible.
+
+    Args:
+        access_token: Valid Google OAuth access token
+        spreadsheet_id: Google Sheets ID
+        ops: List of {"op": <function name>, "kwargs": {...}}, e.g.
+            {"op": "set_borders", "kwargs": {"range_notation": "A1:C3"}}
+
+    Returns:
+        One result dict per operation, in the same order
+    """
+    calls = [_bind_format_op(access_token, spreadsheet_id, op) for op in ops]
+
+    clean_id = extract_spreadsheet_id(spreadsheet_id)
+    sheet_names = {_op_sheet_name(call[1]) for call in calls if not isinstance(call, dict)}
+    if any(cached_sheet_id(access_token, clean_id, name) is None for name in sheet_names):
+        await prefetch_sheet_ids(access_token, clean_id)
+
+    async def run(call) -> dict:
+        if isinstance(call, dict):
+            return call
+        func, kwargs = call
+        return await func(access_token, spreadsheet_id, **kwargs)
+
+    async with SheetsBatchCoalescer():
+        results = await asyncio.gather(*[run(call) for call in calls], return_exceptions=True)
+
+    # One op failing, e.g. on an argument of the wrong type, must not fail the others
+    return [
+        {"error": f"{op['op']} failed: {result}"} if isinstance(result, BaseException) else result
+        for op, result in zip(ops, results)
+    ]
+
+
+async def batch_format(
+    access_token: str,
+    spreadsheet_id: str,
+    operations: List[dict],
+) -> dict:
+    """Apply several formatting tool calls in as few requests as possible.
+
+    Each operation names one of the formatting tools and carries that
+    tool's arguments, e.g. {"op": "set_borders", "range": "A1:C3"}.
+    The operations are run through format_many.
+
+    Args:
+        access_token: Valid Google OAuth access token
+        spreadsheet_id: Google Sheets ID
+        operations: List of {"op": <tool name>, <tool arguments>...}
+
+    Returns:
+        Dict with per-operation results, or error
+    """
+    if not isinstance(operations, list) or not operations:
+        return {"error": "operations must be a non-empty list"}
+    if not all(isinstance(operation, dict) for operation in operations):
+        return {"error": "Each operation must be an object with an 'op' key"}
+
+    ops = [
+        {
+            "op": operation.get("op"),
+            "kwargs": {
+                ("range_notation" if key == "range" else key): value
+                for key, value in operation.items()
+                if key != "op"
+            },
+        }
+        for operation in operations
+    ]
+    results = await format_many(access_token, spreadsheet_id, ops)
+    applied = sum(1 for result in results if "error" not in result)
+
+    return {
+        "success": applied == len(results),
+        "applied": applied,
+        "failed": len(results) - applied,
+        "results": results,
+    }
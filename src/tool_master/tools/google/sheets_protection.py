@@ -2,20 +2,51 @@
 
 import logging
 from typing import Optional, List
+from urllib.parse import quote
 
 from tool_master.tools.google._sheets_utils import (
     extract_spreadsheet_id,
     get_sheet_id,
     batch_update,
+    dig,
     parse_a1_range,
     build_grid_range,
+    resolve_range,
     SHEETS_API_BASE,
-    _check_httpx,
+    api_request,
+    api_stream,
+    iter_json_items,
+    json_loads,
+    read_cached,
 )
 
 logger = logging.getLogger(__name__)
 
 
+# Field masks covering exactly what the summaries below read; protected
+# ranges otherwise carry their full editor lists.
+_NAMED_RANGE_FIELDS = "namedRanges(namedRangeId,name,range)"
+_PROTECTED_RANGE_FIELDS = "sheets(properties.title,protectedRanges(protectedRangeId,description,warningOnly,range))"
+
+
+def _named_range_summary(nr: dict) -> dict:
+    return {
+        "named_range_id": nr.get("namedRangeId"),
+        "name": nr.get("name"),
+        "range": nr.get("range"),
+    }
+
+
+def _protected_range_summary(pr: dict, sheet_name: Optional[str]) -> dict:
+    return {
+        "protected_range_id": pr.get("protectedRangeId"),
+        "description": pr.get("description", ""),
+        "warning_only": pr.get("warningOnly", False),
+        "sheet": sheet_name,
+        "range": pr.get("range"),
+    }
+
+
 # =============================================================================
 # Named Ranges
 # =============================================================================
@@ -37,21 +68,10 @@ async def create_named_range(
     Returns:
         Dict with named range ID, or error
     """
-    clean_id = extract_spreadsheet_id(spreadsheet_id)
-    parsed = parse_a1_range(range_notation)
-    sheet_id = await get_sheet_id(access_token, clean_id, parsed.get("sheet_name"))
-
+    clean_id, sheet_id, grid_range = await resolve_range(access_token, spreadsheet_id, range_notation)
     if sheet_id is None:
         return {"error": "Sheet not found"}
 
-    grid_range = build_grid_range(
-        sheet_id,
-        parsed.get("start_row"),
-        parsed.get("end_row"),
-        parsed.get("start_col"),
-        parsed.get("end_col"),
-    )
-
     requests = [{
         "addNamedRange": {
             "namedRange": {
@@ -65,10 +85,14 @@ async def create_named_range(
     if "error" in result:
         return result
 
-    nr_id = result.get("replies", [{}])[0].get("addNamedRange", {}).get("namedRange", {}).get("namedRangeId")
+    if result.get("queued"):
+        return {"queued": True, "message": f"Queued named range '{name}'"}
+
+    nr_id = dig(result, "replies", 0, "addNamedRange", "namedRange", "namedRangeId")
     return {"success": True, "named_range_id": nr_id, "message": f"Created named range '{name}'"}
 
 
+@read_cached
 async def list_named_ranges(access_token: str, spreadsheet_id: str) -> dict:
     """List all named ranges.
 
@@ -79,28 +103,18 @@ async def list_named_ranges(access_token: str, spreadsheet_id: str) -> dict:
     Returns:
         Dict with named ranges list, or error
     """
-    import httpx
-    _check_httpx()
-
     clean_id = extract_spreadsheet_id(spreadsheet_id)
     headers = {"Authorization": f"Bearer {access_token}"}
-    url = f"{SHEETS_API_BASE}/{clean_id}?fields=namedRanges"
+    url = f"{SHEETS_API_BASE}/{clean_id}?fields={_NAMED_RANGE_FIELDS}"
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.get(url, headers=headers)
-        if response.status_code != 200:
-            return {"error": "Failed to get named ranges"}
+    response = await api_request("GET", url, headers=headers)
+    if response.status_code != 200:
+        return {"error": "Failed to get named ranges"}
 
-        data = response.json()
-        ranges = []
-        for nr in data.get("namedRanges", []):
-            ranges.append({
-                "named_range_id": nr.get("namedRangeId"),
-                "name": nr.get("name"),
-                "range": nr.get("range"),
-            })
+    data = json_loads(response.content)
+    ranges = [_named_range_summary(nr) for nr in data.get("namedRanges", [])]
 
-        return {"named_ranges": ranges, "count": len(ranges)}
+    return {"named_ranges": ranges, "count": len(ranges)}
 
 
 async def delete_named_range(
@@ -151,21 +165,10 @@ async def protect_range(
     Returns:
         Dict with protected range ID, or error
     """
-    clean_id = extract_spreadsheet_id(spreadsheet_id)
-    parsed = parse_a1_range(range_notation)
-    sheet_id = await get_sheet_id(access_token, clean_id, parsed.get("sheet_name"))
-
+    clean_id, sheet_id, grid_range = await resolve_range(access_token, spreadsheet_id, range_notation)
     if sheet_id is None:
         return {"error": "Sheet not found"}
 
-    grid_range = build_grid_range(
-        sheet_id,
-        parsed.get("start_row"),
-        parsed.get("end_row"),
-        parsed.get("start_col"),
-        parsed.get("end_col"),
-    )
-
     protected_range = {"range": grid_range, "warningOnly": warning_only}
     if description:
         protected_range["description"] = description
@@ -176,10 +179,14 @@ async def protect_range(
     if "error" in result:
         return result
 
-    pr_id = result.get("replies", [{}])[0].get("addProtectedRange", {}).get("protectedRange", {}).get("protectedRangeId")
+    if result.get("queued"):
+        return {"queued": True, "message": f"Queued protection of {range_notation}"}
+
+    pr_id = dig(result, "replies", 0, "addProtectedRange", "protectedRange", "protectedRangeId")
     return {"success": True, "protected_range_id": pr_id, "message": f"Protected {range_notation}"}
 
 
+@read_cached
 async def list_protected_ranges(
     access_token: str,
     spreadsheet_id: str,
@@ -195,36 +202,28 @@ async def list_protected_ranges(
     Returns:
         Dict with protected ranges list, or error
     """
-    import httpx
-    _check_httpx()
-
     clean_id = extract_spreadsheet_id(spreadsheet_id)
     headers = {"Authorization": f"Bearer {access_token}"}
-    url = f"{SHEETS_API_BASE}/{clean_id}?fields=sheets(properties,protectedRanges)"
+    url = f"{SHEETS_API_BASE}/{clean_id}?fields={_PROTECTED_RANGE_FIELDS}"
+    if sheet_name:
+        # Let the server drop the other sheets
+        sheet_range = quote(f"'{sheet_name}'", safe='')
+        url += f"&ranges={sheet_range}"
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.get(url, headers=headers)
+    protections = []
+
+    # Streamed so that only one sheet's entry is held in memory at a time
+    async with api_stream("GET", url, headers=headers) as response:
         if response.status_code != 200:
             return {"error": "Failed to get protected ranges"}
 
-        data = response.json()
-        protections = []
-
-        for sheet in data.get("sheets", []):
+        async for sheet in iter_json_items(response, "sheets.item"):
             sname = sheet.get("properties", {}).get("title")
-            if sheet_name and sname != sheet_name:
-                continue
 
             for pr in sheet.get("protectedRanges", []):
-                protections.append({
-                    "protected_range_id": pr.get("protectedRangeId"),
-                    "description": pr.get("description", ""),
-                    "warning_only": pr.get("warningOnly", False),
-                    "sheet": sname,
-                    "range": pr.get("range"),
-                })
+                protections.append(_protected_range_summary(pr, sname))
 
-        return {"protected_ranges": protections, "count": len(protections)}
+    return {"protected_ranges": protections, "count": len(protections)}
 
 
 async def update_protected_range(
@@ -248,6 +247,9 @@ async def update_protected_range(
     Returns:
         Dict with success status, or error
     """
+    if description is None and warning_only is None and editors is None:
+        return {"error": "No updates specified"}
+
     clean_id = extract_spreadsheet_id(spreadsheet_id)
 
     update = {"protectedRangeId": protected_range_id}
@@ -263,9 +265,6 @@ async def update_protected_range(
         update["editors"] = {"users": editors}
         fields.append("editors")
 
-    if not fields:
-        return {"error": "No updates specified"}
-
     requests = [{
         "updateProtectedRange": {
             "protectedRange": update,
@@ -346,17 +345,10 @@ async def protect_sheet(
         protected_range["editors"] = {"users": editors}
 
     if unprotected_ranges:
-        unprotected = []
-        for r in unprotected_ranges:
-            parsed = parse_a1_range(r)
-            unprotected.append(build_grid_range(
-                sheet_id,
-                parsed.get("start_row"),
-                parsed.get("end_row"),
-                parsed.get("start_col"),
-                parsed.get("end_col"),
-            ))
-        protected_range["unprotectedRanges"] = unprotected
+        protected_range["unprotectedRanges"] = [
+            build_grid_range(sheet_id, p.start_row, p.end_row, p.start_col, p.end_col)
+            for p in map(parse_a1_range, unprotected_ranges)
+        ]
 
     requests = [{"addProtectedRange": {"protectedRange": protected_range}}]
 
@@ -364,5 +356,50 @@ async def protect_sheet(
     if "error" in result:
         return result
 
-    pr_id = result.get("replies", [{}])[0].get("addProtectedRange", {}).get("protectedRange", {}).get("protectedRangeId")
+    if result.get("queued"):
+        return {"queued": True, "message": f"Queued protection of sheet '{sheet_name}'"}
+
+    pr_id = dig(result, "replies", 0, "addProtectedRange", "protectedRange", "protectedRangeId")
     return {"success": True, "protected_range_id": pr_id, "message": f"Protected sheet '{sheet_name}'"}
+
+
+# =============================================================================
+# Combined Listing
+# =============================================================================
+
+@read_cached
+async def list_ranges_and_protections(access_token: str, spreadsheet_id: str) -> dict:
+    """List named ranges and protected ranges with a single request.
+
+    Prefer this over calling list_named_ranges and list_protected_ranges
+    one after the other when both are needed.
+
+    Args:
+        access_token: Valid Google OAuth access token
+        spreadsheet_id: Google Sheets ID
+
+    Returns:
+        Dict with named_ranges and protected_ranges lists, or error
+    """
+    clean_id = extract_spreadsheet_id(spreadsheet_id)
+    headers = {"Authorization": f"Bearer {access_token}"}
+    url = f"{SHEETS_API_BASE}/{clean_id}?fields={_NAMED_RANGE_FIELDS},{_PROTECTED_RANGE_FIELDS}"
+
+    response = await api_request("GET", url, headers=headers)
+    if response.status_code != 200:
+        return {"error": "Failed to get named and protected ranges"}
+
+    data = json_loads(response.content)
+    named = [_named_range_summary(nr) for nr in data.get("namedRanges", [])]
+    protections = [
+        _protected_range_summary(pr, sheet.get("properties", {}).get("title"))
+        for sheet in data.get("sheets", [])
+        for pr in sheet.get("protectedRanges", [])
+    ]
+
+    return {
+        "named_ranges": named,
+        "protected_ranges": protections,
+        "named_range_count": len(named),
+        "protected_range_count": len(protections),
+    }
@@ -3,24 +3,35 @@
 import logging
 from typing import Optional
 
-try:
-    import httpx
-except ImportError:
-    httpx = None  # type: ignore
-
 from tool_master.tools.google._sheets_utils import (
-    SHEETS_API_BASE,
     extract_spreadsheet_id,
     get_sheet_id,
     batch_update,
+    dig,
     parse_column_range,
     parse_row_range,
-    _check_httpx,
+    resolve_range,
+    remember_sheet_id,
 )
 
 logger = logging.getLogger(__name__)
 
 
+def _dimension_range(sheet_id: int, dimension: str, start: int, end: int) -> dict:
+    """DimensionRange for rows or columns [start, end), 0-indexed."""
+    return {"sheetId": sheet_id, "dimension": dimension, "startIndex": start, "endIndex": end}
+
+
+def _freeze_request(sheet_id: int, count_field: str, count: int) -> dict:
+    """updateSheetProperties request setting frozenRowCount or frozenColumnCount."""
+    return {
+        "updateSheetProperties": {
+            "properties": {"sheetId": sheet_id, "gridProperties": {count_field: count}},
+            "fields": f"gridProperties.{count_field}",
+        }
+    }
+
+
 # =============================================================================
 # Sheet Tab Management
 # =============================================================================
@@ -57,9 +68,14 @@ async def add_sheet(
     result = await batch_update(access_token, clean_id, requests)
     if "error" in result:
         return result
+    if result.get("queued"):
+        # Inside a SheetsBatch the new sheet's ID is only known after the flush
+        return {"queued": True, "title": sheet_name, "message": f"Queued sheet '{sheet_name}'"}
 
-    replies = result.get("replies", [{}])
-    props = replies[0].get("addSheet", {}).get("properties", {})
+    props = dig(result, "replies", 0, "addSheet", "properties", default={})
+    if props.get("sheetId") is not None:
+        # Adding a sheet clears the spreadsheet's cached IDs; start again with this one
+        remember_sheet_id(access_token, clean_id, props.get("title", sheet_name), props["sheetId"])
 
     return {
         "sheet_id": props.get("sheetId"),
@@ -132,6 +148,8 @@ async def rename_sheet(
     result = await batch_update(access_token, clean_id, requests)
     if "error" in result:
         return result
+    if not result.get("queued"):
+        remember_sheet_id(access_token, clean_id, new_name, sheet_id)
 
     return {"success": True, "message": f"Renamed '{old_name}' to '{new_name}'"}
 
@@ -167,12 +185,7 @@ async def insert_rows(
 
     requests = [{
         "insertDimension": {
-            "range": {
-                "sheetId": sheet_id,
-                "dimension": "ROWS",
-                "startIndex": start_row - 1,  # 0-indexed
-                "endIndex": start_row - 1 + num_rows,
-            },
+            "range": _dimension_range(sheet_id, "ROWS", start_row - 1, start_row - 1 + num_rows),
             "inheritFromBefore": start_row > 1,
         }
     }]
@@ -211,12 +224,7 @@ async def delete_rows(
 
     requests = [{
         "deleteDimension": {
-            "range": {
-                "sheetId": sheet_id,
-                "dimension": "ROWS",
-                "startIndex": start_row - 1,
-                "endIndex": end_row,
-            }
+            "range": _dimension_range(sheet_id, "ROWS", start_row - 1, end_row),
         }
     }]
 
@@ -261,12 +269,7 @@ async def insert_columns(
 
     requests = [{
         "insertDimension": {
-            "range": {
-                "sheetId": sheet_id,
-                "dimension": "COLUMNS",
-                "startIndex": start_idx,
-                "endIndex": start_idx + num_columns,
-            },
+            "range": _dimension_range(sheet_id, "COLUMNS", start_idx, start_idx + num_columns),
             "inheritFromBefore": start_idx > 0,
         }
     }]
@@ -308,12 +311,7 @@ async def delete_columns(
 
     requests = [{
         "deleteDimension": {
-            "range": {
-                "sheetId": sheet_id,
-                "dimension": "COLUMNS",
-                "startIndex": start_idx,
-                "endIndex": end_idx,
-            }
+            "range": _dimension_range(sheet_id, "COLUMNS", start_idx, end_idx),
         }
     }]
 
@@ -351,15 +349,7 @@ async def freeze_rows(
     if sheet_id is None:
         return {"error": "Sheet not found"}
 
-    requests = [{
-        "updateSheetProperties": {
-            "properties": {
-                "sheetId": sheet_id,
-                "gridProperties": {"frozenRowCount": num_rows},
-            },
-            "fields": "gridProperties.frozenRowCount",
-        }
-    }]
+    requests = [_freeze_request(sheet_id, "frozenRowCount", num_rows)]
 
     result = await batch_update(access_token, clean_id, requests)
     if "error" in result:
@@ -391,15 +381,7 @@ async def freeze_columns(
     if sheet_id is None:
         return {"error": "Sheet not found"}
 
-    requests = [{
-        "updateSheetProperties": {
-            "properties": {
-                "sheetId": sheet_id,
-                "gridProperties": {"frozenColumnCount": num_columns},
-            },
-            "fields": "gridProperties.frozenColumnCount",
-        }
-    }]
+    requests = [_freeze_request(sheet_id, "frozenColumnCount", num_columns)]
 
     result = await batch_update(access_token, clean_id, requests)
     if "error" in result:
@@ -438,12 +420,7 @@ async def auto_resize_columns(
 
     requests = [{
         "autoResizeDimensions": {
-            "dimensions": {
-                "sheetId": sheet_id,
-                "dimension": "COLUMNS",
-                "startIndex": start_idx,
-                "endIndex": end_idx,
-            }
+            "dimensions": _dimension_range(sheet_id, "COLUMNS", start_idx, end_idx),
         }
     }]
 
@@ -473,23 +450,10 @@ async def sort_range(
     Returns:
         Dict with success status, or error
     """
-    from tool_master.tools.google._sheets_utils import parse_a1_range, build_grid_range
-
-    clean_id = extract_spreadsheet_id(spreadsheet_id)
-    parsed = parse_a1_range(range_notation)
-    sheet_id = await get_sheet_id(access_token, clean_id, parsed.get("sheet_name"))
-
+    clean_id, sheet_id, grid_range = await resolve_range(access_token, spreadsheet_id, range_notation)
     if sheet_id is None:
         return {"error": "Sheet not found"}
 
-    grid_range = build_grid_range(
-        sheet_id,
-        parsed.get("start_row"),
-        parsed.get("end_row"),
-        parsed.get("start_col"),
-        parsed.get("end_col"),
-    )
-
     requests = [{
         "sortRange": {
             "range": grid_range,
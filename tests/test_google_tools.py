@@ -0,0 +1,1165 @@
+"""Tests for Google tool helpers and request validation."""
+
+import asyncio
+import json
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+
+from tool_master.tools.google import (
+    _http,
+    _sheets_utils,
+    calendar_impl,
+    sheets_advanced,
+    sheets_charts,
+    sheets_core,
+    sheets_filters,
+    sheets_formatting,
+    sheets_protection,
+    sheets_structure,
+)
+from tool_master.tools.google._sheets_utils import A1Range, parse_a1_range
+
+
+@pytest.fixture
+def mock_sheets_api(monkeypatch):
+    """Route the shared Sheets client through a MockTransport.
+
+    Tests register a handler by calling the fixture; the requests seen by
+    the transport are collected in ``calls``.
+    """
+    calls = []
+    monkeypatch.setattr(_sheets_utils, "READ_REQUESTS_PER_MINUTE", 1000)
+    monkeypatch.setattr(_sheets_utils, "WRITE_REQUESTS_PER_MINUTE", 1000)
+
+    def install(handler):
+        def transport_handler(request):
+            calls.append(request)
+            return handler(request)
+
+        loop = asyncio.get_running_loop()
+        _http._clients[loop] = httpx.AsyncClient(
+            transport=httpx.MockTransport(transport_handler)
+        )
+        return calls
+
+    yield install
+    _http._clients.clear()
+    _sheets_utils._sheet_id_cache.clear()
+    _sheets_utils._read_cache.clear()
+    _sheets_utils._read_generations.clear()
+    _sheets_utils._rate_limiters.clear()
+
+
+class TestParseA1Range:
+    def test_full_range_with_sheet(self):
+        parsed = parse_a1_range("'My Sheet'!B2:D10")
+        assert parsed == A1Range("My Sheet", 1, 10, 1, 4)
+        assert parsed.sheet_name == "My Sheet"
+
+    def test_single_cell(self):
+        sheet_name, start_row, end_row, start_col, end_col = parse_a1_range("C5")
+        assert sheet_name is None
+        assert (start_row, end_row, start_col, end_col) == (4, 5, 2, 3)
+
+    def test_column_only_range_leaves_rows_unset(self):
+        parsed = parse_a1_range("A:C")
+        assert parsed.start_row is None
+        assert parsed.end_col is None
+
+
+class TestColumnLetter:
+    @pytest.mark.parametrize("index,letter", [(0, "A"), (25, "Z"), (26, "AA"), (701, "ZZ"), (702, "AAA")])
+    def test_matches_index_to_col(self, index, letter):
+        assert _sheets_utils.column_letter(index) == letter
+
+
+class TestParseColors:
+    @pytest.mark.parametrize("color,expected", [
+        ("red", {"red": 1.0}),
+        ("#00FF00", {"green": 1.0}),
+        ("black", {"red": 0.0}),
+        ("#0000ff80", {"blue": 1.0, "alpha": 128 / 255}),
+    ])
+    def test_omits_zero_channels(self, color, expected):
+        assert _sheets_utils.parse_color(color) == expected
+
+    def test_matches_parse_color(self):
+        inputs = ("blue", "#ff8800", " Red ", "nonsense")
+        assert _sheets_utils.parse_colors(*inputs) == [_sheets_utils.parse_color(c) for c in inputs]
+
+
+class TestJsonHelpers:
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_round_trip(self, monkeypatch, use_orjson):
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(_http, "orjson", None)
+        body = {"requests": [{"title": "Café", "rows": [1, 2.5, None]}]}
+        encoded = _http.json_dumps(body)
+        assert isinstance(encoded, bytes)
+        assert _http.json_loads(encoded) == body
+
+
+class TestDig:
+    def test_follows_keys_and_indexes(self):
+        result = {"replies": [{"addChart": {"chart": {"chartId": 5}}}]}
+        assert _sheets_utils.dig(result, "replies", 0, "addChart", "chart", "chartId") == 5
+
+    @pytest.mark.parametrize("result", [{}, {"replies": []}, {"replies": [{}]}, {"replies": None}])
+    def test_missing_path_returns_default(self, result):
+        assert _sheets_utils.dig(result, "replies", 0, "addChart", "chart", "chartId") is None
+        assert _sheets_utils.dig(result, "replies", 0, "findReplace", default={}) == {}
+
+
+class TestApiErrorMessage:
+    @pytest.mark.parametrize("body,expected", [
+        (b'{"error": {"message": "Quota exceeded"}}', "Quota exceeded"),
+        (b"", "fallback"),
+        (b"<html>Bad Gateway</html>", "fallback"),
+        (b'{"error": "string"}', "fallback"),
+    ])
+    def test_extracts_message_or_default(self, body, expected):
+        response = httpx.Response(500, content=body)
+        assert _sheets_utils.api_error_message(response, "fallback") == expected
+
+
+class TestEnumValidation:
+    @pytest.mark.asyncio
+    async def test_copy_paste_rejects_unknown_paste_type(self):
+        result = await sheets_advanced.copy_paste(
+            "token", "sheet-id", "A1:B2", "D1:E2", paste_type="everything"
+        )
+        assert "error" in result
+        assert "paste_type" in result["error"]
+
+    @pytest.mark.asyncio
+    async def test_share_calendar_rejects_unknown_role(self):
+        result = await calendar_impl.share_calendar(
+            "token", "cal-id", email="a@example.com", role="owner"
+        )
+        assert "error" in result
+        assert "role" in result["error"]
+
+
+class TestSharedClient:
+    @pytest.mark.asyncio
+    async def test_get_client_is_reused_within_loop(self):
+        try:
+            assert _http.get_client() is _http.get_client()
+        finally:
+            await _http.close_client()
+
+    @pytest.mark.asyncio
+    async def test_read_sheet_uses_shared_client(self, mock_sheets_api):
+        calls = mock_sheets_api(
+            lambda request: httpx.Response(200, json={"range": "Sheet1!A1:B1", "values": [["a", "b"]]})
+        )
+        first = await sheets_core.read_sheet("token", "sheet-id", "Sheet1!A1:B1")
+        second = await sheets_core.read_sheet("other-token", "sheet-id", "Sheet1!A1:B1")
+        assert first["values"] == [["a", "b"]]
+        assert first == second
+        assert len(calls) == 2
+        assert calls[0].headers["Authorization"] == "Bearer token"
+        assert "valueRenderOption" not in calls[0].url.params
+
+    @pytest.mark.asyncio
+    async def test_read_sheet_unformatted_values(self, mock_sheets_api):
+        calls = mock_sheets_api(lambda request: httpx.Response(200, json={"values": [[1, 2.5, True]]}))
+        result = await sheets_core.read_sheet("token", "sheet-id", "A1:C1", value_render_option="UNFORMATTED_VALUE")
+        assert result["values"] == [[1, 2.5, True]]
+        assert calls[0].url.params["valueRenderOption"] == "UNFORMATTED_VALUE"
+
+
+class TestReadCache:
+    @pytest.mark.asyncio
+    async def test_reads_are_cached_until_a_write(self, mock_sheets_api):
+        def handler(request):
+            if request.method == "PUT":
+                return httpx.Response(200, json={"updatedCells": 1})
+            return httpx.Response(200, json={"values": [[str(len(calls))]]})
+        calls = mock_sheets_api(handler)
+
+        first = await sheets_core.read_sheet("token", "sheet-id", "A1")
+        again = await sheets_core.read_sheet("token", "https://docs.google.com/spreadsheets/d/sheet-id/edit", "A1")
+        await sheets_core.write_to_sheet("token", "sheet-id", "A1", [["x"]])
+        after_write = await sheets_core.read_sheet("token", "sheet-id", "A1")
+
+        assert again == first
+        assert after_write["values"] == [["3"]]
+        assert [request.method for request in calls] == ["GET", "PUT", "GET"]
+
+    @pytest.mark.asyncio
+    async def test_hits_are_copies(self, mock_sheets_api):
+        mock_sheets_api(lambda request: httpx.Response(200, json={"values": [["a"]]}))
+
+        first = await sheets_core.read_sheet("token", "sheet-id", "A1")
+        first["values"].append(["changed"])
+        second = await sheets_core.read_sheet("token", "sheet-id", "A1")
+
+        assert second["values"] == [["a"]]
+
+    @pytest.mark.asyncio
+    async def test_read_overlapping_a_write_is_not_cached(self, mock_sheets_api):
+        cell = {"value": "old"}
+        read_started = asyncio.Event()
+        write_done = asyncio.Event()
+
+        async def handler(request):
+            if request.method == "PUT":
+                cell["value"] = "new"
+                return httpx.Response(200, json={"updatedCells": 1})
+            body = {"values": [[cell["value"]]]}
+            if not read_started.is_set():
+                # The first read answers with pre-write data after the write lands
+                read_started.set()
+                await write_done.wait()
+            return httpx.Response(200, json=body)
+        calls = mock_sheets_api(handler)
+
+        async def write():
+            await read_started.wait()
+            await sheets_core.write_to_sheet("token", "sheet-id", "A1", [["new"]])
+            write_done.set()
+
+        slow_read, _ = await asyncio.gather(sheets_core.read_sheet("token", "sheet-id", "A1"), write())
+        later = await sheets_core.read_sheet("token", "sheet-id", "A1")
+
+        assert slow_read["values"] == [["old"]]
+        assert later["values"] == [["new"]]
+        assert len(calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self, mock_sheets_api):
+        calls = mock_sheets_api(lambda request: httpx.Response(404))
+
+        await sheets_charts.list_charts("token", "sheet-id")
+        result = await sheets_charts.list_charts("token", "sheet-id")
+
+        assert "error" in result
+        assert len(calls) == 2
+
+
+class TestCalendarSharedClient:
+    @pytest.mark.asyncio
+    async def test_calendar_calls_reuse_the_shared_client(self, mock_sheets_api):
+        calls = mock_sheets_api(lambda request: httpx.Response(200, json={"items": [{"id": "c1", "summary": "Team"}]}))
+
+        first = await calendar_impl.list_calendars("token")
+        await calendar_impl.list_calendars("token")
+
+        assert first["calendars"][0]["calendar_id"] == "c1"
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_non_json_error_body_is_reported(self, mock_sheets_api):
+        mock_sheets_api(lambda request: httpx.Response(502, text="<html>Bad Gateway</html>"))
+
+        assert await calendar_impl.list_calendars("token") == {"error": "HTTP 502"}
+
+
+class TestIterSheetRows:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("use_ijson", [True, False])
+    async def test_yields_rows(self, mock_sheets_api, monkeypatch, use_ijson):
+        if use_ijson:
+            pytest.importorskip("ijson")
+        else:
+            monkeypatch.setattr(_sheets_utils, "ijson", None)
+        mock_sheets_api(lambda request: httpx.Response(
+            200, json={"range": "Sheet1!A1:B3", "values": [["a", 1.5], ["b"], []]}
+        ))
+        rows = [row async for row in sheets_core.iter_sheet_rows("token", "sheet-id", "Sheet1!A1:B3")]
+        assert rows == [["a", 1.5], ["b"], []]
+
+    @pytest.mark.asyncio
+    async def test_error_response_raises(self, mock_sheets_api):
+        mock_sheets_api(lambda request: httpx.Response(400, json={"error": {"message": "Bad range"}}))
+        with pytest.raises(RuntimeError, match="Bad range"):
+            async for _ in sheets_core.iter_sheet_rows("token", "sheet-id", "Nope!A1"):
+                pass
+
+
+class TestApiRequest:
+    @pytest.mark.asyncio
+    async def test_reads_and_writes_use_separate_buckets(self, mock_sheets_api, monkeypatch):
+        calls = mock_sheets_api(lambda request: httpx.Response(200, json={}))
+        monkeypatch.setattr(_sheets_utils, "WRITE_REQUESTS_PER_MINUTE", 1)
+        headers = {"Authorization": "Bearer a"}
+        await _sheets_utils.api_request("POST", "https://sheets.test/x", headers=headers)
+
+        # The token's write bucket is now empty; its reads must not wait on it
+        await asyncio.wait_for(_sheets_utils.api_request("GET", "https://sheets.test/x", headers=headers), 1)
+        assert [c.method for c in calls] == ["POST", "GET"]
+        assert set(_sheets_utils._rate_limiters) == {("Bearer a", False), ("Bearer a", True)}
+
+    @pytest.mark.asyncio
+    async def test_each_token_has_its_own_buckets(self, mock_sheets_api, monkeypatch):
+        calls = mock_sheets_api(lambda request: httpx.Response(200, json={}))
+        monkeypatch.setattr(_sheets_utils, "WRITE_REQUESTS_PER_MINUTE", 1)
+        await _sheets_utils.api_request("POST", "https://sheets.test/x", headers={"Authorization": "Bearer a"})
+
+        # User a's write bucket is now empty; user b must not wait on it
+        await asyncio.wait_for(
+            _sheets_utils.api_request("POST", "https://sheets.test/x", headers={"Authorization": "Bearer b"}), 1
+        )
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_retries_rate_limited_responses(self, mock_sheets_api, monkeypatch):
+        monkeypatch.setattr(_sheets_utils.random, "uniform", lambda a, b: 0)
+        statuses = iter([429, 503, 200])
+        calls = mock_sheets_api(lambda request: httpx.Response(next(statuses), json={}))
+
+        response = await _sheets_utils.api_request("GET", "https://sheets.test/x")
+
+        assert response.status_code == 200
+        assert len(calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self, mock_sheets_api, monkeypatch):
+        monkeypatch.setattr(_sheets_utils.random, "uniform", lambda a, b: 0)
+        calls = mock_sheets_api(lambda request: httpx.Response(429, json={}))
+
+        response = await _sheets_utils.api_request("GET", "https://sheets.test/x")
+
+        assert response.status_code == 429
+        assert len(calls) == _sheets_utils.MAX_ATTEMPTS
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("method,attempts", [("GET", 2), ("POST", 1)])
+    async def test_server_errors_retried_for_reads_only(self, mock_sheets_api, monkeypatch, method, attempts):
+        monkeypatch.setattr(_sheets_utils.random, "uniform", lambda a, b: 0)
+        statuses = iter([500, 200])
+        calls = mock_sheets_api(lambda request: httpx.Response(next(statuses), json={}))
+
+        await _sheets_utils.api_request(method, "https://sheets.test/x")
+
+        assert len(calls) == attempts
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("method,attempts", [("GET", 2), ("PUT", 2), ("POST", 1)])
+    async def test_unavailable_retried_for_idempotent_requests_only(
+        self, mock_sheets_api, monkeypatch, method, attempts
+    ):
+        monkeypatch.setattr(_sheets_utils.random, "uniform", lambda a, b: 0)
+        statuses = iter([503, 200])
+        calls = mock_sheets_api(lambda request: httpx.Response(next(statuses), json={}))
+
+        await _sheets_utils.api_request(method, "https://sheets.test/x")
+
+        assert len(calls) == attempts
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("request_kind,attempts", [("repeatCell", 2), ("addSheet", 1)])
+    async def test_batch_update_retries_unavailable_only_when_idempotent(
+        self, mock_sheets_api, monkeypatch, request_kind, attempts
+    ):
+        monkeypatch.setattr(_sheets_utils.random, "uniform", lambda a, b: 0)
+        statuses = iter([503, 200])
+        calls = mock_sheets_api(lambda request: httpx.Response(next(statuses), json={"replies": [{}]}))
+
+        await _sheets_utils.batch_update("token", "sheet-id", [{request_kind: {}}])
+
+        assert len(calls) == attempts
+
+    @pytest.mark.asyncio
+    async def test_honours_retry_after(self, mock_sheets_api, monkeypatch):
+        monkeypatch.setattr(_sheets_utils.random, "uniform", lambda a, b: 0)
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        monkeypatch.setattr(_sheets_utils.asyncio, "sleep", fake_sleep)
+        responses = iter([
+            httpx.Response(429, headers={"Retry-After": "7"}),
+            httpx.Response(503, headers={"Retry-After": "3600"}),
+            httpx.Response(200),
+        ])
+        mock_sheets_api(lambda request: next(responses))
+
+        response = await _sheets_utils.api_request("GET", "https://sheets.test/x")
+
+        assert response.status_code == 200
+        assert sleeps == [7.0, _sheets_utils.MAX_RETRY_AFTER]
+
+    @pytest.mark.asyncio
+    async def test_token_bucket_waits_when_empty(self, monkeypatch):
+        bucket = _sheets_utils.TokenBucket(2, period=1.0)
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+            bucket._tokens += 1
+
+        monkeypatch.setattr(_sheets_utils.asyncio, "sleep", fake_sleep)
+        for _ in range(3):
+            await bucket.acquire()
+        assert len(sleeps) == 1
+
+
+class TestSheetIdCache:
+    @staticmethod
+    def _handler(request):
+        if request.url.path.endswith(":batchUpdate"):
+            return httpx.Response(200, json={"replies": [{}]})
+        return httpx.Response(200, json={"sheets": [
+            {"properties": {"title": "Data", "sheetId": 7}},
+        ]})
+
+    @pytest.mark.asyncio
+    async def test_repeated_lookups_hit_cache(self, mock_sheets_api):
+        calls = mock_sheets_api(self._handler)
+        assert await _sheets_utils.get_sheet_id("token", "ss", "Data") == 7
+        assert await _sheets_utils.get_sheet_id("token", "ss", "Data") == 7
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_new_and_renamed_sheets_are_cached_from_the_reply(self, mock_sheets_api):
+        def handler(request):
+            if "addSheet" in json.loads(request.content)["requests"][0]:
+                return httpx.Response(200, json={"replies": [{"addSheet": {"properties": {"title": "New", "sheetId": 42}}}]})
+            return httpx.Response(200, json={"replies": [{}]})
+
+        calls = mock_sheets_api(handler)
+        await sheets_structure.add_sheet("token", "ss", "New")
+        await sheets_structure.rename_sheet("token", "ss", "New", "Renamed")
+
+        assert await _sheets_utils.get_sheet_id("token", "ss", "Renamed") == 42
+        assert [c.method for c in calls] == ["POST", "POST"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_request(self, mock_sheets_api):
+        calls = mock_sheets_api(self._handler)
+        results = await asyncio.gather(*[
+            _sheets_utils.get_sheet_id("token", "ss", "Data") for _ in range(3)
+        ])
+        assert results == [7, 7, 7]
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_entry_is_evicted(self, mock_sheets_api, monkeypatch):
+        monkeypatch.setattr(_sheets_utils, "SHEET_ID_CACHE_SIZE", 4)
+        calls = mock_sheets_api(self._handler)
+        for spreadsheet in ("a", "b", "a", "c"):
+            await _sheets_utils.get_sheet_id("token", spreadsheet, "Data")
+        assert list(_sheets_utils._sheet_id_cache) == [
+            ("b", "Data", "token"), ("a", "Data", "token"), ("c", None, "token"), ("c", "Data", "token"),
+        ]
+        assert len(calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_miss_caches_every_sheet(self, mock_sheets_api):
+        calls = mock_sheets_api(lambda request: httpx.Response(200, json={"sheets": [
+            {"properties": {"title": "First", "sheetId": 0}},
+            {"properties": {"title": "Second", "sheetId": 12}},
+        ]}))
+        results = await asyncio.gather(
+            _sheets_utils.get_sheet_id("token", "ss", "Second"),
+            _sheets_utils.get_sheet_id("token", "ss", "First"),
+        )
+        assert results == [12, 0]
+        assert await _sheets_utils.get_sheet_id("token", "ss") == 0
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_missing_sheet_is_remembered_briefly(self, mock_sheets_api):
+        calls = mock_sheets_api(self._handler)
+        assert await _sheets_utils.get_sheet_id("token", "ss", "Gone") is None
+        assert await _sheets_utils.get_sheet_id("token", "ss", "Gone") is None
+        assert len(calls) == 1
+
+        expires, _ = _sheets_utils._sheet_id_cache[("ss", "Gone", "token")]
+        assert expires - _sheets_utils.time.monotonic() <= _sheets_utils.SHEET_NOT_FOUND_TTL
+        _sheets_utils._sheet_id_cache[("ss", "Gone", "token")] = (0.0, None)
+        assert await _sheets_utils.get_sheet_id("token", "ss", "Gone") is None
+        assert len(calls) == 2
+        assert calls[0].url.params["fields"] == "sheets.properties(sheetId,title)"
+
+    @pytest.mark.asyncio
+    async def test_prefetch_warms_cache(self, mock_sheets_api):
+        calls = mock_sheets_api(self._handler)
+        assert _sheets_utils.cached_sheet_id("token", "ss", "Data") is None
+        assert await _sheets_utils.prefetch_sheet_ids("token", "ss") == [("Data", 7)]
+        assert _sheets_utils.cached_sheet_id("token", "ss", "Data") == 7
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_lookups_are_not_shared_between_tokens(self, mock_sheets_api):
+        def handler(request):
+            if request.headers["Authorization"] == "Bearer no-access":
+                return httpx.Response(403, json={"error": {"message": "Forbidden"}})
+            return self._handler(request)
+        calls = mock_sheets_api(handler)
+
+        results = await asyncio.gather(
+            _sheets_utils.get_sheet_id("no-access", "ss", "Data"),
+            _sheets_utils.get_sheet_id("token", "ss", "Data"),
+        )
+
+        assert results == [None, 7]
+        assert len(calls) == 2
+        assert _sheets_utils.cached_sheet_id("no-access", "ss", "Data") is None
+
+    @pytest.mark.asyncio
+    async def test_sheet_layout_changes_invalidate(self, mock_sheets_api):
+        calls = mock_sheets_api(self._handler)
+        await _sheets_utils.get_sheet_id("token", "ss", "Data")
+
+        # Formatting-only property updates keep the cache
+        await _sheets_utils.batch_update("token", "ss", [
+            {"updateSheetProperties": {"properties": {"sheetId": 7}, "fields": "tabColor"}},
+        ])
+        await _sheets_utils.get_sheet_id("token", "ss", "Data")
+        assert len(calls) == 2
+
+        await _sheets_utils.batch_update("token", "ss", [{"deleteSheet": {"sheetId": 7}}])
+        await _sheets_utils.get_sheet_id("token", "ss", "Data")
+        assert len(calls) == 4
+
+
+class TestResolveRange:
+    @pytest.mark.asyncio
+    async def test_formatting_request_uses_resolved_grid_range(self, mock_sheets_api):
+        def handler(request):
+            if request.url.path.endswith(":batchUpdate"):
+                return httpx.Response(200, json={"replies": [{}]})
+            return httpx.Response(200, json={"sheets": [{"properties": {"title": "Data", "sheetId": 9}}]})
+
+        calls = mock_sheets_api(handler)
+        result = await sheets_formatting.set_text_color("token", "ss", "Data!B2:C4", "blue")
+
+        assert result["success"] is True
+        sent = json.loads(calls[-1].content)["requests"][0]["repeatCell"]["range"]
+        assert sent == {"sheetId": 9, "startRowIndex": 1, "endRowIndex": 4, "startColumnIndex": 1, "endColumnIndex": 3}
+
+    @pytest.mark.asyncio
+    async def test_missing_sheet(self, mock_sheets_api):
+        mock_sheets_api(lambda request: httpx.Response(200, json={"sheets": [{"properties": {"title": "Data", "sheetId": 9}}]}))
+        assert await _sheets_utils.resolve_range("token", "ss", "Other!A1") == ("ss", None, None)
+
+
+class TestFormatMany:
+    @pytest.mark.asyncio
+    async def test_merges_ops_into_one_batch_update(self, mock_sheets_api):
+        def handler(request):
+            if request.url.path.endswith(":batchUpdate"):
+                sent = json.loads(request.content)["requests"]
+                return httpx.Response(200, json={"replies": [{} for _ in sent]})
+            return httpx.Response(200, json={"sheets": [{"properties": {"title": "Data", "sheetId": 9}}]})
+
+        calls = mock_sheets_api(handler)
+        results = await sheets_formatting.format_many("token", "ss", [
+            {"op": "set_text_color", "kwargs": {"range_notation": "Data!A1:B2", "color": "red"}},
+            {"op": "set_background_color", "kwargs": {"range_notation": "Data!A1:B2", "color": "blue"}},
+            {"op": "merge_cells", "kwargs": {"range_notation": "Data!C1:D1"}},
+            {"op": "drop_table", "kwargs": {}},
+            {"op": "set_borders", "kwargs": {"colour": "red"}},
+        ])
+
+        assert [r.get("success") for r in results[:3]] == [True, True, True]
+        assert results[3] == {"error": "Unknown formatting op: drop_table"}
+        assert results[4]["error"].startswith("Invalid arguments for set_borders")
+        assert [c.method for c in calls] == ["GET", "POST"]
+        assert len(json.loads(calls[1].content)["requests"]) == 3
+
+
+    @pytest.mark.asyncio
+    async def test_slow_sheet_lookup_does_not_split_the_batch(self, mock_sheets_api):
+        gets = []
+
+        async def handler(request):
+            if request.url.path.endswith(":batchUpdate"):
+                sent = json.loads(request.content)["requests"]
+                return httpx.Response(200, json={"replies": [{} for _ in sent]})
+            gets.append(request)
+            if len(gets) == 2:
+                await asyncio.sleep(0.05)
+            return httpx.Response(200, json={"sheets": [
+                {"properties": {"title": "Fast", "sheetId": 1}},
+                {"properties": {"title": "Slow", "sheetId": 2}},
+            ]})
+
+        calls = mock_sheets_api(handler)
+        results = await sheets_formatting.format_many("token", "ss", [
+            {"op": "merge_cells", "kwargs": {"range_notation": "Fast!A1:B1"}},
+            {"op": "merge_cells", "kwargs": {"range_notation": "Slow!A1:B1"}},
+        ])
+
+        assert all(r.get("success") for r in results)
+        assert [c.method for c in calls].count("POST") == 1
+
+    @pytest.mark.asyncio
+    async def test_malformed_ops_fail_alone(self, mock_sheets_api):
+        def handler(request):
+            if request.url.path.endswith(":batchUpdate"):
+                sent = json.loads(request.content)["requests"]
+                return httpx.Response(200, json={"replies": [{} for _ in sent]})
+            return httpx.Response(200, json={"sheets": [{"properties": {"title": "Data", "sheetId": 9}}]})
+
+        mock_sheets_api(handler)
+        results = await sheets_formatting.format_many("token", "ss", [
+            "merge_cells",
+            {"op": ["merge_cells"]},
+            {"op": "merge_cells", "kwargs": ["Data!A1:B1"]},
+            {"op": "merge_cells", "kwargs": {"range_notation": 123}},
+            {"op": "merge_cells", "kwargs": {"range_notation": "Data!A1:B1"}},
+        ])
+
+        assert ["error" in r for r in results] == [True, True, True, True, False]
+        assert results[-1]["success"] is True
+
+    @pytest.mark.asyncio
+    async def test_batch_format_accepts_tool_arguments(self, mock_sheets_api):
+        def handler(request):
+            if request.url.path.endswith(":batchUpdate"):
+                sent = json.loads(request.content)["requests"]
+                return httpx.Response(200, json={"replies": [{} for _ in sent]})
+            return httpx.Response(200, json={"sheets": [{"properties": {"title": "Data", "sheetId": 9}}]})
+
+        calls = mock_sheets_api(handler)
+        result = await sheets_formatting.batch_format("token", "ss", [
+            {"op": "set_borders", "range": "Data!A1:C3", "sides": "outer"},
+            {"op": "add_note", "cell": "Data!A1", "note": "hi"},
+            {"op": "unknown"},
+        ])
+
+        assert (result["success"], result["applied"], result["failed"]) == (False, 2, 1)
+        assert [c.method for c in calls] == ["GET", "POST"]
+        assert "error" in await sheets_formatting.batch_format("token", "ss", [])
+
+
+class TestFormattingValidation:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("func,kwargs", [
+        (sheets_formatting.set_borders, {"sides": "diagonal"}),
+        (sheets_formatting.set_alignment, {"horizontal": "justify"}),
+        (sheets_formatting.set_alignment, {}),
+        (sheets_formatting.set_text_format, {}),
+        (sheets_filters.conditional_format, {"rule_type": "between"}),
+        (sheets_filters.data_validation, {"validation_type": "email"}),
+        (sheets_filters.data_validation, {"validation_type": "dropdown"}),
+    ])
+    async def test_rejects_bad_options_without_calling_api(self, mock_sheets_api, func, kwargs):
+        calls = mock_sheets_api(lambda request: httpx.Response(500))
+
+        result = await func("token", "ss", "A1:B2", **kwargs)
+
+        assert "error" in result
+        assert calls == []
+
+
+class TestSetBorders:
+    @pytest.mark.asyncio
+    async def test_outer_borders_payload(self, mock_sheets_api):
+        def handler(request):
+            if request.url.path.endswith(":batchUpdate"):
+                return httpx.Response(200, json={"replies": [{}]})
+            return httpx.Response(200, json={"sheets": [{"properties": {"title": "Data", "sheetId": 4}}]})
+
+        calls = mock_sheets_api(handler)
+        result = await sheets_formatting.set_borders("token", "ss", "Data!A1:B2", "thick", "blue", "outer")
+
+        assert result["success"] is True
+        sent = json.loads(calls[-1].content)["requests"][0]["updateBorders"]
+        spec = {"style": "SOLID_THICK", "color": {"blue": 1.0}}
+        assert sent == {
+            "range": {"sheetId": 4, "startRowIndex": 0, "endRowIndex": 2, "startColumnIndex": 0, "endColumnIndex": 2},
+            "top": spec, "bottom": spec, "left": spec, "right": spec,
+        }
+
+
+class TestSheetsBatch:
+    @pytest.mark.asyncio
+    async def test_queued_requests_are_sent_once_on_exit(self, mock_sheets_api):
+        def handler(request):
+            if request.url.path.endswith(":batchUpdate"):
+                sent = json.loads(request.content)["requests"]
+                return httpx.Response(200, json={"replies": [{"n": i} for i in range(len(sent))]})
+            return httpx.Response(200, json={"sheets": [{"properties": {"title": "Data", "sheetId": 3}}]})
+
+        calls = mock_sheets_api(handler)
+        async with _sheets_utils.SheetsBatch("token", "ss") as batch:
+            first = await sheets_advanced.set_tab_color("token", "ss", "Data", "blue")
+            await sheets_advanced.hide_sheet("token", "ss", "Data")
+            assert "error" not in first
+
+        posts = [c for c in calls if c.method == "POST"]
+        assert len(posts) == 1
+        assert len(json.loads(posts[0].content)["requests"]) == 2
+        assert batch.replies == [{"n": 0}, {"n": 1}]
+
+    @pytest.mark.asyncio
+    async def test_calls_reading_replies_report_queued_and_flush_errors_raise(self, mock_sheets_api):
+        def handler(request):
+            if request.url.path.endswith(":batchUpdate"):
+                return httpx.Response(400, json={"error": {"message": "Invalid chart spec"}})
+            return httpx.Response(200, json={"sheets": [{"properties": {"title": "Data", "sheetId": 3}}]})
+
+        mock_sheets_api(handler)
+        with pytest.raises(RuntimeError, match="Invalid chart spec"):
+            async with _sheets_utils.SheetsBatch("token", "ss") as batch:
+                chart = await sheets_charts.create_chart("token", "ss", "Data!A1:B5")
+                slicer = await sheets_advanced.create_slicer("token", "ss", "Data", "A1:B5", 0)
+
+        assert chart == {"queued": True, "message": "Queued column chart"}
+        assert slicer == {"queued": True, "message": "Queued slicer"}
+        assert batch.result == {"error": "batchUpdate failed: Invalid chart spec"}
+
+    @pytest.mark.asyncio
+    async def test_structural_edits_share_one_request(self, mock_sheets_api):
+        def handler(request):
+            if request.url.path.endswith(":batchUpdate"):
+                sent = json.loads(request.content)["requests"]
+                return httpx.Response(200, json={"replies": [{} for _ in sent]})
+            return httpx.Response(200, json={"sheets": [{"properties": {"title": "Data", "sheetId": 3}}]})
+
+        calls = mock_sheets_api(handler)
+        async with _sheets_utils.SheetsBatch("token", "ss"):
+            added = await sheets_structure.add_sheet("token", "ss", "Summary")
+            await sheets_structure.insert_rows("token", "ss", 2, 3, "Data")
+            await sheets_structure.freeze_rows("token", "ss", 1, "Data")
+
+        assert added["queued"] is True
+        posts = [c for c in calls if c.method == "POST"]
+        assert len(posts) == 1
+        sent = json.loads(posts[0].content)["requests"]
+        assert [next(iter(r)) for r in sent] == ["addSheet", "insertDimension", "updateSheetProperties"]
+
+    @pytest.mark.asyncio
+    async def test_nothing_sent_when_block_raises(self, mock_sheets_api):
+        calls = mock_sheets_api(lambda request: httpx.Response(200, json={"replies": []}))
+        with pytest.raises(ValueError):
+            async with _sheets_utils.SheetsBatch("token", "ss"):
+                await _sheets_utils.batch_update("token", "ss", [{"deleteSheet": {"sheetId": 1}}])
+                raise ValueError
+        assert calls == []
+
+
+class TestListFilterViews:
+    @pytest.mark.asyncio
+    async def test_requests_trimmed_mask_and_filters_by_sheet(self, mock_sheets_api):
+        calls = mock_sheets_api(lambda request: httpx.Response(200, json={"sheets": [
+            {"properties": {"title": "A"}, "filterViews": [{"filterViewId": 1, "title": "Open"}]},
+            {"properties": {"title": "B"}, "filterViews": [{"filterViewId": 2, "title": "Done"}]},
+        ]}))
+
+        result = await sheets_filters.list_filter_views("token", "sheet-id", sheet_name="B")
+
+        assert result == {"filter_views": [{"filter_view_id": 2, "title": "Done", "sheet": "B"}], "count": 1}
+        assert calls[0].url.params["fields"] == "sheets(properties.title,filterViews(filterViewId,title))"
+
+
+class TestListProtectedRanges:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("use_ijson", [True, False])
+    async def test_uses_shared_client(self, mock_sheets_api, monkeypatch, use_ijson):
+        if use_ijson:
+            pytest.importorskip("ijson")
+        else:
+            monkeypatch.setattr(_sheets_utils, "ijson", None)
+        calls = mock_sheets_api(lambda request: httpx.Response(200, json={"sheets": [
+            {"properties": {"title": "A"}, "protectedRanges": [{"protectedRangeId": 5, "warningOnly": True}]},
+            {"properties": {"title": "B"}},
+        ]}))
+
+        result = await sheets_protection.list_protected_ranges("token", "ss")
+
+        assert result == {"count": 1, "protected_ranges": [{
+            "protected_range_id": 5, "description": "", "warning_only": True, "sheet": "A", "range": None,
+        }]}
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_sheet_filter_is_sent_to_server(self, mock_sheets_api):
+        calls = mock_sheets_api(lambda request: httpx.Response(200, json={"sheets": [
+            {"properties": {"title": "My Data"}, "protectedRanges": [{"protectedRangeId": 8}]},
+        ]}))
+
+        result = await sheets_protection.list_protected_ranges("token", "ss", sheet_name="My Data")
+
+        assert result["count"] == 1
+        assert calls[0].url.params["ranges"] == "'My Data'"
+
+
+class TestListRangesAndProtections:
+    @pytest.mark.asyncio
+    async def test_one_request_returns_both_lists(self, mock_sheets_api):
+        calls = mock_sheets_api(lambda request: httpx.Response(200, json={
+            "namedRanges": [{"namedRangeId": "n1", "name": "Totals", "range": {"sheetId": 0}}],
+            "sheets": [{"properties": {"title": "A"}, "protectedRanges": [{"protectedRangeId": 3}]}],
+        }))
+
+        result = await sheets_protection.list_ranges_and_protections("token", "ss")
+
+        assert len(calls) == 1
+        assert result["named_ranges"] == [{"named_range_id": "n1", "name": "Totals", "range": {"sheetId": 0}}]
+        assert [p["protected_range_id"] for p in result["protected_ranges"]] == [3]
+        assert (result["named_range_count"], result["protected_range_count"]) == (1, 1)
+        # Only the fields the summaries use are requested, not editor lists
+        assert "editors" not in calls[0].url.params["fields"]
+        assert "protectedRanges(protectedRangeId," in calls[0].url.params["fields"]
+
+
+class TestFindReplaceMany:
+    @pytest.mark.asyncio
+    async def test_sends_all_pairs_in_one_batch_update(self, mock_sheets_api):
+        def handler(request):
+            sent = json.loads(request.content)["requests"]
+            return httpx.Response(200, json={"replies": [
+                {"findReplace": {"occurrencesChanged": i + 1}} for i in range(len(sent))
+            ]})
+
+        calls = mock_sheets_api(handler)
+        result = await sheets_advanced.find_replace_many("token", "ss", [
+            {"find": "a", "replacement": "b"},
+            {"find": "c", "replacement": "d", "match_case": True},
+        ])
+
+        sent = [r["findReplace"] for r in json.loads(calls[0].content)["requests"]]
+        assert len(calls) == 1
+        assert [(r["find"], r["matchCase"], r["allSheets"]) for r in sent] == [("a", False, True), ("c", True, True)]
+        assert result["occurrences_changed"] == 3
+        assert [r["find"] for r in result["results"]] == ["a", "c"]
+
+    @pytest.mark.asyncio
+    async def test_rejects_malformed_pairs(self):
+        result = await sheets_advanced.find_replace_many("token", "ss", [{"find": "a"}])
+        assert "error" in result
+
+
+class TestListPivotTables:
+    RESPONSE = {"sheets": [
+        {"properties": {"title": "Empty"}, "data": [{"rowData": [{"values": [{}, {}]}]}]},
+        {
+            "data": [{
+                "startRow": 2,
+                "startColumn": 1,
+                "rowData": [
+                    {},
+                    {"values": [{}, {}, {"pivotTable": {
+                        "rows": [{"sourceColumnOffset": 0}, {"sourceColumnOffset": 1}],
+                        "values": [{"summarizeFunction": "SUM"}],
+                    }}]},
+                ],
+            }],
+            "properties": {"title": "Report"},
+        },
+    ]}
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("use_ijson", [True, False])
+    async def test_finds_pivots_with_grid_offsets(self, mock_sheets_api, monkeypatch, use_ijson):
+        if use_ijson:
+            pytest.importorskip("ijson")
+        else:
+            monkeypatch.setattr(_sheets_utils, "ijson", None)
+        mock_sheets_api(lambda request: httpx.Response(200, json=self.RESPONSE))
+
+        result = await sheets_charts.list_pivot_tables("token", "sheet-id")
+
+        assert result == {"count": 1, "pivot_tables": [{
+            "sheet": "Report",
+            "anchor_cell": "D4",
+            "row": 4,
+            "column": 4,
+            "row_groups": 2,
+            "column_groups": 0,
+            "values": 1,
+        }]}
+
+
+class TestAddRowToSheet:
+    @pytest.mark.asyncio
+    async def test_concurrent_rows_share_one_append(self, mock_sheets_api):
+        async def handler(request):
+            await asyncio.sleep(0)  # stay in flight like a real request
+            rows = json.loads(request.content)["values"]
+            return httpx.Response(200, json={"updates": {
+                "updatedRange": f"'Log'!A5:C{4 + len(rows)}",
+                "updatedRows": len(rows),
+            }})
+
+        calls = mock_sheets_api(handler)
+        results = await asyncio.gather(*[
+            sheets_core.add_row_to_sheet("token", "ss", [i, "x", "y"], "Log") for i in range(4)
+        ])
+
+        # The first row goes out alone; the rows arriving while it is in flight share one request
+        assert [json.loads(c.content)["values"] for c in calls] == [
+            [[0, "x", "y"]], [[1, "x", "y"], [2, "x", "y"], [3, "x", "y"]],
+        ]
+        assert results[0] == {"updated_range": "'Log'!A5:C5", "updated_rows": 1, "updated_cells": None}
+        assert [r["row_index"] for r in results[1:]] == [0, 1, 2]
+        assert {r["updated_range"] for r in results[1:]} == {"'Log'!A5:C7"}
+
+    @pytest.mark.asyncio
+    async def test_lone_row_is_sent_without_waiting(self, mock_sheets_api, monkeypatch):
+        monkeypatch.setattr(sheets_core, "APPEND_WINDOW", 3600)
+        calls = mock_sheets_api(lambda request: httpx.Response(200, json={"updates": {"updatedRows": 1}}))
+
+        result = await asyncio.wait_for(sheets_core.add_row_to_sheet("token", "ss", [1]), 1)
+
+        assert result["updated_rows"] == 1
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_flush_resolves_waiting_rows(self, mock_sheets_api, monkeypatch):
+        monkeypatch.setattr(sheets_core, "APPEND_WINDOW", 3600)
+        release = asyncio.Event()
+
+        async def handler(request):
+            await release.wait()
+            return httpx.Response(200, json={"updates": {}})
+        mock_sheets_api(handler)
+
+        first = asyncio.create_task(sheets_core.add_row_to_sheet("token", "ss", [1]))
+        await asyncio.sleep(0)
+        waiting = asyncio.create_task(sheets_core.add_row_to_sheet("token", "ss", [2]))
+        await asyncio.sleep(0)
+        (buffer,) = sheets_core._append_buffers.values()
+        buffer.flush_task.cancel()
+
+        result = await asyncio.wait_for(waiting, 1)
+        release.set()
+        await first
+
+        assert "error" in result
+        assert sheets_core._append_buffers == {}
+
+    @pytest.mark.asyncio
+    async def test_error_is_returned_to_every_row(self, mock_sheets_api):
+        mock_sheets_api(lambda request: httpx.Response(400, json={"error": {"message": "Bad sheet"}}))
+        results = await asyncio.gather(*[
+            sheets_core.add_row_to_sheet("token", "ss", [i], "Nope") for i in range(2)
+        ])
+        assert results == [{"error": "Bad sheet"}] * 2
+
+
+class TestSheetsBatchCoalescer:
+    @pytest.mark.asyncio
+    async def test_concurrent_updates_share_one_request(self, mock_sheets_api):
+        def handler(request):
+            sent = json.loads(request.content)["requests"]
+            return httpx.Response(200, json={
+                "spreadsheetId": "ss",
+                "replies": [{"index": i} for i in range(len(sent))],
+            })
+
+        calls = mock_sheets_api(handler)
+        async with _sheets_utils.SheetsBatchCoalescer():
+            results = await asyncio.gather(
+                _sheets_utils.batch_update("token", "ss", [{"a": 1}]),
+                _sheets_utils.batch_update("token", "ss", [{"b": 1}, {"c": 1}]),
+                _sheets_utils.batch_update("token", "ss", [{"d": 1}]),
+            )
+
+        assert len(calls) == 1
+        assert [r["replies"] for r in results] == [
+            [{"index": 0}], [{"index": 1}, {"index": 2}], [{"index": 3}],
+        ]
+
+    @pytest.mark.asyncio
+    async def test_flushes_early_when_full(self, mock_sheets_api):
+        calls = mock_sheets_api(lambda request: httpx.Response(200, json={"replies": [{}, {}]}))
+        async with _sheets_utils.SheetsBatchCoalescer(window=10, max_requests=2):
+            result = await asyncio.wait_for(asyncio.gather(
+                _sheets_utils.batch_update("token", "ss", [{"a": 1}]),
+                _sheets_utils.batch_update("token", "ss", [{"b": 1}]),
+            ), timeout=1)
+        assert len(calls) == 1
+        assert result == [{"replies": [{}]}, {"replies": [{}]}]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_flush_resolves_waiting_callers(self, mock_sheets_api):
+        calls = mock_sheets_api(lambda request: httpx.Response(200, json={"replies": [{}]}))
+        coalescer = _sheets_utils.SheetsBatchCoalescer(window=3600)
+
+        waiting = asyncio.create_task(coalescer.submit("token", "ss", [{"repeatCell": {}}]))
+        await asyncio.sleep(0)
+        (pending,) = coalescer._pending.values()
+        pending.flush_task.cancel()
+
+        result = await asyncio.wait_for(waiting, 1)
+
+        assert "error" in result
+        assert calls == []
+        assert coalescer._pending == {}
+
+
+class TestBatchRead:
+    @pytest.mark.asyncio
+    async def test_reads_all_ranges_in_one_request(self, mock_sheets_api):
+        calls = mock_sheets_api(lambda request: httpx.Response(200, json={"valueRanges": [
+            {"range": "A!A1:B2", "values": [["1", "2"], ["3"]]},
+            {"range": "B!A1:A1"},
+        ]}))
+
+        result = await sheets_core.batch_read("token", "ss", ["A!A1:B2", "B!A1"], major_dimension="COLUMNS")
+
+        assert len(calls) == 1
+        assert calls[0].url.params.get_list("ranges") == ["A!A1:B2", "B!A1"]
+        assert calls[0].url.params["majorDimension"] == "COLUMNS"
+        assert result["range_count"] == 2
+        assert (result["ranges"][0]["row_count"], result["ranges"][0]["col_count"]) == (2, 2)
+        assert result["ranges"][1]["values"] == []
+
+    @pytest.mark.asyncio
+    async def test_rejects_bad_arguments_without_a_request(self, mock_sheets_api):
+        calls = mock_sheets_api(lambda request: httpx.Response(200, json={}))
+
+        assert "error" in await sheets_core.batch_read("token", "ss", [])
+        assert "error" in await sheets_core.batch_read("token", "ss", ["A1"], major_dimension="DIAGONAL")
+        assert calls == []
+
+
+class TestSearchSheets:
+    @staticmethod
+    def _metadata(**row_counts):
+        return {"sheets": [
+            {"properties": {"title": title, "gridProperties": {"rowCount": count}}}
+            for title, count in row_counts.items()
+        ]}
+
+    @pytest.mark.asyncio
+    async def test_searches_all_sheets_in_one_batch_get(self, mock_sheets_api):
+        def handler(request):
+            if request.url.path.endswith("values:batchGet"):
+                return httpx.Response(200, json={"valueRanges": [
+                    {"range": "'One'!A1:B2", "values": [["apple", "pear"], ["Apple pie"]]},
+                    {"range": "'Two'!A1:A1", "values": [["banana"]]},
+                ]})
+            return httpx.Response(200, json=self._metadata(One=100, Two=50))
+
+        calls = mock_sheets_api(handler)
+        result = await sheets_core.search_sheets("token", "sheet-id", "apple")
+
+        assert len(calls) == 2
+        assert calls[1].url.params.get_list("ranges") == ["'One'!1:100", "'Two'!1:50"]
+        assert result["count"] == 2
+        assert [(m["sheet"], m["cell"]) for m in result["matches"]] == [("One", "A1"), ("One", "A2")]
+
+    @pytest.mark.asyncio
+    async def test_reads_rows_in_windows(self, mock_sheets_api):
+        def handler(request):
+            if request.url.path.endswith("values:batchGet"):
+                # Each window ends with a matching row
+                bounds = [r.split("!")[1].split(":") for r in request.url.params.get_list("ranges")]
+                values = [[["x"]] * (int(end) - int(start)) + [["needle"]] for start, end in bounds]
+                return httpx.Response(200, json={"valueRanges": [{"values": v} for v in values]})
+            return httpx.Response(200, json=self._metadata(Big=5, Small=2))
+
+        calls = mock_sheets_api(handler)
+        result = await sheets_core.search_sheets("token", "sheet-id", "needle", chunk_rows=2)
+
+        assert [c.url.params.get_list("ranges") for c in calls[1:]] == [
+            ["'Big'!1:2", "'Small'!1:2"],
+            ["'Big'!3:4"],
+            ["'Big'!5:5"],
+        ]
+        assert [(m["sheet"], m["row"]) for m in result["matches"]] == [
+            ("Big", 2), ("Small", 2), ("Big", 4), ("Big", 5),
+        ]
+
+
+class TestSheetsSchemas:
+    def test_schemas_by_name_covers_every_schema(self):
+        from tool_master.tools.google import SHEETS_SCHEMAS, SHEETS_SCHEMAS_BY_NAME
+
+        assert list(SHEETS_SCHEMAS_BY_NAME) == [s.name for s in SHEETS_SCHEMAS]
+        assert SHEETS_SCHEMAS_BY_NAME["read_sheet"] is SHEETS_SCHEMAS[2]
+        with pytest.raises(TypeError):
+            SHEETS_SCHEMAS_BY_NAME["read_sheet"] = None
+
+    @pytest.mark.asyncio
+    async def test_coalesce_updates_merges_concurrent_tool_calls(self, mock_sheets_api):
+        from tool_master.tools.google import create_sheets_tools
+
+        class Credentials:
+            async def get_access_token(self):
+                return "token"
+
+        def handler(request):
+            if request.url.path.endswith(":batchUpdate"):
+                sent = json.loads(request.content)["requests"]
+                return httpx.Response(200, json={"replies": [{} for _ in sent]})
+            return httpx.Response(200, json={"sheets": [{"properties": {"title": "Data", "sheetId": 9}}]})
+
+        calls = mock_sheets_api(handler)
+        tools = {t.name: t for t in create_sheets_tools(Credentials(), coalesce_updates=True)}
+
+        results = await asyncio.gather(
+            tools["merge_cells"].execute(spreadsheet_id="ss", range="Data!A1:B1"),
+            tools["set_text_color"].execute(spreadsheet_id="ss", range="Data!A2", color="red"),
+        )
+
+        assert all(r.success and r.data["success"] for r in results)
+        posts = [c for c in calls if c.method == "POST"]
+        assert len(posts) == 1
+        assert len(json.loads(posts[0].content)["requests"]) == 2
+
+    def test_every_schema_has_an_implementation(self):
+        import importlib
+        import inspect
+        from tool_master.tools.google import SHEETS_SCHEMAS, sheets_tools
+
+        assert set(sheets_tools._IMPL_MODULES) == {s.name for s in SHEETS_SCHEMAS}
+        for name, module_name in sheets_tools._IMPL_MODULES.items():
+            module = importlib.import_module(f"tool_master.tools.google.{module_name}")
+            assert inspect.iscoroutinefunction(getattr(module, name))
+
+    @pytest.mark.asyncio
+    async def test_handlers_pass_token_and_range_notation(self, monkeypatch):
+        from tool_master.tools.google import create_sheets_tools
+
+        class Credentials:
+            async def get_access_token(self):
+                return "token"
+
+        seen = []
+
+        async def fake_read_sheet(access_token, spreadsheet_id, range_notation, value_render_option="FORMATTED_VALUE"):
+            seen.append((access_token, spreadsheet_id, range_notation))
+            return {"values": []}
+
+        async def fake_find_replace(access_token, spreadsheet_id, find, replacement, range_notation=None):
+            seen.append((access_token, spreadsheet_id, range_notation))
+            return {}
+
+        monkeypatch.setattr(sheets_core, "read_sheet", fake_read_sheet)
+        monkeypatch.setattr(sheets_advanced, "find_replace", fake_find_replace)
+        tools = {t.name: t for t in create_sheets_tools(Credentials())}
+
+        result = await tools["read_sheet"].execute(spreadsheet_id="ss", range="A1:B2")
+        assert result.success and result.data == {"values": []}
+        assert (await tools["find_replace"].execute(spreadsheet_id="ss", find="a", replacement="b")).success
+        assert seen == [("token", "ss", "A1:B2"), ("token", "ss", None)]
+        assert all(t._handler is not None for t in tools.values())
+        # Schemas are copied, never wired up themselves
+        from tool_master.tools.google import SHEETS_SCHEMAS_BY_NAME
+        assert SHEETS_SCHEMAS_BY_NAME["read_sheet"]._handler is None
+        assert tools["read_sheet"].parameters is not SHEETS_SCHEMAS_BY_NAME["read_sheet"].parameters
+
+
+class TestSimpleGoogleCredentials:
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_refresh(self, monkeypatch):
+        from tool_master.providers import SimpleGoogleCredentials
+
+        creds = SimpleGoogleCredentials("id", "secret", "refresh")
+        refreshes = []
+
+        async def fake_refresh():
+            refreshes.append(1)
+            await asyncio.sleep(0.01)
+            creds._access_token = f"token-{len(refreshes)}"
+            creds._token_expiry = datetime.now() + timedelta(hours=1)
+
+        monkeypatch.setattr(creds, "_refresh", fake_refresh)
+        tokens = await asyncio.gather(*[creds.get_access_token() for _ in range(5)])
+
+        assert tokens == ["token-1"] * 5
+        assert len(refreshes) == 1
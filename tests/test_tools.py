@@ -61,6 +61,69 @@ class TestTool:
         assert "required_param" in schema["required"]
         assert "optional_param" not in schema["required"]
 
+    def test_to_json_schema_is_cached(self, monkeypatch):
+        builds = []
+        build = Tool._build_json_schema
+
+        def counting_build(self):
+            builds.append(self.name)
+            return build(self)
+
+        monkeypatch.setattr(Tool, "_build_json_schema", counting_build)
+        tool = Tool(
+            name="test_tool",
+            description="A test tool",
+            parameters=[
+                ToolParameter(name="x", type=ParameterType.INTEGER, description="A number"),
+            ],
+        )
+
+        assert tool.to_json_schema() == tool.to_json_schema()
+        assert builds == ["test_tool"]
+        assert tool.model_copy(deep=True).to_json_schema() == tool.to_json_schema()
+
+    def test_to_json_schema_returns_a_copy(self):
+        tool = Tool(
+            name="test_tool",
+            description="A test tool",
+            parameters=[
+                ToolParameter(name="x", type=ParameterType.INTEGER, description="A number", enum=[1, 2]),
+            ],
+        )
+
+        schema = tool.to_json_schema()
+        schema["properties"]["x"]["type"] = "string"
+        schema["properties"]["x"]["enum"].append(3)
+        schema["required"].clear()
+
+        fresh = tool.to_json_schema()
+        assert fresh["properties"]["x"] == {"type": "integer", "description": "A number", "enum": [1, 2]}
+        assert fresh["required"] == ["x"]
+
+    def test_to_json_schema_follows_parameter_changes(self):
+        tool = Tool(
+            name="test_tool",
+            description="A test tool",
+            parameters=[
+                ToolParameter(name="x", type=ParameterType.INTEGER, description="A number"),
+            ],
+        )
+        tool.to_json_schema()
+
+        tool.parameters.append(ToolParameter(name="y", type=ParameterType.STRING, description="Text"))
+        assert list(tool.to_json_schema()["properties"]) == ["x", "y"]
+
+        tool.parameters = [ToolParameter(name="z", type=ParameterType.STRING, description="Text")]
+        assert list(tool.to_json_schema()["properties"]) == ["z"]
+
+        copied = tool.model_copy(update={"parameters": []})
+        assert copied.to_json_schema()["properties"] == {}
+
+    def test_parameters_are_frozen(self):
+        param = ToolParameter(name="x", type=ParameterType.INTEGER, description="A number")
+        with pytest.raises(ValueError):
+            param.required = False
+
     @pytest.mark.asyncio
     async def test_tool_execution(self):
         def handler(x: int, y: int) -> int: